@@ -0,0 +1,56 @@
+"""Synthetic LeapC data for the benchmarks
+
+The hands come from the simulator's hand model, but are written into CData from whichever
+ffi the leap package is using, so these work with the real leapc_cffi module too.
+"""
+
+import leap
+from leap.events import Event, TrackingEvent
+from leap.simulator import fill_hands
+
+
+def make_hands(t: float = 0.0, num_hands: int = 2):
+    """Create a LEAP_HAND[2] array filled with the simulated hands at time t"""
+    hands = leap.ffi.new("LEAP_HAND[2]")
+    count = fill_hands(hands, num_hands, t)
+    return hands, count
+
+
+def make_tracking_data(frame_id: int = 0, num_hands: int = 2):
+    """Create a LEAP_TRACKING_EVENT*, which keeps its hands alive through the returned tuple"""
+    hands, count = make_hands(frame_id / 120, num_hands)
+    data = leap.ffi.new("LEAP_TRACKING_EVENT*")
+    data.info.frame_id = frame_id
+    data.info.timestamp = frame_id * 8333
+    data.tracking_frame_id = frame_id
+    data.nHands = count
+    data.pHands = hands
+    data.framerate = 120.0
+    return data, hands
+
+
+def make_tracking_event(num_hands: int = 2) -> TrackingEvent:
+    data, hands = make_tracking_data(num_hands=num_hands)
+    return TrackingEvent(data)
+
+
+def make_connection_message(event_cls: Event):
+    """Create a LEAP_CONNECTION_MESSAGE* for an Event class
+
+    Returns the message and the CData it points to, which must be kept alive with it.
+    """
+    message = leap.ffi.new("LEAP_CONNECTION_MESSAGE*")
+    message.size = leap.ffi.sizeof(message[0])
+    message.type = event_cls._EVENT_TYPE.value
+
+    if event_cls is TrackingEvent:
+        data = make_tracking_data()
+    else:
+        fields = dict(leap.ffi.typeof(message[0]).fields)
+        ctype = fields[event_cls._EVENT_ATTRIBUTE].type
+        if ctype.item.kind == "void":
+            data = (leap.ffi.new("char[]", 64),)
+        else:
+            data = (leap.ffi.new(ctype),)
+    setattr(message, event_cls._EVENT_ATTRIBUTE, data[0])
+    return message, data
@@ -0,0 +1,142 @@
+"""Timing, reporting and result history for the benchmark suite"""
+
+import datetime
+import json
+import os
+import platform
+import subprocess
+import time
+from typing import Callable, Dict, List, Optional
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+_BENCHMARKS: Dict[str, Callable[[], "Result"]] = {}
+
+
+class Result:
+    """The per-operation latencies of a benchmark
+
+    :param latencies_ns: The latency of each operation, in nanoseconds.
+    :param total_ns: The total time taken, in nanoseconds. Defaults to the sum of latencies.
+    """
+
+    def __init__(self, latencies_ns: List[int], total_ns: Optional[int] = None):
+        self._latencies = sorted(latencies_ns)
+        self._total = total_ns if total_ns is not None else sum(latencies_ns)
+
+    def percentile(self, percent: float) -> float:
+        """Get the latency percentile, in microseconds"""
+        index = min(len(self._latencies) - 1, int(len(self._latencies) * percent / 100))
+        return self._latencies[index] / 1e3
+
+    @property
+    def fps(self) -> float:
+        """The number of operations per second"""
+        return len(self._latencies) / (self._total / 1e9)
+
+    def to_dict(self) -> dict:
+        return {
+            "iterations": len(self._latencies),
+            "fps": self.fps,
+            "p50_us": self.percentile(50),
+            "p99_us": self.percentile(99),
+        }
+
+
+def benchmark(name: str):
+    """Decorator which registers a function returning a Result as a benchmark"""
+
+    def register(func):
+        _BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def registered_benchmarks() -> Dict[str, Callable[[], Result]]:
+    return dict(_BENCHMARKS)
+
+
+def time_calls(func: Callable[[], object], iterations: int, warmup: int = 100) -> Result:
+    """Call the function repeatedly, timing every call"""
+    for _ in range(warmup):
+        func()
+    latencies = []
+    clock = time.perf_counter_ns
+    for _ in range(iterations):
+        start = clock()
+        func()
+        latencies.append(clock() - start)
+    return Result(latencies)
+
+
+def metadata(backend: str) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": backend,
+    }
+
+
+def save_results(results: dict, results_dir: str = RESULTS_DIR) -> str:
+    """Save the results as a new JSON file in the results directory. Returns the path."""
+    os.makedirs(results_dir, exist_ok=True)
+    meta = results["metadata"]
+    stamp = meta["timestamp"].replace(":", "").replace("-", "")[:15]
+    name = f"{stamp}-{meta['commit'] or 'unknown'}.json"
+    path = os.path.join(results_dir, name)
+    with open(path, "w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
+    return path
+
+
+def load_latest_results(backend: str, results_dir: str = RESULTS_DIR) -> Optional[dict]:
+    """Load the most recent saved results which were run against the same backend"""
+    if not os.path.isdir(results_dir):
+        return None
+    for name in sorted(os.listdir(results_dir), reverse=True):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(results_dir, name)) as fp:
+            results = json.load(fp)
+        if results["metadata"]["backend"] == backend:
+            return results
+    return None
+
+
+def report(results: dict, previous: Optional[dict], threshold: float) -> List[str]:
+    """Print the results, compared to the previous results if given
+
+    Returns the names of benchmarks whose p50 latency regressed by more than the threshold.
+    """
+    regressions = []
+    previous_benchmarks = previous["benchmarks"] if previous is not None else {}
+    print(f"{'benchmark':<36} {'fps':>12} {'p50 us':>10} {'p99 us':>10} {'p50 change':>11}")
+    for name, result in results["benchmarks"].items():
+        change = ""
+        if name in previous_benchmarks:
+            ratio = result["p50_us"] / previous_benchmarks[name]["p50_us"] - 1
+            change = f"{ratio:+.1%}"
+            if ratio > threshold:
+                regressions.append(name)
+                change += " !"
+        print(
+            f"{name:<36} {result['fps']:>12.0f} {result['p50_us']:>10.2f} "
+            f"{result['p99_us']:>10.2f} {change:>11}"
+        )
+    if previous is not None:
+        meta = previous["metadata"]
+        print(f"\nCompared against {meta['timestamp']} ({meta['commit']})")
+    return regressions
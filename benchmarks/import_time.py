@@ -0,0 +1,74 @@
+"""Measures how long `import leap` takes, using the interpreter's `-X importtime` output
+
+Each measurement runs a fresh interpreter. Two numbers are reported per statement: the
+total time spent importing the leap package, and that time excluding the LeapC backend
+(leapc_cffi, or the simulator which replaces it), which is what the package itself
+controls.
+
+    python benchmarks/import_time.py
+"""
+
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+_BACKEND_MODULES = ("leapc_cffi", "leap.simulator")
+
+STATEMENTS = {
+    "import leap": "import leap",
+    "import leap + get_server_status": "import leap; leap.get_server_status",
+    "import leap + Connection": "import leap; leap.Connection",
+}
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[int, str, int]]:
+    """Get the (depth, module name, cumulative microseconds) of each import"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((depth, name.strip(), int(cumulative)))
+    return imports
+
+
+def measure(statement: str, runs: int = 10) -> Tuple[List[int], List[int]]:
+    """Run the statement in a fresh interpreter 'runs' times
+
+    Returns the time spent importing the leap package and its submodules, including any
+    which are imported lazily by the statement, and that time excluding the LeapC backend.
+    Both are lists of microseconds.
+    """
+    totals, excluding_backend = [], []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imports = _parse_importtime(result.stderr)
+        total = sum(
+            cumulative
+            for depth, name, cumulative in imports
+            if depth == 0 and (name == "leap" or name.startswith("leap."))
+        )
+        backend = sum(cumulative for _, name, cumulative in imports if name in _BACKEND_MODULES)
+        totals.append(total)
+        excluding_backend.append(total - backend)
+    return totals, excluding_backend
+
+
+def main():
+    for name, statement in STATEMENTS.items():
+        totals, excluding_backend = measure(statement)
+        print(
+            f"{name:>32}: median {statistics.median(totals) / 1e3:7.2f} ms, "
+            f"{statistics.median(excluding_backend) / 1e3:7.2f} ms excluding the backend"
+        )
+
+
+if __name__ == "__main__":
+    main()
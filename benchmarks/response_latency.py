@@ -0,0 +1,82 @@
+"""Measures how long a request/response call, such as `Connection.get_tracking_mode`, takes
+to return after the poll thread has received the response event.
+
+A simulated poll source thread answers each request after a fixed service delay. The
+waiter registry used by `Connection._call_and_wait_for_event` is compared against the
+previous approach of sleeping until a `LatestEventListener` has seen the event.
+"""
+
+import statistics
+import threading
+import time
+from timeit import default_timer as timer
+
+import leap
+from leap.connection import _EventWaiter
+from leap.event_listener import LatestEventListener
+
+_SERVICE_DELAY = 0.0005
+
+
+class _Response:
+    type = leap.EventType.TrackingMode
+
+
+class SimulatedPollSource:
+    """Answers each request with a response event after a fixed delay, on its own thread"""
+
+    def __init__(self):
+        self._requests = []
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def request(self, on_response):
+        with self._condition:
+            self._requests.append(on_response)
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._requests:
+                    self._condition.wait()
+                on_response = self._requests.pop(0)
+            time.sleep(_SERVICE_DELAY)
+            on_response(_Response())
+
+
+def wait_with_sleep_polling(source: SimulatedPollSource):
+    listener = LatestEventListener(leap.EventType.TrackingMode)
+    source.request(listener.on_event)
+    while listener.event is None:
+        time.sleep(0.01)
+    return listener.event
+
+
+def wait_with_waiter(source: SimulatedPollSource):
+    waiter = _EventWaiter()
+    source.request(waiter.set)
+    waiter.wait(10)
+    return waiter.event
+
+
+def main():
+    source = SimulatedPollSource()
+    iterations = 200
+
+    for name, func in (("sleep polling", wait_with_sleep_polling), ("waiter", wait_with_waiter)):
+        latencies = []
+        for _ in range(iterations):
+            start = timer()
+            func(source)
+            latencies.append((timer() - start - _SERVICE_DELAY) * 1e3)
+        latencies.sort()
+        print(
+            f"{name:>14}: median {statistics.median(latencies):6.3f} ms, "
+            f"p99 {latencies[int(len(latencies) * 0.99) - 1]:6.3f} ms added latency"
+        )
+
+
+if __name__ == "__main__":
+    main()
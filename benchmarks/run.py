@@ -0,0 +1,272 @@
+"""Runs the benchmark suite for the leap package hot paths
+
+Each benchmark reports its throughput, and the p50 and p99 latency of a single operation.
+Results are saved as JSON in benchmarks/results/, and compared with the most recent saved
+results for the same backend, so that regressions between releases can be caught.
+
+Synthetic frames come from the simulator's hand model. Run with LEAPSDK_SIMULATOR=1 to
+benchmark without a tracking service; the poll loop benchmark needs the simulator.
+
+    LEAPSDK_SIMULATOR=1 python benchmarks/run.py
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import leap
+from leap.connection import Connection
+from leap.enums import EventType, PolicyFlag, get_enum_entries
+from leap.event_listener import Listener
+from leap.events import TrackingEvent, create_event, _EVENT_CLASSES
+
+from frames import make_connection_message, make_tracking_data, make_tracking_event
+from harness import (
+    Result,
+    benchmark,
+    load_latest_results,
+    metadata,
+    registered_benchmarks,
+    report,
+    save_results,
+    time_calls,
+)
+from import_time import measure as measure_import_time
+
+_ITERATIONS = 20000
+_FRAMES = 2000
+
+
+def _backend() -> str:
+    return "simulator" if sys.modules["leapc_cffi"] is leap.simulator else "leapc"
+
+
+def _create_event_benchmark(event_cls):
+    def run():
+        message, data = make_connection_message(event_cls)
+        return time_calls(lambda: create_event(message), _ITERATIONS)
+
+    return run
+
+
+for _event_cls in _EVENT_CLASSES.values():
+    benchmark(f"create_event[{_event_cls._EVENT_TYPE.name}]")(_create_event_benchmark(_event_cls))
+
+
+@benchmark("TrackingEvent construction")
+def tracking_event_construction():
+    data, hands = make_tracking_data()
+    return time_calls(lambda: TrackingEvent(data), _ITERATIONS)
+
+
+def _walk_skeleton(event: TrackingEvent):
+    for hand in event.hands:
+        hand.palm.position.x
+        for digit in hand.digits:
+            for bone in digit.bones:
+                bone.next_joint.x
+
+
+@benchmark("hand traversal")
+def hand_traversal():
+    """Walk the skeleton of the same two hands repeatedly, as several consumers of a frame do"""
+    event = make_tracking_event()
+    return time_calls(lambda: _walk_skeleton(event), _ITERATIONS // 10)
+
+
+@benchmark("hand traversal (first access)")
+def hand_traversal_first_access():
+    """Walk the skeleton of two hands once per frame"""
+    data, hands = make_tracking_data()
+    events = iter([TrackingEvent(data) for _ in range(_ITERATIONS // 10 + 100)])
+    return time_calls(lambda: _walk_skeleton(next(events)), _ITERATIONS // 10)
+
+
+@benchmark("FeatureExtractor.from_event")
+def feature_extraction():
+    from leap.features import FeatureExtractor
+
+    extractor = FeatureExtractor()
+    event = make_tracking_event()
+    return time_calls(lambda: extractor.from_event(event), _ITERATIONS)
+
+
+@benchmark("GestureEngine[16 gestures]")
+def gesture_engine():
+    """Feature extraction plus gesture evaluation, with no gestures changing state"""
+    from leap.features import FEATURE_NAMES
+    from leap.gestures import Gesture, GestureEngine, above
+
+    engine = GestureEngine(
+        [Gesture(name, [above(name, float("inf"))]) for name in FEATURE_NAMES[:16]]
+    )
+    event = make_tracking_event()
+    return time_calls(lambda: engine.on_tracking_event(event), _ITERATIONS)
+
+
+@benchmark("FilteredListener.filter_event")
+def filter_event():
+    """One-Euro filtering of every joint of two hands, including copying the event"""
+    from leap.filters import FilteredListener
+
+    listener = FilteredListener(Listener())
+    data, hands = make_tracking_data()
+    frame = iter(range(10**9))
+
+    def run():
+        data.info.timestamp = next(frame) * 8333
+        listener.filter_event(TrackingEvent(data))
+
+    return time_calls(run, _ITERATIONS)
+
+
+@benchmark("Recording.read_frame")
+def recording_read_frame():
+    fd, path = tempfile.mkstemp(suffix=".lct")
+    os.close(fd)
+    try:
+        with leap.Recording(path, "w") as recording:
+            for frame_id in range(_FRAMES):
+                data, hands = make_tracking_data(frame_id)
+                recording.write(TrackingEvent(data))
+
+        latencies = []
+        clock = time.perf_counter_ns
+        with leap.Recording(path, "r") as recording:
+            while True:
+                start = clock()
+                try:
+                    recording.read_frame()
+                except StopIteration:
+                    break
+                latencies.append(clock() - start)
+        return Result(latencies)
+    finally:
+        os.remove(path)
+
+
+@benchmark("get_enum_entries")
+def enum_entries():
+    flags = PolicyFlag.Images.value | PolicyFlag.MapPoints.value
+    return time_calls(lambda: get_enum_entries(PolicyFlag, flags), _ITERATIONS)
+
+
+class _TrackingListener(Listener):
+    def on_tracking_event(self, event):
+        pass
+
+
+def _dispatch_benchmark(num_listeners: int):
+    def run():
+        connection = Connection()
+        for _ in range(num_listeners):
+            connection.add_listener(_TrackingListener())
+        event = make_tracking_event()
+        return time_calls(lambda: connection._notify_listeners(event), _ITERATIONS)
+
+    return run
+
+
+for _num_listeners in (1, 4, 12):
+    benchmark(f"dispatch[{_num_listeners} listeners]")(_dispatch_benchmark(_num_listeners))
+
+
+class _ArrivalListener(Listener):
+    """Records the time at which each tracking event reaches the listener"""
+
+    def __init__(self, frames: int):
+        self.arrivals = []
+        self._frames = frames
+        self.done = threading.Event()
+
+    def on_tracking_event(self, event):
+        self.arrivals.append(time.perf_counter_ns())
+        if len(self.arrivals) == self._frames:
+            self.done.set()
+
+
+@benchmark("poll loop")
+def poll_loop():
+    """The time between tracking events arriving at a listener, with the simulator unthrottled"""
+    if _backend() != "simulator":
+        return None
+
+    lib = leap.simulator.libleapc
+    framerate, lib.framerate = lib.framerate, 0
+    listener = _ArrivalListener(_FRAMES + 1)
+    connection = Connection()
+    connection.add_listener(listener)
+    try:
+        with connection.open():
+            start = time.perf_counter_ns()
+            listener.done.wait(60)
+            total = time.perf_counter_ns() - start
+    finally:
+        lib.framerate = framerate
+    arrivals = listener.arrivals
+    latencies = [end - begin for begin, end in zip(arrivals, arrivals[1:])]
+    return Result(latencies, total)
+
+
+def _interpolator_benchmark(copy: bool):
+    def run():
+        if _backend() != "simulator":
+            return None
+        interpolator = Connection().interpolator()
+        return time_calls(lambda: interpolator.predict(copy=copy), _ITERATIONS // 10)
+
+    return run
+
+
+# Predicting the hands at the current time, copied into a new event or viewing the
+# interpolator's frame buffer
+benchmark("Interpolator.predict")(_interpolator_benchmark(copy=True))
+benchmark("Interpolator.predict[view]")(_interpolator_benchmark(copy=False))
+
+
+@benchmark("import leap")
+def import_leap():
+    """The time to import the leap package in a fresh interpreter, excluding the backend"""
+    _, excluding_backend = measure_import_time("import leap", runs=20)
+    return Result([microseconds * 1000 for microseconds in excluding_backend])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", help="Only run benchmarks whose name contains this")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="The p50 slowdown reported as a regression. Defaults to 0.1 (10%%).",
+    )
+    parser.add_argument("--no-save", action="store_true", help="Do not save the results")
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with a non-zero status if any benchmark regressed",
+    )
+    args = parser.parse_args()
+
+    backend = _backend()
+    previous = load_latest_results(backend)
+    results = {"metadata": metadata(backend), "benchmarks": {}}
+    for name, func in registered_benchmarks().items():
+        if args.filter and args.filter not in name:
+            continue
+        result = func()
+        if result is not None:
+            results["benchmarks"][name] = result.to_dict()
+
+    regressions = report(results, previous, args.threshold)
+    if not args.no_save:
+        print(f"Saved results to {save_results(results)}")
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compares reading hand data through the wrapper properties of a TrackingEvent against
+reading it through the NumPy view returned by `TrackingEvent.as_numpy`.
+
+Both paths read the palm position and all five fingertip positions of every hand. The
+frames are synthetic, so this only needs the leapc_cffi module and not a running server.
+"""
+
+import timeit
+
+from leap.arrays import fingertip_positions, palm_positions
+from leap.events import TrackingEvent
+
+from frames import make_tracking_event
+
+
+def read_with_properties(event: TrackingEvent):
+    result = []
+    for hand in event.hands:
+        palm = hand.palm.position
+        result.append((palm.x, palm.y, palm.z))
+        for digit in hand.digits:
+            tip = digit.distal.next_joint
+            result.append((tip.x, tip.y, tip.z))
+    return result
+
+
+def read_with_numpy(event: TrackingEvent):
+    hands = event.as_numpy()
+    return palm_positions(hands), fingertip_positions(hands)
+
+
+def main():
+    event = make_tracking_event()
+    number = 20000
+
+    for name, func in (("properties", read_with_properties), ("numpy", read_with_numpy)):
+        seconds = min(timeit.repeat(lambda: func(event), number=number, repeat=5))
+        print(f"{name:>12}: {seconds / number * 1e6:8.2f} us per frame")
+
+
+if __name__ == "__main__":
+    main()
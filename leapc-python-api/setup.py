@@ -16,4 +16,5 @@ setuptools.setup(
     package_dir={"": "src"},
     packages=setuptools.find_packages(where="src"),
     python_requires=">=3.8",
+    extras_require={"numpy": ["numpy"]},
 )
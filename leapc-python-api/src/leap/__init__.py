@@ -1,10 +1,8 @@
 """ Leap Package """
-import fnmatch
-
 # Set up some functions we want to be available at the top level
 
+import importlib
 import sys
-import platform
 import os
 
 _OS_DEFAULT_CFFI_INSTALL_LOCATION = {
@@ -30,13 +28,22 @@ _OS_CFFI_SHARED_OBJECT_PATTERN = {
 
 
 def get_system():
-    if platform.system() == "Linux" and platform.machine() == "aarch64":
-        return "Linux-ARM"
-    else:
-        return platform.system()
+    # Avoid importing `platform` where possible, as it is slow to import
+    if sys.platform.startswith("linux"):
+        return "Linux-ARM" if os.uname().machine == "aarch64" else "Linux"
+    if sys.platform == "win32":
+        return "Windows"
+    if sys.platform == "darwin":
+        return "Darwin"
+
+    import platform
+
+    return platform.system()
 
 
 def check_required_files(cffi_dir):
+    import fnmatch
+
     directory_files = [
         f for f in os.listdir(cffi_dir) if os.path.isfile(os.path.join(cffi_dir, f))
     ]
@@ -57,15 +64,20 @@ def check_required_files(cffi_dir):
 
 
 _OVERRIDE_LEAPSDK_LOCATION = os.getenv("LEAPSDK_INSTALL_LOCATION")
+_USE_SIMULATOR = os.getenv("LEAPSDK_SIMULATOR", "0") not in ("", "0")
 
 cffi_location = _OS_DEFAULT_CFFI_INSTALL_LOCATION[get_system()]
 if _OVERRIDE_LEAPSDK_LOCATION is not None:
     cffi_location = _OVERRIDE_LEAPSDK_LOCATION
 
 cffi_path = os.path.join(cffi_location, "leapc_cffi")
-if os.path.isdir(cffi_path):
-    ret = check_required_files(cffi_path)
+if _USE_SIMULATOR:
+    # Use the pure-Python simulator in place of leapc_cffi, for all modules in this package
+    from . import simulator
 
+    sys.modules["leapc_cffi"] = simulator
+    from leapc_cffi import ffi, libleapc
+elif os.path.isdir(cffi_path):
     # TODO: If we can't find leapc_cffi, we could try building it
 
     sys.path.append(cffi_location)
@@ -73,7 +85,8 @@ if os.path.isdir(cffi_path):
     try:
         from leapc_cffi import ffi, libleapc
     except ImportError as import_error:
-        if not ret:
+        # Only check the SDK directory when the import fails, to explain why
+        if not check_required_files(cffi_path):
             error_msg = f"Missing required files within {cffi_location}."
         else:
             error_msg = f"Unknown error, please consult readme for help. Attempting to find leapc_cffi within {cffi_location}"
@@ -84,15 +97,76 @@ else:
     error_msg = f"Error: Unable to find leapc_cffi dir within directory {cffi_location}"
     raise Exception(error_msg)
 
-from .functions import (
-    get_now,
-    get_server_status,
-    get_frame_size,
-    interpolate_frame,
-    get_extrinsic_matrix,
-)
-from .connection import Connection
-from .enums import EventType, TrackingMode, HandType
-from .event_listener import Listener
-from .exceptions import LeapError
-from .recording import Recording, Recorder
+# The public names of the package, and the submodules they are imported from. Submodules
+# are only imported when one of their names is first used, so that `import leap` stays fast.
+_LAZY_ATTRIBUTES = {
+    "get_now": "functions",
+    "get_server_status": "functions",
+    "get_frame_size": "functions",
+    "interpolate_frame": "functions",
+    "get_extrinsic_matrix": "functions",
+    "Connection": "connection",
+    "OverflowPolicy": "dispatch",
+    "AsyncConnection": "async_connection",
+    "EventType": "enums",
+    "TrackingMode": "enums",
+    "HandType": "enums",
+    "Listener": "event_listener",
+    "LeapError": "exceptions",
+    "Recording": "recording",
+    "Recorder": "recording",
+    "FrameLog": "framelog",
+    "FrameLogWriter": "framelog",
+}
+
+_SUBMODULES = {
+    "arrays",
+    "async_connection",
+    "connection",
+    "cstruct",
+    "datatypes",
+    "device",
+    "dispatch",
+    "enums",
+    "event_listener",
+    "events",
+    "exceptions",
+    "features",
+    "filters",
+    "framelog",
+    "functions",
+    "gestures",
+    "interpolation",
+    "history",
+    "math",
+    "pool",
+    "recording",
+    "simulator",
+    "tracker",
+}
+
+
+# `from leap import *` imports the same names as when they were imported eagerly. The lazy
+# names are resolved through __getattr__, which imports their submodules.
+__all__ = [
+    "ffi",
+    "libleapc",
+    "get_system",
+    "check_required_files",
+    *_LAZY_ATTRIBUTES,
+]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _SUBMODULES)
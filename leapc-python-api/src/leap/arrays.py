@@ -0,0 +1,136 @@
+"""NumPy views of LeapC hand data
+
+The arrays returned here are views over the C memory owned by the wrapper objects, so
+reading them does not create any of the per-field wrappers from `datatypes`. Writing
+to them writes to the underlying C data.
+
+The dtypes are generated from the cffi struct definitions, so field names and offsets
+always match the LeapC header the bindings were built against. Eg. the palm positions
+of all hands in a frame are `hands["palm"]["position"]["v"]`.
+
+NumPy is an optional dependency, only required by this module.
+"""
+
+import numpy as np
+
+from leapc_cffi import ffi
+
+
+def _dtype_from_ctype(ctype) -> np.dtype:
+    """Create a NumPy dtype with the same memory layout as the cffi type
+
+    Anonymous unions are flattened by cffi, so their members become overlapping
+    fields in the dtype (eg. a LEAP_VECTOR has both 'v' and 'x', 'y', 'z').
+    """
+    size = ffi.sizeof(ctype)
+    if ctype.kind in ("struct", "union"):
+        names, formats, offsets = [], [], []
+        for name, field in ctype.fields:
+            names.append(name)
+            formats.append(_dtype_from_ctype(field.type))
+            offsets.append(field.offset)
+        return np.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": size})
+    if ctype.kind == "array":
+        return np.dtype((_dtype_from_ctype(ctype.item), ctype.length))
+    if ctype.kind == "pointer":
+        return np.dtype(np.uintp)
+    if ctype.kind == "enum":
+        return np.dtype(f"i{size}")
+    if ctype.kind == "primitive":
+        if ctype.cname in ("float", "double"):
+            return np.dtype(f"f{size}")
+        if ctype.cname.startswith("u") or ctype.cname.startswith("unsigned"):
+            return np.dtype(f"u{size}")
+        return np.dtype(f"i{size}")
+    raise TypeError(f"Cannot create a dtype for {ctype.cname}")
+
+
+HAND_DTYPE = _dtype_from_ctype(ffi.typeof("LEAP_HAND"))
+
+
+def hands_array(hands: ffi.CData, count: int) -> np.ndarray:
+    """Get a structured array viewing the first 'count' hands of a LEAP_HAND array
+
+    The array keeps the C data alive, and has the field names of the LEAP_HAND struct.
+
+    :param hands: CData for a LEAP_HAND[] array, or a LEAP_HAND* pointer.
+    :param count: The number of hands to view.
+    """
+    buffer = ffi.buffer(hands, HAND_DTYPE.itemsize * count)
+    return np.frombuffer(buffer, dtype=HAND_DTYPE, count=count)
+
+
+def palm_positions(hands: np.ndarray) -> np.ndarray:
+    """Get a (hands, 3) float32 view of the palm positions"""
+    return hands["palm"]["position"]["v"]
+
+
+def palm_velocities(hands: np.ndarray) -> np.ndarray:
+    """Get a (hands, 3) float32 view of the palm velocities"""
+    return hands["palm"]["velocity"]["v"]
+
+
+def fingertip_positions(hands: np.ndarray) -> np.ndarray:
+    """Get a (hands, 5, 3) float32 view of the fingertips, ordered thumb to pinky"""
+    return hands["digits"]["distal"]["next_joint"]["v"]
+
+
+def joint_positions(hands: np.ndarray) -> np.ndarray:
+    """Get a (hands, 5, 5, 3) float32 array of all joints in each digit
+
+    Joints are ordered from the base of the metacarpal to the fingertip. Unlike the
+    other functions this returns a copy, since the joints are not evenly spaced in memory.
+    """
+    bones = hands["digits"]["bones"]
+    return np.concatenate(
+        (bones[:, :, :1]["prev_joint"]["v"], bones["next_joint"]["v"]),
+        axis=2,
+    )
+
+
+def arm_joints(hands: np.ndarray) -> np.ndarray:
+    """Get a (hands, 2, 3) float32 array of the elbow and wrist positions"""
+    arm = hands["arm"]
+    return np.stack((arm["prev_joint"]["v"], arm["next_joint"]["v"]), axis=1)
+
+
+TRACKING_EVENT_DTYPE = _dtype_from_ctype(ffi.typeof("LEAP_TRACKING_EVENT"))
+
+
+def tracking_columns(events: np.ndarray, hands: np.ndarray) -> dict:
+    """Extract columns from a block of tracking events
+
+    Returns a dict of arrays with one row per frame:
+        'timestamp', 'frame_id', 'tracking_frame_id': (frames,) int64
+        'framerate': (frames,) float32
+        'num_hands': (frames,) uint32
+        'hand_id': (frames, 2) uint32
+        'hand_type': (frames, 2) int32
+        'confidence', 'pinch_strength', 'grab_strength': (frames, 2) float32
+        'palm_position', 'palm_velocity', 'palm_normal': (frames, 2, 3) float32
+        'extended': (frames, 2, 5) bool, whether each digit is extended
+        'joints': (frames, 2, 5, 5, 3) float32, as returned by `joint_positions`
+
+    Hand columns are zero where a frame has fewer than two hands.
+
+    :param events: A (frames,) array of TRACKING_EVENT_DTYPE.
+    :param hands: A (frames, 2) array of HAND_DTYPE.
+    """
+    frames = len(events)
+    return {
+        "timestamp": events["info"]["timestamp"].astype(np.int64),
+        "frame_id": events["info"]["frame_id"].astype(np.int64),
+        "tracking_frame_id": events["tracking_frame_id"].astype(np.int64),
+        "framerate": events["framerate"].copy(),
+        "num_hands": events["nHands"].copy(),
+        "hand_id": hands["id"].copy(),
+        "hand_type": hands["type"].copy(),
+        "confidence": hands["confidence"].copy(),
+        "pinch_strength": hands["pinch_strength"].copy(),
+        "grab_strength": hands["grab_strength"].copy(),
+        "palm_position": palm_positions(hands).copy(),
+        "palm_velocity": palm_velocities(hands).copy(),
+        "palm_normal": hands["palm"]["normal"]["v"].copy(),
+        "extended": hands["digits"]["is_extended"].astype(bool),
+        "joints": joint_positions(hands.reshape(-1)).reshape(frames, 2, 5, 5, 3),
+    }
@@ -0,0 +1,249 @@
+"""An asyncio interface to a Connection"""
+
+import asyncio
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set
+
+from leapc_cffi import libleapc
+
+from .connection import Connection
+from .enums import EventType, PolicyFlag, TrackingMode
+from .event_listener import Listener
+from .events import Event
+from .exceptions import LeapConnectionAlreadyOpen, LeapTimeoutError, success_or_raise
+
+
+class _LoopListener(Listener):
+    """Passes events from the thread it is called on to an asyncio event loop
+
+    Only the event types returned by 'event_types' are routed to it, so that events nothing
+    consumes are not created or passed to the loop.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        callback,
+        event_types: Callable[[], Set[EventType]],
+    ):
+        self._loop = loop
+        self._callback = callback
+        self._event_types = event_types
+
+    def event_handlers(self) -> Dict[EventType, Callable[[Event], None]]:
+        return {event_type: self.on_event for event_type in self._event_types()}
+
+    def on_event(self, event: Event):
+        # Events own copies of their data (see Event.from_connection_message), so they stay
+        # valid on the event loop after the poll thread has polled the next message
+        try:
+            self._loop.call_soon_threadsafe(self._callback, event)
+        except RuntimeError:
+            # The event loop has been closed
+            pass
+
+
+class AsyncConnection:
+    """An asyncio interface to a Connection
+
+    Events are still polled on the Connection's poll thread, and are passed to the event
+    loop with `loop.call_soon_threadsafe`. Any number of coroutines can consume them
+    through `events`, and calls which wait for a response event can be awaited.
+
+    Example:
+    ```
+    async with AsyncConnection() as connection:
+        async for event in connection.events(EventType.Tracking):
+            print(event.tracking_frame_id)
+    ```
+
+    :param connection: The Connection to use. Defaults to None, in which case a Connection
+        is created with the remaining keyword arguments.
+    """
+
+    def __init__(self, connection: Optional[Connection] = None, **kwargs):
+        if connection is None:
+            connection = Connection(**kwargs)
+        self._connection = connection
+        self._listener = None
+        self._waiters: Dict[EventType, List[asyncio.Future]] = {}
+        self._queues: Dict[asyncio.Queue, Optional[EventType]] = {}
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
+
+    @property
+    def connection(self) -> Connection:
+        """The underlying Connection, for calls which do not wait for an event"""
+        return self._connection
+
+    async def connect(self, *, timeout: float = 10):
+        """Open the connection and start polling it
+
+        :param timeout: A timeout for initial connection in seconds. Defaults to 10s.
+        """
+        if self._listener is not None:
+            raise LeapConnectionAlreadyOpen
+
+        self._listener = _LoopListener(
+            asyncio.get_running_loop(), self._on_event, self._consumed_types
+        )
+        self._connection.add_listener(self._listener)
+        waiter = self._add_waiter(EventType.Connection)
+        try:
+            self._connection.connect(auto_poll=False)
+            self._connection.start_polling()
+            await self._wait(EventType.Connection, waiter, timeout)
+        except Exception:
+            await self.disconnect()
+            raise
+
+    async def disconnect(self):
+        """Stop polling and close the connection"""
+        # Stopping the poll thread can block for up to the poll timeout, so it is done
+        # off the event loop.
+        await asyncio.get_running_loop().run_in_executor(None, self._connection.disconnect)
+        if self._listener is not None:
+            self._connection.remove_listener(self._listener)
+            self._listener = None
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                waiter.cancel()
+        self._waiters.clear()
+
+    async def events(
+        self, event_type: Optional[EventType] = None, *, max_size: int = 64
+    ) -> AsyncIterator[Event]:
+        """Iterate over events as they are received
+
+        Each iterator has its own queue. If the consumer falls behind and the queue is
+        full, the oldest queued event is dropped.
+
+        :param event_type: Only yield events of this type. Defaults to None, which yields
+            every event.
+        :param max_size: The size of the queue for this iterator. Defaults to 64.
+        """
+        queue = asyncio.Queue(max_size)
+        self._queues[queue] = event_type
+        self._update_routes()
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            del self._queues[queue]
+            self._update_routes()
+
+    async def wait_for(self, event_type: EventType, *, timeout: Optional[float] = None) -> Event:
+        """Wait until the specified event type is emitted
+
+        Returns the next event of the requested type.
+        """
+        return await self._wait(event_type, self._add_waiter(event_type), timeout)
+
+    def set_tracking_mode(self, mode: TrackingMode):
+        """Set the Server tracking mode"""
+        self._connection.set_tracking_mode(mode)
+
+    async def get_tracking_mode(self, *, timeout: Optional[float] = None) -> TrackingMode:
+        """Get the Server tracking mode"""
+        args = (libleapc.LeapGetTrackingMode, self._connection.get_connection_ptr())
+        event = await self._call_and_wait(EventType.TrackingMode, args, timeout)
+        return event.current_tracking_mode
+
+    async def set_policy_flags(
+        self,
+        flags_to_set: Optional[List[PolicyFlag]] = None,
+        flags_to_clear: Optional[List[PolicyFlag]] = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> List[PolicyFlag]:
+        """Set the policy flags
+
+        Returns a list of current policy flags.
+
+        :param flags_to_set: A list of PolicyFlags to set. Defaults to None.
+        :param flags_to_clear: A list of PolicyFlags to clear. Defaults to None.
+        """
+        args = (
+            libleapc.LeapSetPolicyFlags,
+            self._connection.get_connection_ptr(),
+            Connection._combine_flags(flags_to_set),
+            Connection._combine_flags(flags_to_clear),
+        )
+        event = await self._call_and_wait(EventType.Policy, args, timeout)
+        return event.current_policy_flags
+
+    async def get_policy_flags(self, *, timeout: Optional[float] = None) -> List[PolicyFlag]:
+        """Get the current policy flags"""
+        return await self.set_policy_flags(timeout=timeout)
+
+    async def _call_and_wait(
+        self, event_type: EventType, args: tuple, timeout: Optional[float]
+    ) -> Event:
+        # The waiter is added before the call, and can only be resolved once this
+        # coroutine yields, so the response cannot be missed.
+        waiter = self._add_waiter(event_type)
+        try:
+            success_or_raise(*args)
+        except Exception:
+            self._remove_waiter(event_type, waiter)
+            raise
+        return await self._wait(event_type, waiter, timeout)
+
+    def _consumed_types(self) -> Set[EventType]:
+        """The event types which a waiter or an `events` iterator is waiting for"""
+        event_types = set(self._waiters)
+        for event_type in self._queues.values():
+            if event_type is None:
+                return set(EventType)
+            event_types.add(event_type)
+        return event_types
+
+    def _update_routes(self):
+        # Called on the event loop whenever the consumed event types may have changed
+        if self._listener is not None:
+            self._connection.update_listener(self._listener)
+
+    def _add_waiter(self, event_type: EventType) -> asyncio.Future:
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(event_type, []).append(waiter)
+        self._update_routes()
+        return waiter
+
+    def _remove_waiter(self, event_type: EventType, waiter: asyncio.Future):
+        waiters = self._waiters.get(event_type, [])
+        if waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._waiters[event_type]
+                self._update_routes()
+
+    async def _wait(
+        self, event_type: EventType, waiter: asyncio.Future, timeout: Optional[float]
+    ) -> Event:
+        if timeout is None:
+            timeout = self._connection._response_timeout
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            raise LeapTimeoutError("Did not received expected event in time")
+        finally:
+            self._remove_waiter(event_type, waiter)
+
+    def _on_event(self, event: Event):
+        # Called on the event loop for every event
+        waiters = self._waiters.pop(event.type, None)
+        if waiters is not None:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(event)
+            self._update_routes()
+
+        for queue, event_type in self._queues.items():
+            if event_type is None or event_type == event.type:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(event)
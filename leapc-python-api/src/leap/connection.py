@@ -1,14 +1,14 @@
 from contextlib import contextmanager
 import sys
 import threading
-from typing import Dict, Optional, List, Callable
+from typing import Dict, Optional, List, Callable, TYPE_CHECKING
 from timeit import default_timer as timer
-import time
 import json
 
 from leapc_cffi import ffi, libleapc
 
 from .device import Device
+from .dispatch import EventDispatcher, OverflowPolicy
 from .enums import (
     ConnectionStatus,
     EventType,
@@ -17,7 +17,7 @@ from .enums import (
     TrackingMode,
     PolicyFlag,
 )
-from .event_listener import LatestEventListener, Listener
+from .event_listener import Listener
 from .events import create_event, Event
 from .exceptions import (
     create_exception,
@@ -28,6 +28,27 @@ from .exceptions import (
     LeapNotConnectedError,
     LeapTimeoutError,
 )
+from .pool import HandBufferPool
+
+if TYPE_CHECKING:
+    from .interpolation import Interpolator
+
+_TRACKING_EVENT_TYPE = EventType.Tracking.value
+
+
+class _EventWaiter:
+    """Blocks a thread until the poll thread receives an event of the requested type"""
+
+    def __init__(self):
+        self._received = threading.Event()
+        self.event: Optional[Event] = None
+
+    def set(self, event: Event):
+        self.event = event
+        self._received.set()
+
+    def wait(self, timeout: float) -> bool:
+        return self._received.wait(timeout)
 
 
 class ConnectionConfig:
@@ -58,6 +79,15 @@ class Connection:
     :param poll_timeout: A timeout of poll messages, in seconds. Defaults to 1 second.
     :param response_timeout: A timeout to wait for specific events in response to events.
         Defaults to 10 seconds.
+    :param hand_buffer_pool_size: If set, the Connection preallocates this many buffers for
+        the hands of TrackingEvents, which events borrow instead of allocating their own.
+        Events return their buffer when released or garbage collected. Defaults to None.
+    :param dispatch_queue_size: If set, events are delivered to listeners from separate
+        dispatcher threads, through a queue of this size, instead of from the poll thread.
+        Defaults to None.
+    :param dispatch_threads: The number of dispatcher threads. Defaults to 1.
+    :param dispatch_overflow_policy: What to do with new events when the dispatch queue is
+        full. Defaults to OverflowPolicy.CoalesceTracking.
     """
 
     def __init__(
@@ -68,11 +98,21 @@ class Connection:
         listeners: Optional[List[Listener]] = None,
         poll_timeout: float = 1,
         response_timeout: float = 10,
+        hand_buffer_pool_size: Optional[int] = None,
+        dispatch_queue_size: Optional[int] = None,
+        dispatch_threads: int = 1,
+        dispatch_overflow_policy: OverflowPolicy = OverflowPolicy.CoalesceTracking,
     ):
         if listeners is None:
             listeners = []
         self._listeners = listeners
 
+        self._waiters: Dict[EventType, List[_EventWaiter]] = {}
+        # Guards the listeners, their routes and the waiters
+        self._waiters_lock = threading.Lock()
+        with self._waiters_lock:
+            self._update_routes()
+
         self._connection_ptr = self._create_connection(server_namespace, multi_device_aware)
 
         self._poll_timeout = int(poll_timeout * 1000)  # Seconds to milliseconds
@@ -82,6 +122,19 @@ class Connection:
         self._is_open = False
         self._poll_thread = None
 
+        self._hand_pool = None
+        if hand_buffer_pool_size is not None:
+            self._hand_pool = HandBufferPool(hand_buffer_pool_size)
+
+        self._dispatcher = None
+        if dispatch_queue_size is not None:
+            self._dispatcher = EventDispatcher(
+                self._notify_listeners,
+                max_size=dispatch_queue_size,
+                num_threads=dispatch_threads,
+                overflow_policy=dispatch_overflow_policy,
+            )
+
     def __del__(self):
         # Since 'destroy_connection' only tells C to free the memory that it allocated
         # for our connection, it is appropriate to leave the deletion of this to the garbage
@@ -92,10 +145,25 @@ class Connection:
             self._destroy_connection(self._connection_ptr)
 
     def add_listener(self, listener: Listener):
-        self._listeners.append(listener)
+        with self._waiters_lock:
+            self._listeners.append(listener)
+            self._update_routes()
 
     def remove_listener(self, listener: Listener):
-        self._listeners.remove(listener)
+        with self._waiters_lock:
+            self._listeners.remove(listener)
+            self._update_routes()
+
+    def update_listener(self, listener: Listener):
+        """Route events to a listener again, after the event types it handles have changed
+
+        The handlers of a listener are read when it is added, so a listener whose
+        `event_handlers` change must be updated with this.
+        """
+        with self._waiters_lock:
+            if listener not in self._listeners:
+                raise ValueError("The listener has not been added to this Connection")
+            self._update_routes()
 
     def poll(self, timeout: Optional[float] = None) -> Event:
         """Manually poll the connection from this thread
@@ -113,7 +181,7 @@ class Connection:
             timeout = int(timeout * 1000)  # Seconds to milliseconds
         event_ptr = ffi.new("LEAP_CONNECTION_MESSAGE*")
         success_or_raise(libleapc.LeapPollConnection, self._connection_ptr[0], timeout, event_ptr)
-        return create_event(event_ptr)
+        return create_event(event_ptr, hand_pool=self._hand_pool)
 
     def poll_until(
         self,
@@ -213,15 +281,8 @@ class Connection:
         :param flags_to_set: A list of PolicyFlags to set. Defaults to None.
         :param flags_to_clear: A list of PolicyFlags to clear. Defaults to None.
         """
-        to_set = 0
-        if flags_to_set is not None:
-            for flag in flags_to_set:
-                to_set |= flag.value
-
-        to_clear = 0
-        if flags_to_clear is not None:
-            for flag in flags_to_clear:
-                to_clear |= flag.value
+        to_set = self._combine_flags(flags_to_set)
+        to_clear = self._combine_flags(flags_to_clear)
 
         func = success_or_raise
         args = (libleapc.LeapSetPolicyFlags, self._connection_ptr[0], to_set, to_clear)
@@ -265,6 +326,34 @@ class Connection:
             unsubscribe_others,
         )
 
+    @property
+    def hand_buffer_pool(self) -> Optional[HandBufferPool]:
+        """The pool of hand buffers, if the Connection was created with one"""
+        return self._hand_pool
+
+    @property
+    def dispatcher(self) -> Optional[EventDispatcher]:
+        """The event dispatcher, if the Connection was created with a dispatch queue
+
+        This exposes the queue depth and number of dropped events.
+        """
+        return self._dispatcher
+
+    def interpolator(self, *, latency_offset: Optional[float] = None) -> "Interpolator":
+        """Create an Interpolator for this connection, which predicts the hands at any time
+
+        The Interpolator is added as a listener, so that it can estimate the latency of
+        tracking frames.
+
+        :param latency_offset: How far after the current time to predict by default, in
+            seconds. Defaults to None, which uses the estimated latency.
+        """
+        from .interpolation import Interpolator
+
+        interpolator = Interpolator(self, latency_offset=latency_offset)
+        self.add_listener(interpolator)
+        return interpolator
+
     def get_connection_ptr(self) -> ffi.CData:
         return self._connection_ptr[0]
 
@@ -288,6 +377,14 @@ class Connection:
             device.c_data_device,
         )
 
+    @staticmethod
+    def _combine_flags(flags: Optional[List[PolicyFlag]]) -> int:
+        combined = 0
+        if flags is not None:
+            for flag in flags:
+                combined |= flag.value
+        return combined
+
     @staticmethod
     def _create_connection(
         server_namespace: Optional[Dict] = None, multi_device_aware: bool = False
@@ -324,21 +421,37 @@ class Connection:
         self._is_open = False
 
     def _start_poll_thread(self, startup_timeout: float):
-        self._poll_thread = threading.Thread(target=self._poll_loop)
         try:
             self._call_and_wait_for_event(
-                EventType.Connection, self._poll_thread.start, timeout=startup_timeout
+                EventType.Connection, self.start_polling, timeout=startup_timeout
             )
         except LeapTimeoutError as exc:
             self._stop_poll_thread()
             raise exc
 
+    def start_polling(self):
+        """Start the thread which polls the connection, without waiting for it to connect
+
+        For connections opened with `auto_poll=False`, eg. to wait for the Connection event
+        some other way.
+        """
+        if not self._is_open:
+            raise LeapNotConnectedError
+        if self._poll_thread is not None:
+            raise LeapConcurrentPollError
+        if self._dispatcher is not None:
+            self._dispatcher.start()
+        self._poll_thread = threading.Thread(target=self._poll_loop)
+        self._poll_thread.start()
+
     def _stop_poll_thread(self):
         if self._poll_thread is not None:
             self._stop_poll_flag = True
             self._poll_thread.join()
             self._stop_poll_flag = False
             self._poll_thread = None
+        if self._dispatcher is not None:
+            self._dispatcher.stop()
 
     def _poll_loop(self):
         event_ptr = ffi.new("LEAP_CONNECTION_MESSAGE*")
@@ -352,17 +465,86 @@ class Connection:
                     self._poll_timeout,
                     event_ptr,
                 )
-                event = create_event(event_ptr)
-                for listener in self._listeners:
-                    try:
-                        listener.on_event(event)
-                    except Exception as exc:
-                        msg = f"Caught exception in listener callback: {type(exc)}, {exc}, {exc.__traceback__}"
-                        print(msg, file=sys.stderr)
+                if event_ptr.type not in self._subscribed_types:
+                    # Nothing will consume this event, so skip creating it
+                    continue
+                event = create_event(event_ptr, hand_pool=self._hand_pool)
+                self._notify_waiters(event)
+                if self._dispatcher is not None:
+                    if event_ptr.type == _TRACKING_EVENT_TYPE:
+                        # Listeners which measure latency must not include the time queued
+                        event._poll_time = libleapc.LeapGetNow()
+                    self._dispatcher.put(event)
+                else:
+                    self._notify_listeners(event)
             except LeapError as exc:
                 for listener in self._listeners:
                     listener.on_error(exc)
 
+    def _update_routes(self):
+        # Build a new table rather than modifying the current one, so that the poll thread
+        # always sees a complete table. Must be called while holding the waiters lock, so
+        # that the table swapped in is built from the latest listeners.
+        routes: Dict[EventType, List[Callable[[Event], None]]] = {}
+        for listener in self._listeners:
+            for event_type, handler in self._listener_handlers(listener).items():
+                routes.setdefault(event_type, []).append(handler)
+        self._routes = routes
+        self._update_subscribed_types()
+
+    @staticmethod
+    def _listener_handlers(listener) -> Dict[EventType, Callable[[Event], None]]:
+        # Listeners which do not subclass Listener may only have an `on_event` method,
+        # which handles every event type
+        event_handlers = getattr(listener, "event_handlers", None)
+        if event_handlers is not None:
+            return event_handlers()
+        on_event = getattr(listener, "on_event")
+        return {event_type: on_event for event_type in EventType}
+
+    def _update_subscribed_types(self):
+        # The raw LeapC values of every event type which a listener or waiter will consume,
+        # so that the poll loop can check them before creating an Event.
+        # Must be called while holding the waiters lock.
+        self._subscribed_types = frozenset(
+            event_type.value for event_type in (*self._routes, *self._waiters)
+        )
+
+    def _notify_listeners(self, event: Event):
+        # Only call the listeners which handle this type of event
+        for handler in self._routes.get(event.type, ()):
+            try:
+                handler(event)
+            except Exception as exc:
+                msg = f"Caught exception in listener callback: {type(exc)}, {exc}, {exc.__traceback__}"
+                print(msg, file=sys.stderr)
+
+    def _add_waiter(self, event_type: EventType) -> _EventWaiter:
+        waiter = _EventWaiter()
+        with self._waiters_lock:
+            self._waiters.setdefault(event_type, []).append(waiter)
+            self._update_subscribed_types()
+        return waiter
+
+    def _remove_waiter(self, event_type: EventType, waiter: _EventWaiter):
+        with self._waiters_lock:
+            waiters = self._waiters.get(event_type, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self._waiters.pop(event_type, None)
+            self._update_subscribed_types()
+
+    def _notify_waiters(self, event: Event):
+        # Checking without the lock first keeps this free when nothing is waiting
+        if not self._waiters:
+            return
+        with self._waiters_lock:
+            waiters = self._waiters.pop(event.type, [])
+            self._update_subscribed_types()
+        for waiter in waiters:
+            waiter.set(event)
+
     def _call_and_wait_for_event(
         self,
         event_type: EventType,
@@ -373,14 +555,14 @@ class Connection:
     ) -> Event:
         """Wait for an event after an (optional) function call.
 
-        If a function is supplied, it will be called with the specified args. This adds the
-        event-listener to the connection before calling, so that the event is guaranteed to
-        be found no matter how quickly after calling it is emitted.
+        If a function is supplied, it will be called with the specified args. This registers a
+        waiter with the connection before calling, so that the event is guaranteed to be
+        found no matter how quickly after calling it is emitted. The poll thread wakes the
+        waiter as soon as the event is received.
 
         Return the requested event.
         """
-        listener = LatestEventListener(event_type)
-        self.add_listener(listener)
+        waiter = self._add_waiter(event_type)
 
         if func is not None:
             if args is None:
@@ -389,17 +571,15 @@ class Connection:
             try:
                 func(*args)
             except Exception as exc:
-                self.remove_listener(listener)
+                self._remove_waiter(event_type, waiter)
                 raise exc
 
         if timeout is None:
             timeout = self._response_timeout
 
-        start_time = timer()
-        while listener.event is None and timer() - start_time < timeout:
-            time.sleep(0.01)
-        self.remove_listener(listener)
+        waiter.wait(timeout)
+        self._remove_waiter(event_type, waiter)
 
-        if listener.event is None:
+        if waiter.event is None:
             raise LeapTimeoutError("Did not received expected event in time")
-        return listener.event
+        return waiter.event
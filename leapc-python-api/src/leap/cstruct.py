@@ -8,10 +8,15 @@ class LeapCStruct:
     some struct from the LeapC API.
 
     :param data: The raw CData
+    :param owner: An object which owns the memory of the data, such as the CData it is a
+        member of, which is kept alive for as long as the wrapper. Defaults to None.
     """
 
-    def __init__(self, data: ffi.CData):
+    __slots__ = ("_data", "_owner")
+
+    def __init__(self, data: ffi.CData, owner=None):
         self._data = data
+        self._owner = owner
 
     @property
     def c_data(self) -> ffi.CData:
@@ -34,6 +34,8 @@ class FrameData:
 
 
 class FrameHeader(LeapCStruct):
+    __slots__ = ()
+
     @property
     def frame_id(self):
         return self._data.frame_id
@@ -44,6 +46,8 @@ class FrameHeader(LeapCStruct):
 
 
 class Vector(LeapCStruct):
+    __slots__ = ()
+
     def __getitem__(self, idx):
         return self._data.v[idx]
 
@@ -64,6 +68,8 @@ class Vector(LeapCStruct):
 
 
 class Quaternion(LeapCStruct):
+    __slots__ = ()
+
     def __getitem__(self, idx):
         return self._data.v[idx]
 
@@ -88,21 +94,50 @@ class Quaternion(LeapCStruct):
 
 
 class Palm(LeapCStruct):
+    __slots__ = (
+        "_position",
+        "_stabilized_position",
+        "_velocity",
+        "_normal",
+        "_direction",
+        "_orientation",
+    )
+
+    def __init__(self, data, owner=None):
+        # Set directly rather than through super(), as these are created in bulk
+        self._data = data
+        self._owner = owner
+        # Child wrappers, created on first access
+        self._position = None
+        self._stabilized_position = None
+        self._velocity = None
+        self._normal = None
+        self._direction = None
+        self._orientation = None
+
     @property
     def position(self):
-        return Vector(self._data.position)
+        if self._position is None:
+            self._position = Vector(self._data.position, self._owner)
+        return self._position
 
     @property
     def stabilized_position(self):
-        return Vector(self._data.stabilized_position)
+        if self._stabilized_position is None:
+            self._stabilized_position = Vector(self._data.stabilized_position, self._owner)
+        return self._stabilized_position
 
     @property
     def velocity(self):
-        return Vector(self._data.velocity)
+        if self._velocity is None:
+            self._velocity = Vector(self._data.velocity, self._owner)
+        return self._velocity
 
     @property
     def normal(self):
-        return Vector(self._data.normal)
+        if self._normal is None:
+            self._normal = Vector(self._data.normal, self._owner)
+        return self._normal
 
     @property
     def width(self):
@@ -110,21 +145,40 @@ class Palm(LeapCStruct):
 
     @property
     def direction(self):
-        return Vector(self._data.direction)
+        if self._direction is None:
+            self._direction = Vector(self._data.direction, self._owner)
+        return self._direction
 
     @property
     def orientation(self):
-        return Quaternion(self._data.orientation)
+        if self._orientation is None:
+            self._orientation = Quaternion(self._data.orientation, self._owner)
+        return self._orientation
 
 
 class Bone(LeapCStruct):
+    __slots__ = ("_prev_joint", "_next_joint", "_rotation")
+
+    def __init__(self, data, owner=None):
+        # Set directly rather than through super(), as these are created in bulk
+        self._data = data
+        self._owner = owner
+        # Child wrappers, created on first access
+        self._prev_joint = None
+        self._next_joint = None
+        self._rotation = None
+
     @property
     def prev_joint(self):
-        return Vector(self._data.prev_joint)
+        if self._prev_joint is None:
+            self._prev_joint = Vector(self._data.prev_joint, self._owner)
+        return self._prev_joint
 
     @property
     def next_joint(self):
-        return Vector(self._data.next_joint)
+        if self._next_joint is None:
+            self._next_joint = Vector(self._data.next_joint, self._owner)
+        return self._next_joint
 
     @property
     def width(self):
@@ -132,10 +186,24 @@ class Bone(LeapCStruct):
 
     @property
     def rotation(self):
-        return Quaternion(self._data.rotation)
+        if self._rotation is None:
+            self._rotation = Quaternion(self._data.rotation, self._owner)
+        return self._rotation
 
 
 class Digit(LeapCStruct):
+    __slots__ = ("_metacarpal", "_proximal", "_intermediate", "_distal")
+
+    def __init__(self, data, owner=None):
+        # Set directly rather than through super(), as these are created in bulk
+        self._data = data
+        self._owner = owner
+        # Child wrappers, created on first access
+        self._metacarpal = None
+        self._proximal = None
+        self._intermediate = None
+        self._distal = None
+
     @property
     def finger_id(self):
         return self._data.finger_id
@@ -146,19 +214,27 @@ class Digit(LeapCStruct):
 
     @property
     def metacarpal(self):
-        return Bone(self._data.metacarpal)
+        if self._metacarpal is None:
+            self._metacarpal = Bone(self._data.metacarpal, self._owner)
+        return self._metacarpal
 
     @property
     def proximal(self):
-        return Bone(self._data.proximal)
+        if self._proximal is None:
+            self._proximal = Bone(self._data.proximal, self._owner)
+        return self._proximal
 
     @property
     def intermediate(self):
-        return Bone(self._data.intermediate)
+        if self._intermediate is None:
+            self._intermediate = Bone(self._data.intermediate, self._owner)
+        return self._intermediate
 
     @property
     def distal(self):
-        return Bone(self._data.distal)
+        if self._distal is None:
+            self._distal = Bone(self._data.distal, self._owner)
+        return self._distal
 
     @property
     def is_extended(self):
@@ -166,6 +242,21 @@ class Digit(LeapCStruct):
 
 
 class Hand(LeapCStruct):
+    __slots__ = ("_palm", "_thumb", "_index", "_middle", "_ring", "_pinky", "_arm")
+
+    def __init__(self, data, owner=None):
+        # Set directly rather than through super(), as these are created in bulk
+        self._data = data
+        self._owner = owner
+        # Child wrappers, created on first access
+        self._palm = None
+        self._thumb = None
+        self._index = None
+        self._middle = None
+        self._ring = None
+        self._pinky = None
+        self._arm = None
+
     @property
     def id(self):
         return self._data.id
@@ -204,27 +295,39 @@ class Hand(LeapCStruct):
 
     @property
     def palm(self):
-        return Palm(self._data.palm)
+        if self._palm is None:
+            self._palm = Palm(self._data.palm, self._owner)
+        return self._palm
 
     @property
     def thumb(self):
-        return Digit(self._data.thumb)
+        if self._thumb is None:
+            self._thumb = Digit(self._data.thumb, self._owner)
+        return self._thumb
 
     @property
     def index(self):
-        return Digit(self._data.index)
+        if self._index is None:
+            self._index = Digit(self._data.index, self._owner)
+        return self._index
 
     @property
     def middle(self):
-        return Digit(self._data.middle)
+        if self._middle is None:
+            self._middle = Digit(self._data.middle, self._owner)
+        return self._middle
 
     @property
     def ring(self):
-        return Digit(self._data.ring)
+        if self._ring is None:
+            self._ring = Digit(self._data.ring, self._owner)
+        return self._ring
 
     @property
     def pinky(self):
-        return Digit(self._data.pinky)
+        if self._pinky is None:
+            self._pinky = Digit(self._data.pinky, self._owner)
+        return self._pinky
 
     @property
     def digits(self):
@@ -232,7 +335,9 @@ class Hand(LeapCStruct):
 
     @property
     def arm(self):
-        return Bone(self._data.arm)
+        if self._arm is None:
+            self._arm = Bone(self._data.arm, self._owner)
+        return self._arm
 
 
 class Image(LeapCStruct):
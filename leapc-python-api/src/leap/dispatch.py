@@ -0,0 +1,155 @@
+"""Delivery of events to listeners from threads other than the poll thread"""
+
+from collections import deque
+import enum
+import threading
+from typing import Callable, List
+
+from .enums import EventType
+from .events import Event
+
+
+class OverflowPolicy(enum.Enum):
+    """What an EventDispatcher does with a new event when its queue is full"""
+
+    # Discard the oldest queued event to make space
+    DropOldest = "drop-oldest"
+    # Discard the new event
+    DropNewest = "drop-newest"
+    # Wait on the poll thread until a dispatcher thread makes space
+    Block = "block"
+    # Replace the oldest queued TrackingEvent with the new one. Other events, or tracking
+    # events when there is none queued to replace, block until there is space.
+    CoalesceTracking = "coalesce-tracking-frames"
+
+
+class EventDispatcher:
+    """Delivers events from a bounded queue on one or more dispatcher threads
+
+    The poll thread only has to `put` each event into the queue, so a slow listener
+    delays other listeners but not the polling of the connection.
+
+    If more than one thread is used, events may be delivered out of order.
+
+    :param deliver: The function which delivers a single event, called on a dispatcher thread.
+    :param max_size: The maximum number of events in the queue. Defaults to 64.
+    :param num_threads: The number of dispatcher threads. Defaults to 1.
+    :param overflow_policy: What to do with new events when the queue is full.
+        Defaults to OverflowPolicy.CoalesceTracking.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[Event], None],
+        *,
+        max_size: int = 64,
+        num_threads: int = 1,
+        overflow_policy: OverflowPolicy = OverflowPolicy.CoalesceTracking,
+    ):
+        if max_size < 1:
+            raise ValueError("The dispatch queue must have a size of at least 1")
+        if num_threads < 1:
+            raise ValueError("At least one dispatcher thread is required")
+
+        self._deliver = deliver
+        self._max_size = max_size
+        self._num_threads = num_threads
+        self._overflow_policy = overflow_policy
+
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._threads: List[threading.Thread] = []
+        self._running = False
+
+        self._dropped = 0
+        self._max_queue_depth = 0
+
+    def start(self):
+        """Start the dispatcher threads"""
+        with self._lock:
+            self._running = True
+        self._threads = [
+            threading.Thread(target=self._dispatch_loop, daemon=True)
+            for _ in range(self._num_threads)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """Stop the dispatcher threads once every queued event has been delivered"""
+        with self._lock:
+            self._running = False
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def put(self, event: Event):
+        """Queue an event for delivery, applying the overflow policy if the queue is full"""
+        with self._lock:
+            if len(self._queue) >= self._max_size and not self._make_space(event):
+                self._dropped += 1
+                return
+            self._queue.append(event)
+            self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+            self._not_empty.notify()
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of events currently waiting to be delivered"""
+        return len(self._queue)
+
+    @property
+    def max_queue_depth(self) -> int:
+        """The largest number of events which have been waiting at once"""
+        return self._max_queue_depth
+
+    @property
+    def dropped(self) -> int:
+        """The number of events which were discarded without being delivered"""
+        return self._dropped
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        return self._overflow_policy
+
+    def _make_space(self, event: Event) -> bool:
+        """Make space in the full queue for the event
+
+        Returns False if the event should be dropped instead. Must hold the lock.
+        """
+        if self._overflow_policy == OverflowPolicy.DropNewest:
+            return False
+
+        if self._overflow_policy == OverflowPolicy.DropOldest:
+            self._queue.popleft()
+            self._dropped += 1
+            return True
+
+        if (
+            self._overflow_policy == OverflowPolicy.CoalesceTracking
+            and event.type == EventType.Tracking
+        ):
+            for i, queued_event in enumerate(self._queue):
+                if queued_event.type == EventType.Tracking:
+                    del self._queue[i]
+                    self._dropped += 1
+                    return True
+
+        while self._running and len(self._queue) >= self._max_size:
+            self._not_full.wait()
+        return True
+
+    def _dispatch_loop(self):
+        while True:
+            with self._lock:
+                while self._running and not self._queue:
+                    self._not_empty.wait()
+                if not self._queue:
+                    return
+                event = self._queue.popleft()
+                self._not_full.notify()
+            self._deliver(event)
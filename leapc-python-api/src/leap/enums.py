@@ -1,15 +1,42 @@
 """Wrappers around LeapC enums"""
 
 import enum
+import functools
 from keyword import iskeyword
+from typing import Dict, List, Tuple
 
 from leapc_cffi import libleapc
 
 
+def _build_enum_tables(container) -> Dict[str, List[Tuple[str, int]]]:
+    """Group all of the "eLeap{name}_{key}" attributes of the container by enum name
+
+    This scans the attributes of the container once, rather than once per enum. Each enum
+    name maps to a list of (key, value) tuples, in the order of `dir(container)`. If a key
+    is a Python keyword then it is prefixed with the enum name.
+    """
+    tables: Dict[str, List[Tuple[str, int]]] = {}
+    for attr in dir(container):
+        if not attr.startswith("eLeap"):
+            continue
+        name, separator, enum_key = attr[5:].partition("_")
+        if not separator:
+            continue
+        if iskeyword(enum_key):
+            enum_key = f"{name}{enum_key}"
+        tables.setdefault(name, []).append((enum_key, getattr(container, attr)))
+    return tables
+
+
+# The enum tables of libleapc, which every LeapEnum is generated from, scanned once
+_LIBLEAPC_TABLES = _build_enum_tables(libleapc)
+
+
 def _generate_enum_entries(container, name: str):
     """Generate enum entries based on the attributes of the container
 
-    This searches for all attributes which start with "eLeap{name}_".
+    This finds all attributes which start with "eLeap{name}_". The attributes of libleapc
+    are only scanned once, for all enum names. Other containers are scanned on each call.
 
     It yields a tuple which is the remainder of the attribute name, and
     the corresponding attribute value. If the attribute name is a Python
@@ -27,14 +54,8 @@ def _generate_enum_entries(container, name: str):
     > [('One', 1), ('Two', 2), ('FooNone', 4)]
     ```
     """
-    prefix = f"eLeap{name}_"
-    for attr in dir(container):
-        if attr.startswith(prefix):
-            enum_key = attr[len(prefix) :]
-            enum_value = getattr(container, attr)
-            if iskeyword(enum_key):
-                enum_key = f"{name}{enum_key}"
-            yield enum_key, enum_value
+    tables = _LIBLEAPC_TABLES if container is libleapc else _build_enum_tables(container)
+    yield from tables.get(name, [])
 
 
 class LeapEnum(type):
@@ -68,12 +89,19 @@ class LeapEnum(type):
         return enum.Enum(name, entries)
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_enum_entries(enum_type, flags):
+    # A tuple, so that the cached result cannot be modified by a caller
+    return tuple(entry for entry in enum_type if entry.value & flags != 0)
+
+
 def get_enum_entries(enum_type, flags):
     """Interpret the flags as a bitwise combination of enum values
 
-    Returns a list of enum entries which are present in the 'flags'.
+    Returns a list of enum entries which are present in the 'flags'. The decoding is
+    cached, since the same few combinations of flags are decoded for every event.
     """
-    return list(filter(lambda entry: entry.value & flags != 0, enum_type))
+    return list(_cached_enum_entries(enum_type, flags))
 
 
 class RS(metaclass=LeapEnum):
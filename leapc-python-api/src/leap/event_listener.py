@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from .events import Event
 from .enums import EventType
@@ -19,6 +19,31 @@ class Listener:
         """
         getattr(self, self._EVENT_CALLS[event.type])(event)
 
+    def event_handlers(self) -> Dict[EventType, Callable[[Event], None]]:
+        """Get the function which handles each event type for this listener
+
+        Event types whose method is not overridden are omitted, since the base methods do
+        nothing. If `on_event` is overridden it handles every event type.
+
+        Connections call this when the listener is added, so changes to the listener's
+        methods after that are not seen until `Connection.update_listener` is called.
+        """
+        instance_attrs = getattr(self, "__dict__", {})
+
+        def is_overridden(name):
+            return name in instance_attrs or getattr(type(self), name) is not getattr(
+                Listener, name
+            )
+
+        if is_overridden("on_event"):
+            return {event_type: self.on_event for event_type in self._EVENT_CALLS}
+
+        return {
+            event_type: getattr(self, name)
+            for event_type, name in self._EVENT_CALLS.items()
+            if is_overridden(name)
+        }
+
     def on_error(self, error: LeapError):
         """If an error occurs in polling, the Exception is passed to this function"""
         pass
@@ -49,16 +49,27 @@ class Event(LeapCStruct):
         self._metadata = None
 
     @classmethod
-    def from_connection_message(cls, c_message):
+    def from_connection_message(cls, c_message, **kwargs):
         """Construct an Event from a LEAP_CONNECTION_MESSAGE* object
 
-        Constructing an event in this way populates the event metadata.
+        Constructing an event in this way populates the event metadata. Extra kwargs are
+        forwarded to the Event constructor.
+
+        LeapC reuses the memory of a message for the next message it polls, so the event
+        owns a copy of the message and its event struct, and stays valid after the next
+        poll. Any data the event struct points to, such as image pixels, is not copied.
         """
         if EventType(c_message.type) != cls._EVENT_TYPE:
             raise ValueError("Incorect event type")
 
-        event = cls(getattr(c_message, cls._EVENT_ATTRIBUTE))
-        event._metadata = EventMetadata(c_message)
+        data = getattr(c_message, cls._EVENT_ATTRIBUTE)
+        message = ffi.new("LEAP_CONNECTION_MESSAGE*", c_message[0])
+        if cls._EVENT_ATTRIBUTE != "pointer" and data != ffi.NULL:
+            data = ffi.new(ffi.typeof(data), data[0])
+            setattr(message, cls._EVENT_ATTRIBUTE, data)
+
+        event = cls(data, **kwargs)
+        event._metadata = EventMetadata(message)
         return event
 
     @classmethod
@@ -138,28 +149,64 @@ class PolicyEvent(Event):
         return get_enum_entries(PolicyFlag, self._flags)
 
 
+# The hands of a TrackingEvent which has released its buffer
+_NO_HANDS = ffi.new("LEAP_HAND[0]")
+
+
 class TrackingEvent(Event):
     _EVENT_TYPE = EventType.Tracking
     _EVENT_ATTRIBUTE = "tracking_event"
 
-    def __init__(self, data):
+    def __init__(self, data, *, hand_pool=None, hands=None):
+        """Create the TrackingEvent
+
+        :param data: The LEAP_TRACKING_EVENT CData
+        :param hand_pool: An optional HandBufferPool to borrow the buffer for the hands
+            from. Defaults to None, which allocates a new buffer.
+        :param hands: An optional LEAP_HAND* to use in place of `data.pHands`. These hands
+            are not copied, so they must stay valid for the lifetime of the event and of any
+            Hand or array created from it. Defaults to None.
+        """
         super().__init__(data)
-        self._info = FrameHeader(data.info)
+        self._info = FrameHeader(data.info, data)
+        self._frame_id = data.info.frame_id
+        self._timestamp = data.info.timestamp
         self._tracking_frame_id = data.tracking_frame_id
         self._num_hands = data.nHands
         self._framerate = data.framerate
+        self._hand_wrappers = None
+        # The LeapC time at which the event was polled, if it was queued for a dispatcher
+        self._poll_time = None
+
+        if hands is not None:
+            self._hand_buffer = None
+            self._hands = hands
+            return
 
         # Copy hands to safe region of memory to protect against use-after-free (UAF)
-        self._hands = ffi.new("LEAP_HAND[2]")
+        if hand_pool is not None:
+            self._hand_buffer = hand_pool.acquire()
+            self._hands = self._hand_buffer.hands
+        else:
+            self._hand_buffer = None
+            self._hands = ffi.new("LEAP_HAND[2]")
         ffi.memmove(self._hands, data.pHands, ffi.sizeof("LEAP_HAND") * data.nHands)
 
+    @classmethod
+    def from_connection_message(cls, c_message, **kwargs):
+        event = super().from_connection_message(c_message, **kwargs)
+        # Point the event's copy of the struct at its copy of the hands, rather than at the
+        # hands in LeapC's memory
+        event._data.pHands = event._hands
+        return event
+
     @property
     def info(self):
         return self._info
 
     @property
     def timestamp(self):
-        return self._info.timestamp
+        return self._timestamp
 
     @property
     def tracking_frame_id(self):
@@ -167,13 +214,76 @@ class TrackingEvent(Event):
 
     @property
     def hands(self):
-        return [Hand(self._hands[i]) for i in range(self._num_hands)]
+        """The hands in the frame
+
+        Returns a new list on each access, but the Hand wrappers in it are created on first
+        access and reused, so repeatedly walking the hands of a frame does not create new
+        wrappers.
+        """
+        if self._hand_wrappers is None:
+            hands = self._hands
+            # Each Hand keeps the buffer alive, so that it stays valid after the event
+            self._hand_wrappers = tuple(Hand(hands[i], hands) for i in range(self._num_hands))
+        return list(self._hand_wrappers)
+
+    def as_numpy(self):
+        """Get the hands as a structured NumPy array, with one entry per hand
+
+        This is a view of the hand data owned by this event, so no per-field Python
+        objects are created. Field names match the LEAP_HAND struct, eg.
+        `event.as_numpy()["palm"]["position"]["v"]`. See `leap.arrays` for helpers.
+
+        Requires NumPy.
+        """
+        from .arrays import hands_array
+
+        return hands_array(self._hands, self._num_hands)
+
+    def release(self):
+        """Release the hand buffer, if it was borrowed from a HandBufferPool
+
+        After this the event has no hands. The buffer returns to the pool once any Hands
+        or arrays already created from the event are also gone, so they remain valid. It
+        is also returned when the event is garbage collected, so this is only needed to
+        return it sooner.
+        """
+        if self._hand_buffer is not None:
+            if self._data.pHands == self._hands:
+                # The event owns its struct, so stop it pointing at the buffer
+                self._data.nHands = 0
+                self._data.pHands = ffi.NULL
+            self._hand_buffer.release()
+            self._hand_buffer = None
+            self._hands = _NO_HANDS
+            self._num_hands = 0
+            self._hand_wrappers = None
 
     @property
     def framerate(self):
         return self._framerate
 
 
+def _tracking_event_data(event: TrackingEvent, hands=None, num_hands=None):
+    """Build a LEAP_TRACKING_EVENT* from the fields of a TrackingEvent
+
+    The event's own struct is not copied, as it may point into memory LeapC has reused.
+
+    :param event: The TrackingEvent to copy the fields of.
+    :param hands: The LEAP_HAND* to point the struct at. Defaults to None, which uses the
+        hands owned by the event. These are not copied.
+    :param num_hands: The number of hands in 'hands'. Defaults to None, which uses the
+        number of hands in the event.
+    """
+    data = ffi.new("LEAP_TRACKING_EVENT*")
+    data.info.frame_id = event._frame_id
+    data.info.timestamp = event._timestamp
+    data.tracking_frame_id = event._tracking_frame_id
+    data.nHands = event._num_hands if num_hands is None else num_hands
+    data.pHands = event._hands if hands is None else hands
+    data.framerate = event._framerate
+    return data
+
+
 class ImageRequestErrorEvent(Event):
     _EVENT_TYPE = EventType.ImageRequestError
     _EVENT_ATTRIBUTE = "pointer"
@@ -329,30 +439,39 @@ class IMUEvent(Event):
         return self._temperature
 
 
-def create_event(data):
-    """Create an Event from `LEAP_CONNECTION_MESSAGE*` cdata"""
-    events = {
-        EventType.EventTypeNone: NoneEvent,
-        EventType.Connection: ConnectionEvent,
-        EventType.ConnectionLost: ConnectionLostEvent,
-        EventType.Device: DeviceEvent,
-        EventType.DeviceFailure: DeviceFailureEvent,
-        EventType.Policy: PolicyEvent,
-        EventType.Tracking: TrackingEvent,
-        EventType.ImageRequestError: ImageRequestErrorEvent,
-        EventType.ImageComplete: ImageCompleteEvent,
-        EventType.LogEvent: LogEvent,
-        EventType.DeviceLost: DeviceLostEvent,
-        EventType.ConfigResponse: ConfigResponseEvent,
-        EventType.ConfigChange: ConfigChangeEvent,
-        EventType.DeviceStatusChange: DeviceStatusChangeEvent,
-        EventType.DroppedFrame: DroppedFrameEvent,
-        EventType.Image: ImageEvent,
-        EventType.PointMappingChange: PointMappingChangeEvent,
-        EventType.TrackingMode: TrackingModeEvent,
-        EventType.LogEvents: LogEvents,
-        EventType.HeadPose: HeadPoseEvent,
-        EventType.Eyes: EyesEvent,
-        EventType.IMU: IMUEvent,
-    }
-    return events[EventType(data.type)].from_connection_message(data)
+_EVENT_CLASSES = {
+    EventType.EventTypeNone: NoneEvent,
+    EventType.Connection: ConnectionEvent,
+    EventType.ConnectionLost: ConnectionLostEvent,
+    EventType.Device: DeviceEvent,
+    EventType.DeviceFailure: DeviceFailureEvent,
+    EventType.Policy: PolicyEvent,
+    EventType.Tracking: TrackingEvent,
+    EventType.ImageRequestError: ImageRequestErrorEvent,
+    EventType.ImageComplete: ImageCompleteEvent,
+    EventType.LogEvent: LogEvent,
+    EventType.DeviceLost: DeviceLostEvent,
+    EventType.ConfigResponse: ConfigResponseEvent,
+    EventType.ConfigChange: ConfigChangeEvent,
+    EventType.DeviceStatusChange: DeviceStatusChangeEvent,
+    EventType.DroppedFrame: DroppedFrameEvent,
+    EventType.Image: ImageEvent,
+    EventType.PointMappingChange: PointMappingChangeEvent,
+    EventType.TrackingMode: TrackingModeEvent,
+    EventType.LogEvents: LogEvents,
+    EventType.HeadPose: HeadPoseEvent,
+    EventType.Eyes: EyesEvent,
+    EventType.IMU: IMUEvent,
+}
+
+
+def create_event(data, *, hand_pool=None):
+    """Create an Event from `LEAP_CONNECTION_MESSAGE*` cdata
+
+    :param hand_pool: An optional HandBufferPool which TrackingEvents borrow their hand
+        buffers from. Defaults to None.
+    """
+    event_type = EventType(data.type)
+    if event_type == EventType.Tracking and hand_pool is not None:
+        return TrackingEvent.from_connection_message(data, hand_pool=hand_pool)
+    return _EVENT_CLASSES[event_type].from_connection_message(data)
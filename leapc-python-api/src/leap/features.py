@@ -0,0 +1,157 @@
+"""Fixed-width feature vectors for each hand, for gesture detection and training
+
+Every hand is summarised by a float32 vector of NUM_FEATURES values, named in
+FEATURE_NAMES and indexed by FEATURE_INDEX:
+
+    grab_strength, pinch_strength: As reported by LeapC, from 0 to 1
+    thumb_<finger>_distance: The distance from the thumb tip to each other fingertip (mm)
+    <finger>_<finger>_distance: The distance between adjacent fingertips, index to pinky (mm)
+    <digit>_extended: 1 if the digit is extended, otherwise 0
+    extended_count: The number of extended digits
+    palm_velocity_x, _y, _z, palm_speed: The palm velocity (mm/s)
+    box_x, box_y, box_z: The palm position in the interaction box, from -1 to 1 inside it
+    box_distance: The largest of abs(box_x, box_y, box_z), so 1 or less inside the box
+
+The same vectorised code computes the features of the hands in a live TrackingEvent and of
+a whole batch of recorded frames, so detectors trained on recordings see exactly the
+features they will see at runtime.
+
+Example:
+```
+extractor = FeatureExtractor()
+connection.add_listener(extractor)
+...
+pinch_distance = extractor.features[:, FEATURE_INDEX["thumb_index_distance"]]
+```
+
+NumPy is an optional dependency, only required by this module.
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from .arrays import fingertip_positions, palm_positions, palm_velocities
+from .event_listener import Listener
+from .events import TrackingEvent
+from .math import distance, norm
+
+_DIGITS = ("thumb", "index", "middle", "ring", "pinky")
+
+FEATURE_NAMES = (
+    ("grab_strength", "pinch_strength")
+    + tuple(f"thumb_{finger}_distance" for finger in _DIGITS[1:])
+    + tuple(f"{a}_{b}_distance" for a, b in zip(_DIGITS[1:-1], _DIGITS[2:]))
+    + tuple(f"{digit}_extended" for digit in _DIGITS)
+    + ("extended_count", "palm_velocity_x", "palm_velocity_y", "palm_velocity_z", "palm_speed")
+    + ("box_x", "box_y", "box_z", "box_distance")
+)
+FEATURE_INDEX: Dict[str, int] = {name: index for index, name in enumerate(FEATURE_NAMES)}
+NUM_FEATURES = len(FEATURE_NAMES)
+
+_THUMB_DISTANCES = slice(
+    FEATURE_INDEX["thumb_index_distance"], FEATURE_INDEX["thumb_pinky_distance"] + 1
+)
+_ADJACENT_DISTANCES = slice(
+    FEATURE_INDEX["index_middle_distance"], FEATURE_INDEX["ring_pinky_distance"] + 1
+)
+_EXTENDED = slice(FEATURE_INDEX["thumb_extended"], FEATURE_INDEX["pinky_extended"] + 1)
+_VELOCITY = slice(FEATURE_INDEX["palm_velocity_x"], FEATURE_INDEX["palm_velocity_z"] + 1)
+_BOX = slice(FEATURE_INDEX["box_x"], FEATURE_INDEX["box_z"] + 1)
+
+
+class FeatureExtractor(Listener):
+    """Computes a feature vector for each hand
+
+    As a Listener it computes the features of every tracking event, which are then
+    available from `features`, `hand_ids` and `hand_types`. Each event gets new arrays, so
+    they can be kept or passed to another thread.
+
+    The interaction box defaults to a region 300mm wide and deep and 500mm tall, centred
+    200mm above the device.
+
+    :param box_center: The centre of the interaction box (mm).
+    :param box_size: The width, height and depth of the interaction box (mm).
+    """
+
+    def __init__(
+        self,
+        box_center: Sequence[float] = (0.0, 200.0, 0.0),
+        box_size: Sequence[float] = (300.0, 500.0, 300.0),
+    ):
+        self._box_center = np.asarray(box_center, dtype=np.float32)
+        self._box_scale = 2.0 / np.asarray(box_size, dtype=np.float32)
+        self.event: Optional[TrackingEvent] = None
+        self.features = np.zeros((0, NUM_FEATURES), dtype=np.float32)
+        self.hand_ids = np.zeros(0, dtype=np.uint32)
+        self.hand_types = np.zeros(0, dtype=np.int32)
+
+    def on_tracking_event(self, event):
+        hands = event.as_numpy()
+        self.features = self.from_hands(hands)
+        self.hand_ids = hands["id"].copy()
+        self.hand_types = hands["type"].copy()
+        self.event = event
+
+    def from_event(self, event: TrackingEvent) -> np.ndarray:
+        """Get a (hands, NUM_FEATURES) array of the features of the hands in the event"""
+        return self.from_hands(event.as_numpy())
+
+    def from_hands(self, hands: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get the features of a structured array of hands
+
+        :param hands: An array of HAND_DTYPE of any shape, eg. from `TrackingEvent.as_numpy`
+            or `FrameLog.as_numpy`. Every entry is computed, including unused hand slots.
+        :param out: An optional float32 array of shape hands.shape + (NUM_FEATURES,) to
+            write the features to.
+        """
+        return self._compute(
+            out,
+            hands.shape,
+            hands["grab_strength"],
+            hands["pinch_strength"],
+            fingertip_positions(hands),
+            hands["digits"]["is_extended"],
+            palm_positions(hands),
+            palm_velocities(hands),
+        )
+
+    def from_columns(self, columns: dict) -> np.ndarray:
+        """Get a (frames, 2, NUM_FEATURES) array of the features of a batch of frames
+
+        The features of hand slots which a frame does not use are zero.
+
+        :param columns: Columns as returned by `leap.arrays.tracking_columns`, such as the
+            chunks from `Recording.iter_columns`.
+        """
+        features = self._compute(
+            None,
+            columns["grab_strength"].shape,
+            columns["grab_strength"],
+            columns["pinch_strength"],
+            columns["joints"][..., 4, :],
+            columns["extended"],
+            columns["palm_position"],
+            columns["palm_velocity"],
+        )
+        features[np.arange(2) >= columns["num_hands"][:, np.newaxis]] = 0
+        return features
+
+    def _compute(
+        self, out, shape, grab, pinch, tips, extended, palm_position, palm_velocity
+    ) -> np.ndarray:
+        if out is None:
+            out = np.empty(shape + (NUM_FEATURES,), dtype=np.float32)
+        out[..., FEATURE_INDEX["grab_strength"]] = grab
+        out[..., FEATURE_INDEX["pinch_strength"]] = pinch
+        out[..., _THUMB_DISTANCES] = distance(tips[..., 1:, :], tips[..., :1, :])
+        out[..., _ADJACENT_DISTANCES] = distance(tips[..., 2:, :], tips[..., 1:-1, :])
+        out[..., _EXTENDED] = extended
+        out[..., FEATURE_INDEX["extended_count"]] = out[..., _EXTENDED].sum(axis=-1)
+        out[..., _VELOCITY] = palm_velocity
+        out[..., FEATURE_INDEX["palm_speed"]] = norm(palm_velocity)
+        box = out[..., _BOX]
+        np.subtract(palm_position, self._box_center, out=box)
+        box *= self._box_scale
+        out[..., FEATURE_INDEX["box_distance"]] = np.abs(box).max(axis=-1)
+        return out
@@ -0,0 +1,274 @@
+"""Jitter filtering of hand positions
+
+OneEuroFilter smooths noisy positions while they move slowly, and follows them closely when
+they move quickly, so it removes jitter without the lag of a fixed low-pass filter. See
+Casiez et al., "1€ Filter: A Simple Speed-based Low-pass Filter for Noisy Input in
+Interactive Systems" (CHI 2012).
+
+FilteredListener wraps another Listener, and passes it copies of tracking events whose palm,
+digit joint and arm positions have been filtered. Every point of every hand in a frame is
+filtered in a single vectorised pass. The time it takes is measured against a
+LatencyBudget, so the cost of the stage can be checked at runtime.
+
+Example:
+```
+listener = FilteredListener(MyListener(), OneEuroFilter(min_cutoff=1.0, beta=0.01))
+connection.add_listener(listener)
+...
+if listener.latency.over_budget:
+    print("Filtering took", listener.latency.max() / 1e3, "us")
+```
+
+NumPy is an optional dependency, only required by this module.
+"""
+
+import math
+import time
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+from leapc_cffi import ffi
+
+from .arrays import arm_joints, hands_array, joint_positions, palm_positions
+from .enums import EventType
+from .event_listener import Listener
+from .events import Event, TrackingEvent, _tracking_event_data
+from .history import History
+
+
+def _smoothing_factor(cutoff, dt):
+    """The weight of a new sample in a first-order low-pass filter with this cutoff (Hz)"""
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter:
+    """A One-Euro filter of many points at once
+
+    Each row of the values passed in is identified by a key, such as a hand id, and the
+    filter keeps its state for each key. The speed used to adapt the cutoff is that of each
+    point, so all the components of a point are filtered alike.
+
+    :param min_cutoff: The cutoff frequency when the points are still, in Hz. Lower values
+        remove more jitter. Defaults to 1.0.
+    :param beta: How quickly the cutoff rises with the speed of a point, in Hz per unit per
+        second. Higher values reduce lag during fast movements. Defaults to 0.007, which
+        suits positions in millimetres.
+    :param d_cutoff: The cutoff frequency used to smooth the speed, in Hz. Defaults to 1.0.
+    """
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.007, d_cutoff: float = 1.0):
+        if min_cutoff <= 0 or d_cutoff <= 0:
+            raise ValueError("Cutoff frequencies must be positive")
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self._slots: Dict[int, int] = {}
+        self._values: Optional[np.ndarray] = None
+        self._derivatives: Optional[np.ndarray] = None
+        self._timestamps = np.zeros(0, dtype=np.int64)
+        # The keys of the previous frame and their slots, which are usually unchanged
+        self._last_keys = None
+        self._last_slots = None
+
+    def reset(self, key: Optional[int] = None):
+        """Forget the state of a key, or of every key if None"""
+        self._last_keys = None
+        if key is None:
+            self._slots.clear()
+            self._values = self._derivatives = None
+            self._timestamps = np.zeros(0, dtype=np.int64)
+        else:
+            slot = self._slots.pop(key, None)
+            if slot is not None:
+                self._timestamps[slot] = -1
+
+    def _slots_for(self, keys: Sequence[int], shape) -> np.ndarray:
+        """Get the state slot of each key, growing the state arrays for new keys"""
+        if self._values is not None and self._values.shape[1:] != shape:
+            self.reset()
+        keys = tuple(keys)
+        if keys == self._last_keys:
+            return self._last_slots
+        for key in keys:
+            if key not in self._slots:
+                used = set(self._slots.values())
+                self._slots[key] = next(slot for slot in range(len(used) + 1) if slot not in used)
+        size = max(self._slots.values()) + 1
+        if self._values is None or len(self._values) < size:
+            capacity = max(size, 2 * (0 if self._values is None else len(self._values)))
+            values = np.zeros((capacity,) + shape, dtype=np.float32)
+            derivatives = np.zeros_like(values)
+            timestamps = np.full(capacity, -1, dtype=np.int64)
+            if self._values is not None:
+                values[: len(self._values)] = self._values
+                derivatives[: len(self._values)] = self._derivatives
+                timestamps[: len(self._values)] = self._timestamps
+            self._values, self._derivatives, self._timestamps = values, derivatives, timestamps
+        self._last_keys = keys
+        self._last_slots = np.array([self._slots[key] for key in keys], dtype=np.intp)
+        return self._last_slots
+
+    def __call__(self, keys: Sequence[int], timestamp: int, values: np.ndarray) -> np.ndarray:
+        """Filter the values of a frame
+
+        Rows whose key is new are returned unchanged. Keys which are missing from a frame
+        keep their state, so use `reset` to forget hands which have been lost.
+
+        :param keys: The key of each row of 'values'.
+        :param timestamp: The timestamp of the frame, in microseconds.
+        :param values: A (rows, ..., components) array of points.
+        """
+        values = np.asarray(values, dtype=np.float32)
+        if len(keys) == 0:
+            return values.copy()
+        slots = self._slots_for(keys, values.shape[1:])
+        previous_timestamps = self._timestamps[slots]
+        new = (previous_timestamps < 0) | (previous_timestamps >= timestamp)
+        dt = np.maximum((timestamp - previous_timestamps) / 1e6, 1e-6)
+        dt = dt.reshape((-1,) + (1,) * (values.ndim - 1)).astype(np.float32)
+
+        previous = self._values[slots]
+        derivative = (values - previous) / dt
+        alpha_d = _smoothing_factor(self.d_cutoff, dt)
+        derivative = alpha_d * derivative + (1 - alpha_d) * self._derivatives[slots]
+        speed = np.sqrt(np.einsum("...i,...i->...", derivative, derivative))[..., np.newaxis]
+        alpha = _smoothing_factor(self.min_cutoff + self.beta * speed, dt)
+        filtered = alpha * values + (1 - alpha) * previous
+
+        if new.any():
+            filtered[new] = values[new]
+            derivative[new] = 0
+        self._values[slots] = filtered
+        self._derivatives[slots] = derivative
+        self._timestamps[slots] = timestamp
+        return filtered
+
+
+class LatencyBudget:
+    """Measures the time a pipeline stage takes for each frame
+
+    The most recent latencies are kept, and statistics are over those.
+
+    :param budget: The time the stage should take for each frame, in seconds.
+    :param capacity: The number of recent latencies to keep. Defaults to 1024.
+    """
+
+    def __init__(self, budget: float, capacity: int = 1024):
+        self.budget = budget
+        self._budget_ns = round(budget * 1e9)
+        self._history = History(capacity, {"latency": ()}, dtype=np.int64)
+        self.count = 0
+        self.over_budget = 0
+
+    def record(self, timestamp: int, latency_ns: int):
+        """Record the time taken by the stage for a frame
+
+        :param timestamp: The timestamp of the frame, in microseconds.
+        :param latency_ns: The time taken, in nanoseconds.
+        """
+        self._history.push(timestamp, latency_ns)
+        self.count += 1
+        if latency_ns > self._budget_ns:
+            self.over_budget += 1
+
+    def mean(self) -> float:
+        """The mean of the recent latencies, in nanoseconds"""
+        return float(self._history.mean("latency")) if len(self._history) else 0.0
+
+    def max(self) -> int:
+        """The largest of the recent latencies, in nanoseconds"""
+        return int(self._history.max("latency")) if len(self._history) else 0
+
+    def percentile(self, percent: float) -> float:
+        """A percentile of the recent latencies, in nanoseconds"""
+        if not len(self._history):
+            return 0.0
+        return float(np.percentile(self._history.values("latency"), percent))
+
+
+class FilteredListener(Listener):
+    """Wraps a listener, passing it tracking events with filtered hand positions
+
+    Each tracking event is copied, and the palm position, digit joints and arm joints of
+    every hand in the copy are filtered. Other events are passed on unchanged. The
+    filter's state for a hand is reset when the hand is missing from a frame.
+
+    :param listener: The listener to pass events on to.
+    :param point_filter: The filter to apply. It is called with the hand ids, the
+        timestamp and a (hands, 28, 3) array of points. Defaults to a OneEuroFilter.
+    :param latency_budget: The time filtering should take for each frame, in seconds.
+        Defaults to 0.001.
+    """
+
+    def __init__(
+        self,
+        listener: Listener,
+        point_filter: Optional[Callable[[Sequence[int], int, np.ndarray], np.ndarray]] = None,
+        latency_budget: float = 0.001,
+    ):
+        self._listener = listener
+        self._filter = point_filter if point_filter is not None else OneEuroFilter()
+        self._hand_ids = frozenset()
+        self.latency = LatencyBudget(latency_budget)
+
+    def event_handlers(self) -> Dict[EventType, Callable[[Event], None]]:
+        # Listeners which do not subclass Listener may only have an `on_event` method, which
+        # handles every event type, as in Connection
+        event_handlers = getattr(self._listener, "event_handlers", None)
+        if event_handlers is not None:
+            handlers = event_handlers()
+        else:
+            handlers = {event_type: self._listener.on_event for event_type in EventType}
+        deliver = handlers.get(EventType.Tracking)
+        if deliver is not None:
+            handlers[EventType.Tracking] = lambda event: deliver(self.filter_event(event))
+        return handlers
+
+    def on_event(self, event: Event):
+        if event.type == EventType.Tracking:
+            event = self.filter_event(event)
+        self._listener.on_event(event)
+
+    def on_error(self, error):
+        self._listener.on_error(error)
+
+    def filter_event(self, event: TrackingEvent) -> TrackingEvent:
+        """Get a copy of the tracking event, with the positions of its hands filtered"""
+        start = time.perf_counter_ns()
+        timestamp = event.timestamp
+        num_hands = min(event._num_hands, 2)
+        hands = ffi.new("LEAP_HAND[2]")
+        ffi.memmove(hands, event._hands, ffi.sizeof("LEAP_HAND") * num_hands)
+        # Built from the event's cached fields and owned hands, not from its struct
+        data = _tracking_event_data(event, hands, num_hands)
+
+        view = hands_array(hands, num_hands)
+        hand_ids = view["id"].tolist()
+        if hasattr(self._filter, "reset"):
+            for hand_id in self._hand_ids.difference(hand_ids):
+                self._filter.reset(hand_id)
+        self._hand_ids = frozenset(hand_ids)
+
+        if num_hands:
+            points = np.concatenate(
+                (
+                    palm_positions(view)[:, np.newaxis],
+                    joint_positions(view).reshape(num_hands, 25, 3),
+                    arm_joints(view),
+                ),
+                axis=1,
+            )
+            filtered = self._filter(hand_ids, timestamp, points)
+            joints = filtered[:, 1:26].reshape(num_hands, 5, 5, 3)
+            bones = view["digits"]["bones"]
+            palm_positions(view)[...] = filtered[:, 0]
+            bones["prev_joint"]["v"][...] = joints[:, :, :4]
+            bones["next_joint"]["v"][...] = joints[:, :, 1:]
+            view["arm"]["prev_joint"]["v"][...] = filtered[:, 26]
+            view["arm"]["next_joint"]["v"][...] = filtered[:, 27]
+
+        filtered_event = TrackingEvent(data, hands=hands)
+        self.latency.record(timestamp, time.perf_counter_ns() - start)
+        return filtered_event
@@ -0,0 +1,211 @@
+"""A fixed-stride binary log of tracking frames, replayed through a memory map
+
+Unlike a LeapC Recording, a frame log can be read without calling into LeapC, and every
+frame is at a known offset. Each record is a LEAP_TRACKING_EVENT followed by space for two
+LEAP_HAND structs, so frames can be read in any order as `TrackingEvent` views over the
+mapped file, or all at once as NumPy structured arrays.
+
+The structs are stored in the layout of the LeapC headers the bindings were built against.
+A checksum of the size, offset and type of every field is recorded in the file header, and
+checked when it is opened. Only the LeapC struct definitions are needed to read a log, so
+the simulator backend (LEAPSDK_SIMULATOR=1) can read them on machines without LeapC
+installed.
+"""
+
+import mmap
+import struct
+import zlib
+from typing import Iterator
+
+from leapc_cffi import ffi
+
+from .event_listener import Listener
+from .events import TrackingEvent, _tracking_event_data
+
+_HEADER = struct.Struct("<8sIIIIII")
+_MAGIC = b"LEAPFLOG"
+_VERSION = 2
+# Records start after the header, padded so that they stay aligned
+_HEADER_SIZE = 64
+
+_EVENT_SIZE = ffi.sizeof("LEAP_TRACKING_EVENT")
+_HAND_SIZE = ffi.sizeof("LEAP_HAND")
+RECORD_SIZE = _EVENT_SIZE + 2 * _HAND_SIZE
+
+
+def _describe_layout(ctype) -> str:
+    """Describe the offset and type of every field of a C type, recursively"""
+    if ctype.kind in ("struct", "union"):
+        fields = ",".join(
+            f"{name}@{field.offset}:{_describe_layout(field.type)}" for name, field in ctype.fields
+        )
+        return f"{ctype.kind}[{ffi.sizeof(ctype)}]{{{fields}}}"
+    if ctype.kind == "array":
+        return f"{_describe_layout(ctype.item)}[{ctype.length}]"
+    return f"{ctype.cname}[{ffi.sizeof(ctype)}]"
+
+
+# A checksum of the layout of the structs in each record, so that a log is only read with
+# the struct definitions it was written with
+_LAYOUT = zlib.crc32(
+    (
+        _describe_layout(ffi.typeof("LEAP_TRACKING_EVENT"))
+        + _describe_layout(ffi.typeof("LEAP_HAND"))
+    ).encode()
+)
+
+
+class FrameLogWriter(Listener):
+    """Writes tracking frames to a frame log
+
+    It can be added to a Connection as a listener, to log every tracking event.
+
+    :param fpath: The path of the frame log to create.
+    """
+
+    def __init__(self, fpath: str):
+        self._file = open(fpath, "wb")
+        header = _HEADER.pack(_MAGIC, _VERSION, _HEADER_SIZE, _EVENT_SIZE, _HAND_SIZE, 2, _LAYOUT)
+        self._file.write(header.ljust(_HEADER_SIZE, b"\0"))
+        self._no_hands = bytes(2 * _HAND_SIZE)
+        self._count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def write(self, frame: TrackingEvent):
+        """Write a frame to the log"""
+        num_hands = min(frame._num_hands, 2)
+        # Built from the frame's cached fields, as its struct may point into reused memory
+        event = _tracking_event_data(frame, ffi.NULL, num_hands)
+        self._file.write(ffi.buffer(event))
+        self._file.write(ffi.buffer(frame._hands, num_hands * _HAND_SIZE))
+        self._file.write(self._no_hands[: (2 - num_hands) * _HAND_SIZE])
+        self._count += 1
+
+    def on_tracking_event(self, event):
+        self.write(event)
+
+    def close(self):
+        self._file.close()
+
+
+class FrameLog:
+    """Reads a frame log through a copy-on-write memory map
+
+    Frames are returned as TrackingEvents which view the mapped file, so no frame data is
+    copied. Writing to the events or arrays, eg. through `TrackingEvent.as_numpy`, only
+    changes this process's copy of the pages, never the file. The events, their hands, and the arrays returned by `as_numpy` each keep the
+    map alive, so they remain valid after the log is closed. The map itself is only
+    unmapped once none of them are left.
+
+    Example:
+    ```
+    with FrameLog("session.lfl") as log:
+        for event in log:
+            print(event.tracking_frame_id, len(event.hands))
+    ```
+
+    :param fpath: The path of the frame log to read.
+    """
+
+    def __init__(self, fpath: str):
+        with open(fpath, "rb") as fp:
+            header = fp.read(_HEADER_SIZE)
+            if len(header) < _HEADER_SIZE or header[:8] != _MAGIC:
+                raise ValueError(f"{fpath} is not a frame log")
+            version = _HEADER.unpack_from(header)[1]
+            if version != _VERSION:
+                raise ValueError(f"Unsupported frame log version {version}")
+            _, _, header_size, event_size, hand_size, _, layout = _HEADER.unpack_from(header)
+            if (event_size, hand_size, layout) != (_EVENT_SIZE, _HAND_SIZE, _LAYOUT):
+                raise ValueError("The frame log was written with a different LeapC struct layout")
+
+            fp.seek(0, 2)
+            self._count = (fp.tell() - header_size) // RECORD_SIZE
+            self._header_size = header_size
+            self._mmap = (
+                mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_COPY) if self._count else None
+            )
+
+        self._view = memoryview(self._mmap) if self._mmap is not None else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index: int) -> TrackingEvent:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Frame index out of range")
+        if self._view is None:
+            raise ValueError("The frame log is closed")
+        # CData from ffi.from_buffer keeps the map alive, unlike pointers cast into it
+        offset = self._header_size + index * RECORD_SIZE
+        hands_offset = offset + _EVENT_SIZE
+        data = ffi.from_buffer("LEAP_TRACKING_EVENT*", self._view[offset:hands_offset])
+        hands = ffi.from_buffer("LEAP_HAND[]", self._view[hands_offset : offset + RECORD_SIZE])
+        return TrackingEvent(data, hands=hands)
+
+    def __iter__(self) -> Iterator[TrackingEvent]:
+        for index in range(self._count):
+            yield self[index]
+
+    def as_numpy(self):
+        """Get (events, hands) structured arrays which view every record in the log
+
+        'events' has one LEAP_TRACKING_EVENT per frame, and 'hands' has two LEAP_HANDs per
+        frame, the unused ones zeroed. Use `leap.arrays.tracking_columns` to extract
+        columns from them.
+
+        Requires NumPy.
+        """
+        import numpy as np
+
+        from .arrays import HAND_DTYPE, TRACKING_EVENT_DTYPE
+
+        dtype = np.dtype(
+            {
+                "names": ["event", "hands"],
+                "formats": [TRACKING_EVENT_DTYPE, (HAND_DTYPE, 2)],
+                "offsets": [0, _EVENT_SIZE],
+                "itemsize": RECORD_SIZE,
+            }
+        )
+        if self._count == 0:
+            records = np.zeros(0, dtype=dtype)
+        elif self._view is None:
+            raise ValueError("The frame log is closed")
+        else:
+            records = np.frombuffer(
+                self._mmap, dtype=dtype, count=self._count, offset=self._header_size
+            )
+        return records["event"], records["hands"]
+
+    def close(self):
+        """Close the log
+
+        Events and arrays already read from it remain valid, and the map is unmapped once
+        they have all been released.
+        """
+        if self._mmap is None:
+            return
+        self._view = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Events or arrays still view the map, which is unmapped when they are released
+            pass
+        self._mmap = None
@@ -1,12 +1,17 @@
 """Wrap around LeapC functions"""
+
 import leap.enums
 
 from .enums import PerspectiveType
-from .connection import Connection
 from .exceptions import success_or_raise
 from leapc_cffi import ffi, libleapc
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Only imported for annotations, so that the functions can be used without importing
+    # the connection machinery
+    from .connection import Connection
 
 
 def get_now() -> int:
@@ -39,7 +44,7 @@ def get_server_status(timeout: float) -> Dict[str, Optional[List[Dict[str, str]]
 
 
 def get_frame_size(
-    connection: Connection, target_frame_time: ffi.CData, target_frame_size: ffi.CData
+    connection: "Connection", target_frame_time: ffi.CData, target_frame_size: ffi.CData
 ) -> None:
     success_or_raise(
         libleapc.LeapGetFrameSize,
@@ -50,7 +55,7 @@ def get_frame_size(
 
 
 def interpolate_frame(
-    connection: Connection,
+    connection: "Connection",
     target_frame_time: ffi.CData,
     frame_ptr: ffi.CData,
     frame_size: ffi.CData,
@@ -64,7 +69,7 @@ def interpolate_frame(
     )
 
 
-def get_extrinsic_matrix(connection: Connection, camera: PerspectiveType) -> ffi.CData:
+def get_extrinsic_matrix(connection: "Connection", camera: PerspectiveType) -> ffi.CData:
     matrix = ffi.new("float[]", 16)
     libleapc.LeapExtrinsicCameraMatrix(connection.get_connection_ptr(), camera.value, matrix)
     return matrix
@@ -0,0 +1,390 @@
+"""Declarative gesture recognition over per-hand feature vectors
+
+A Gesture is a set of Conditions on the features from `leap.features`, plus timing rules.
+Each gesture is a small state machine for each hand:
+
+    idle -> pending: every condition holds, and the gesture is not cooling down
+    pending -> active: the conditions have held for 'min_duration'. A Start event is sent.
+    pending -> idle: a condition stopped holding before 'min_duration'
+    active -> idle: a condition stopped holding, or the hand was lost. An End event is sent,
+        and the gesture cannot become pending again for 'cooldown' seconds.
+
+While a gesture is active its conditions are widened by their 'hysteresis', so values close
+to a threshold do not make it flicker between active and idle.
+
+The conditions of every registered gesture are compiled into arrays, and all of them are
+evaluated together for each hand, so the cost of a frame grows very little as gestures are
+added. Python code only runs for the gestures which change state.
+
+Example:
+```
+class PrintGestures(GestureListener):
+    def on_gesture_start(self, event):
+        print(event.gesture, "started on hand", event.hand_id)
+
+engine = GestureEngine(
+    [
+        Gesture(
+            "pinch",
+            [below("thumb_index_distance", 30, hysteresis=10), above("extended_count", 3.5)],
+            min_duration=0.05,
+        ),
+        Gesture("fist", [below("extended_count", 0.5)], cooldown=0.5),
+    ]
+)
+engine.add_listener(PrintGestures())
+connection.add_listener(engine)
+```
+
+NumPy is an optional dependency, only required by this module.
+"""
+
+import enum
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .enums import HandType
+from .event_listener import Listener
+from .features import FEATURE_INDEX, FeatureExtractor
+
+_IDLE = 0
+_PENDING = 1
+_ACTIVE = 2
+
+
+class Condition:
+    """A range which a feature must be within
+
+    :param feature: The name of the feature, from `leap.features.FEATURE_NAMES`.
+    :param low: The lowest value which satisfies the condition. Defaults to no limit.
+    :param high: The highest value which satisfies the condition. Defaults to no limit.
+    :param hysteresis: How far the range is widened, at both ends, while the gesture is
+        active. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        feature: str,
+        low: float = -math.inf,
+        high: float = math.inf,
+        hysteresis: float = 0.0,
+    ):
+        if feature not in FEATURE_INDEX:
+            raise ValueError(f"Unknown feature {feature!r}")
+        if hysteresis < 0:
+            raise ValueError("Hysteresis cannot be negative")
+        self.feature = feature
+        self.low = low
+        self.high = high
+        self.hysteresis = hysteresis
+
+    def __repr__(self):
+        return (
+            f"Condition({self.feature!r}, low={self.low}, high={self.high}, "
+            f"hysteresis={self.hysteresis})"
+        )
+
+
+def above(feature: str, threshold: float, hysteresis: float = 0.0) -> Condition:
+    """A condition which holds while the feature is at least the threshold"""
+    return Condition(feature, low=threshold, hysteresis=hysteresis)
+
+
+def below(feature: str, threshold: float, hysteresis: float = 0.0) -> Condition:
+    """A condition which holds while the feature is at most the threshold"""
+    return Condition(feature, high=threshold, hysteresis=hysteresis)
+
+
+class Gesture:
+    """A named gesture, which is made when all of its conditions hold
+
+    :param name: The name of the gesture, which must be unique within an engine.
+    :param conditions: The conditions which must all hold.
+    :param min_duration: How long the conditions must hold before the gesture starts, in
+        seconds. Defaults to 0.
+    :param cooldown: How long after the gesture ends before it can start again, in seconds.
+        Defaults to 0.
+    :param hand_type: Only detect the gesture on this type of hand. Defaults to either.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        conditions: Sequence[Condition],
+        *,
+        min_duration: float = 0.0,
+        cooldown: float = 0.0,
+        hand_type: Optional[HandType] = None,
+    ):
+        if not conditions:
+            raise ValueError("A gesture needs at least one condition")
+        self.name = name
+        self.conditions = tuple(conditions)
+        self.min_duration = min_duration
+        self.cooldown = cooldown
+        self.hand_type = hand_type
+
+
+class GesturePhase(enum.Enum):
+    Start = "start"
+    End = "end"
+
+
+class GestureEvent:
+    """A gesture starting or ending on a hand
+
+    :param gesture: The name of the gesture.
+    :param phase: Whether the gesture started or ended.
+    :param hand_id: The id of the hand.
+    :param hand_type: The type of the hand.
+    :param timestamp: The timestamp of the frame, in microseconds.
+    :param features: The feature vector of the hand in that frame. None if the gesture
+        ended because the hand was lost.
+    """
+
+    __slots__ = ("gesture", "phase", "hand_id", "hand_type", "timestamp", "features")
+
+    def __init__(
+        self,
+        gesture: str,
+        phase: GesturePhase,
+        hand_id: int,
+        hand_type: HandType,
+        timestamp: int,
+        features: Optional[np.ndarray],
+    ):
+        self.gesture = gesture
+        self.phase = phase
+        self.hand_id = hand_id
+        self.hand_type = hand_type
+        self.timestamp = timestamp
+        self.features = features
+
+    def __repr__(self):
+        return (
+            f"GestureEvent({self.gesture!r}, {self.phase.name}, hand_id={self.hand_id}, "
+            f"timestamp={self.timestamp})"
+        )
+
+
+class GestureListener:
+    """Base class for listeners to a GestureEngine
+
+    Override the methods for the events of interest. They are called on the thread which
+    delivers tracking events to the engine.
+    """
+
+    def on_gesture_start(self, event: GestureEvent):
+        pass
+
+    def on_gesture_end(self, event: GestureEvent):
+        pass
+
+
+class _HandState:
+    """The state of every gesture for one hand"""
+
+    __slots__ = ("hand_type", "visible_time", "state", "since", "ready_at")
+
+    def __init__(self, hand_type: int, num_gestures: int):
+        self.hand_type = hand_type
+        self.visible_time = 0
+        self.state = np.full(num_gestures, _IDLE, dtype=np.int8)
+        # The time at which each gesture entered its state, and from which it may start again
+        self.since = np.zeros(num_gestures, dtype=np.int64)
+        self.ready_at = np.zeros(num_gestures, dtype=np.int64)
+
+
+class GestureEngine(Listener):
+    """Detects gestures on every hand, and notifies GestureListeners
+
+    As a Listener it computes the features of each tracking event and updates the gestures
+    of each hand. Hands are identified by their id and type, as in `leap.tracker`, so each
+    hand in a frame has its own gesture state. A hand whose `visible_time` has gone
+    backwards was lost and its id reused, so its gestures are ended and its state reset.
+    `update` can also be called directly, eg. with recorded features.
+
+    :param gestures: The gestures to detect. More can be added with `add_gesture`.
+    :param extractor: The FeatureExtractor used for tracking events. Defaults to one with
+        the default interaction box.
+    """
+
+    def __init__(
+        self,
+        gestures: Sequence[Gesture] = (),
+        extractor: Optional[FeatureExtractor] = None,
+    ):
+        self._extractor = extractor if extractor is not None else FeatureExtractor()
+        self._gestures: List[Gesture] = []
+        self._listeners: List[GestureListener] = []
+        self._hands: Dict[Tuple[int, int], _HandState] = {}
+        for gesture in gestures:
+            self.add_gesture(gesture)
+
+    def add_gesture(self, gesture: Gesture):
+        """Add a gesture to detect. Gestures in progress are reset."""
+        if any(existing.name == gesture.name for existing in self._gestures):
+            raise ValueError(f"A gesture named {gesture.name!r} has already been added")
+        self._gestures.append(gesture)
+        self._compile()
+
+    def remove_gesture(self, name: str):
+        """Stop detecting the named gesture. Gestures in progress are reset."""
+        self._gestures = [gesture for gesture in self._gestures if gesture.name != name]
+        self._compile()
+
+    @property
+    def gestures(self) -> List[Gesture]:
+        return list(self._gestures)
+
+    def add_listener(self, listener: GestureListener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: GestureListener):
+        self._listeners.remove(listener)
+
+    def _compile(self):
+        """Flatten the conditions of every gesture into arrays, grouped by gesture"""
+        conditions = [condition for gesture in self._gestures for condition in gesture.conditions]
+        self._feature_index = np.array(
+            [FEATURE_INDEX[condition.feature] for condition in conditions], dtype=np.intp
+        )
+        self._low = np.array([condition.low for condition in conditions], dtype=np.float32)
+        self._high = np.array([condition.high for condition in conditions], dtype=np.float32)
+        hysteresis = np.array([condition.hysteresis for condition in conditions], dtype=np.float32)
+        self._active_low = self._low - hysteresis
+        self._active_high = self._high + hysteresis
+
+        counts = [len(gesture.conditions) for gesture in self._gestures]
+        self._gesture_of_condition = np.repeat(np.arange(len(counts)), counts)
+        self._first_condition = np.cumsum([0] + counts[:-1]).astype(np.intp)
+
+        self._min_duration = np.array(
+            [round(gesture.min_duration * 1e6) for gesture in self._gestures], dtype=np.int64
+        )
+        self._cooldown = np.array(
+            [round(gesture.cooldown * 1e6) for gesture in self._gestures], dtype=np.int64
+        )
+        self._hand_type = np.array(
+            [
+                -1 if gesture.hand_type is None else gesture.hand_type.value
+                for gesture in self._gestures
+            ],
+            dtype=np.int64,
+        )
+        self._names = [gesture.name for gesture in self._gestures]
+        self._hands = {}
+
+    def active(self, hand_id: int) -> List[str]:
+        """Get the names of the gestures which are active on the hand"""
+        for (tracked_id, _), hand in self._hands.items():
+            if tracked_id == hand_id:
+                return [self._names[index] for index in np.flatnonzero(hand.state == _ACTIVE)]
+        return []
+
+    def on_tracking_event(self, event):
+        hands = event.as_numpy()
+        self.update(
+            self._extractor.from_hands(hands),
+            hands["id"],
+            hands["type"],
+            event.timestamp,
+            hands["visible_time"],
+        )
+
+    def update(
+        self,
+        features: np.ndarray,
+        hand_ids: Sequence[int],
+        hand_types: Sequence[int],
+        timestamp: int,
+        visible_times: Optional[Sequence[int]] = None,
+    ):
+        """Update the gestures with the hands in a frame
+
+        Gestures on hands which are not in the frame are ended.
+
+        :param features: A (hands, NUM_FEATURES) array of feature vectors.
+        :param hand_ids: The id of each hand.
+        :param hand_types: The HandType value of each hand.
+        :param timestamp: The timestamp of the frame, in microseconds.
+        :param visible_times: How long each hand has been visible, in microseconds. Gestures
+            on a hand whose visible time has gone backwards are ended and reset. Defaults to
+            None, which does not check.
+        """
+        if not self._gestures:
+            return
+
+        previous = self._hands
+        self._hands = {}
+        for row, (hand_id, hand_type) in enumerate(zip(hand_ids, hand_types)):
+            key = (int(hand_id), int(hand_type))
+            visible_time = None if visible_times is None else int(visible_times[row])
+            hand = previous.pop(key, None)
+            if hand is not None and visible_time is not None and visible_time < hand.visible_time:
+                # The hand was lost and its id reused between frames
+                self._end_lost(key[0], hand, timestamp)
+                hand = None
+            if hand is None:
+                hand = _HandState(key[1], len(self._names))
+            if visible_time is not None:
+                hand.visible_time = visible_time
+            self._hands[key] = hand
+            self._update_hand(key[0], hand, features[row], timestamp)
+
+        for (hand_id, _), hand in previous.items():
+            self._end_lost(hand_id, hand, timestamp)
+
+    def _end_lost(self, hand_id: int, hand: _HandState, timestamp: int):
+        for index in np.flatnonzero(hand.state == _ACTIVE):
+            self._notify(GesturePhase.End, index, hand_id, hand, timestamp, None)
+
+    def _update_hand(self, hand_id: int, hand: _HandState, features: np.ndarray, timestamp: int):
+        state = hand.state
+        active = state == _ACTIVE
+
+        # Evaluate every condition at once, using the widened ranges of active gestures
+        values = features[self._feature_index]
+        active_condition = active[self._gesture_of_condition]
+        low = np.where(active_condition, self._active_low, self._low)
+        high = np.where(active_condition, self._active_high, self._high)
+        holds = (values >= low) & (values <= high)
+        satisfied = np.logical_and.reduceat(holds, self._first_condition)
+        satisfied &= (self._hand_type < 0) | (self._hand_type == hand.hand_type)
+
+        entering = (state == _IDLE) & satisfied & (timestamp >= hand.ready_at)
+        hand.since[entering] = timestamp
+        state[entering] = _PENDING
+
+        pending = state == _PENDING
+        state[pending & ~satisfied] = _IDLE
+        starting = pending & satisfied & (timestamp - hand.since >= self._min_duration)
+        ending = active & ~satisfied
+
+        if starting.any():
+            state[starting] = _ACTIVE
+            hand.since[starting] = timestamp
+            for index in np.flatnonzero(starting):
+                self._notify(GesturePhase.Start, index, hand_id, hand, timestamp, features)
+        if ending.any():
+            state[ending] = _IDLE
+            hand.ready_at[ending] = timestamp + self._cooldown[ending]
+            for index in np.flatnonzero(ending):
+                self._notify(GesturePhase.End, index, hand_id, hand, timestamp, features)
+
+    def _notify(self, phase, index, hand_id, hand, timestamp, features):
+        event = GestureEvent(
+            self._names[index],
+            phase,
+            hand_id,
+            HandType(hand.hand_type),
+            timestamp,
+            None if features is None else features.copy(),
+        )
+        for listener in self._listeners:
+            if phase is GesturePhase.Start:
+                listener.on_gesture_start(event)
+            else:
+                listener.on_gesture_end(event)
@@ -0,0 +1,184 @@
+"""Fixed-size ring buffers of timestamped samples, with windowed statistics
+
+A History holds the most recent samples of one or more named fields, such as a hand's palm
+position and velocity, in preallocated NumPy arrays. Pushing a sample overwrites the oldest
+in place, so it is O(1) and never allocates. The statistics are computed over the whole
+window or only the most recent samples. When the window is the whole buffer they read the
+arrays directly, without first copying them into chronological order.
+
+Each hand tracked by a `leap.tracker.HandTracker` has a History, as `TrackedHand.history`.
+
+Example:
+```
+history = History(5, {"palm_velocity": (3,)})
+for event in frames:
+    history.push(event.timestamp, palm_velocity_of(event))
+    average_velocity = history.mean("palm_velocity")
+```
+
+NumPy is an optional dependency, only required by this module.
+"""
+
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+
+class History:
+    """The most recent samples of some fields, in a circular buffer
+
+    Statistics which take a 'count' use only the most recent 'count' samples, or every
+    sample held if it is None, and always at least one. Timestamps are in microseconds,
+    like LeapC timestamps, and rates of change are per second. The latest value and the
+    statistics raise a ValueError if the history is empty.
+
+    :param capacity: The number of samples to keep.
+    :param fields: The name and shape of each field, eg. {"palm_position": (3,)}.
+    :param dtype: The dtype of the fields. Defaults to float32.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        fields: Dict[str, Tuple[int, ...]],
+        dtype: Union[np.dtype, type] = np.float32,
+    ):
+        if capacity < 1:
+            raise ValueError("The history must hold at least one sample")
+        self._capacity = capacity
+        self._count = 0
+        # The row which the next sample is written to
+        self._head = 0
+        self._timestamps = np.zeros(capacity, dtype=np.int64)
+        self._fields = {
+            name: np.zeros((capacity,) + tuple(shape), dtype=dtype)
+            for name, shape in fields.items()
+        }
+        self._arrays = tuple(self._fields.values())
+        self._rows = np.arange(capacity)
+
+    def __len__(self):
+        """The number of samples held"""
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(self._fields)
+
+    def push(self, timestamp: int, *values):
+        """Add a sample, replacing the oldest if the history is full
+
+        :param timestamp: The time of the sample, in microseconds.
+        :param values: The value of each field, in the order they were given.
+        """
+        head = self._head
+        self._timestamps[head] = timestamp
+        for array, value in zip(self._arrays, values):
+            array[head] = value
+        self._head = head + 1 if head + 1 < self._capacity else 0
+        if self._count < self._capacity:
+            self._count += 1
+
+    def clear(self):
+        """Remove every sample. The buffers are kept for reuse."""
+        self._count = 0
+        self._head = 0
+
+    def _check_not_empty(self):
+        if self._count == 0:
+            raise ValueError("The history is empty")
+
+    def _window(self, count: Optional[int]) -> Union[slice, np.ndarray]:
+        """Get an index of the rows holding the most recent 'count' samples, in any order
+
+        The window holds at least one sample. The whole window is indexed with a slice, so
+        that indexing with it gives a view.
+        """
+        self._check_not_empty()
+        if count is None or count >= self._count:
+            return slice(0, self._count)
+        return self._ordered(max(1, count))
+
+    def _ordered(self, count: Optional[int]) -> np.ndarray:
+        """Get the rows holding the most recent 'count' samples, oldest first"""
+        count = self._count if count is None else max(0, min(count, self._count))
+        return np.arange(self._head - count, self._head) % self._capacity
+
+    def latest(self, field: str) -> np.ndarray:
+        """Get a view of the most recent value of the field"""
+        self._check_not_empty()
+        return self._fields[field][self._head - 1]
+
+    @property
+    def timestamp(self) -> int:
+        """The timestamp of the most recent sample, in microseconds"""
+        self._check_not_empty()
+        return int(self._timestamps[self._head - 1])
+
+    def timestamps(self, count: Optional[int] = None) -> np.ndarray:
+        """Get a copy of the timestamps of the recent samples, oldest first"""
+        return self._timestamps[self._ordered(count)]
+
+    def values(self, field: str, count: Optional[int] = None) -> np.ndarray:
+        """Get a copy of the recent values of the field, oldest first"""
+        return self._fields[field][self._ordered(count)]
+
+    def mean(self, field: str, count: Optional[int] = None) -> np.ndarray:
+        """Get the mean of the recent values of the field"""
+        return self._fields[field][self._window(count)].mean(axis=0)
+
+    def min(self, field: str, count: Optional[int] = None) -> np.ndarray:
+        """Get the elementwise minimum of the recent values of the field"""
+        return self._fields[field][self._window(count)].min(axis=0)
+
+    def max(self, field: str, count: Optional[int] = None) -> np.ndarray:
+        """Get the elementwise maximum of the recent values of the field"""
+        return self._fields[field][self._window(count)].max(axis=0)
+
+    def ema(self, field: str, alpha: float, count: Optional[int] = None) -> np.ndarray:
+        """Get the exponential moving average of the recent values of the field
+
+        Each sample is weighted by (1 - alpha) ** age, where the most recent sample has an
+        age of 0, and the weights are normalised to sum to 1.
+
+        :param alpha: The smoothing factor, from 0 to 1. Larger values follow the most
+            recent samples more closely.
+        """
+        self._check_not_empty()
+        count = self._count if count is None else max(1, min(count, self._count))
+        ages = (self._head - 1 - self._rows) % self._capacity
+        weights = np.where(ages < count, (1.0 - alpha) ** ages, 0.0)
+        weights /= weights.sum()
+        return np.tensordot(weights, self._fields[field], axes=1).astype(self._fields[field].dtype)
+
+    def velocity(self, field: str) -> np.ndarray:
+        """Get the rate of change of the field between the two most recent samples
+
+        Zero until there are two samples.
+        """
+        array = self._fields[field]
+        if self._count < 2:
+            return np.zeros_like(array[0])
+        head = self._head
+        dt = (self._timestamps[head - 1] - self._timestamps[head - 2]) / 1e6
+        return (array[head - 1] - array[head - 2]) / max(dt, 1e-9)
+
+    def acceleration(self, field: str) -> np.ndarray:
+        """Get the rate of change of the velocity of the field over the three most recent
+        samples
+
+        Zero until there are three samples.
+        """
+        array = self._fields[field]
+        if self._count < 3:
+            return np.zeros_like(array[0])
+        head = self._head
+        t0, t1, t2 = self._timestamps[[head - 3, head - 2, head - 1]] / 1e6
+        dt1, dt2 = max(t1 - t0, 1e-9), max(t2 - t1, 1e-9)
+        v1 = (array[head - 2] - array[head - 3]) / dt1
+        v2 = (array[head - 1] - array[head - 2]) / dt2
+        return (v2 - v1) / ((dt1 + dt2) / 2)
@@ -0,0 +1,169 @@
+"""Latency-compensated hands from LeapC frame interpolation
+
+LeapC can interpolate, or extrapolate, the tracking frame at any time near the present.
+The Interpolator wraps `get_frame_size` and `interpolate_frame` for render loops, which ask
+for a frame every display refresh. It reuses one frame buffer, which grows as needed, and
+caches the frame size for each number of hands, so that a prediction usually takes a
+single LeapC call. With `predict(copy=False)` it also allocates no C memory for the hands.
+
+Example:
+```
+interpolator = connection.interpolator()
+with connection.open():
+    while rendering:
+        event = interpolator.predict()
+        draw(event.hands)
+```
+"""
+
+from typing import Dict, Optional, TYPE_CHECKING
+
+from leapc_cffi import ffi
+
+from .event_listener import Listener
+from .events import TrackingEvent
+from .exceptions import LeapInsufficientBufferError
+from .functions import get_frame_size, get_now, interpolate_frame
+
+if TYPE_CHECKING:
+    from .connection import Connection
+
+
+class Interpolator(Listener):
+    """Predicts the hands at a given time, reusing one frame buffer
+
+    As a Listener it estimates the latency of tracking frames: the time between a frame's
+    timestamp and its delivery, measured with `get_now`. `Connection.interpolator` creates
+    an Interpolator which is already added to the connection.
+
+    The events returned by `predict` own a copy of the frame by default. With `copy=False`
+    they view the interpolator's buffer instead, so their hands are overwritten by the next
+    prediction, though the buffer stays allocated for as long as they are used.
+
+    :param connection: The connection to interpolate frames from.
+    :param latency_offset: How far after the current time to predict by default, in
+        seconds, eg. the time until the next frame is displayed. Defaults to None, which
+        uses the estimated latency of tracking frames.
+    :param smoothing: The weight of each new latency measurement in the estimate, from 0
+        to 1. Defaults to 0.1.
+    """
+
+    def __init__(
+        self,
+        connection: "Connection",
+        *,
+        latency_offset: Optional[float] = None,
+        smoothing: float = 0.1,
+    ):
+        self._connection = connection
+        self._latency_offset = None if latency_offset is None else round(latency_offset * 1e6)
+        self._smoothing = smoothing
+        self._estimated_latency: Optional[float] = None
+
+        self._buffer = None
+        self._view = None
+        self._capacity = 0
+        self._frame_ptr = None
+        self._frame_time = ffi.new("int64_t*")
+        self._frame_size = ffi.new("uint64_t*")
+        # The size of an interpolated frame, for each number of hands it has
+        self._frame_sizes: Dict[int, int] = {}
+        self._num_hands = 0
+
+    def on_tracking_event(self, event):
+        # Events queued for a dispatcher were stamped when they were polled, so the time
+        # they spent queued is not counted
+        received = event._poll_time
+        if received is None:
+            received = get_now()
+        latency = received - event.timestamp
+        if self._estimated_latency is None:
+            self._estimated_latency = latency
+        else:
+            self._estimated_latency += self._smoothing * (latency - self._estimated_latency)
+        self._num_hands = event._num_hands
+
+    @property
+    def estimated_latency(self) -> Optional[float]:
+        """The estimated delay between a frame's timestamp and its delivery, in seconds
+
+        None until a tracking event has been received.
+        """
+        if self._estimated_latency is None:
+            return None
+        return self._estimated_latency / 1e6
+
+    @property
+    def latency_offset(self) -> float:
+        """The offset from the current time used by `predict`, in seconds"""
+        if self._latency_offset is not None:
+            return self._latency_offset / 1e6
+        return self.estimated_latency or 0.0
+
+    def predict(self, timestamp: Optional[int] = None, *, copy: bool = True) -> TrackingEvent:
+        """Get the frame interpolated to a time
+
+        :param timestamp: The time to predict the hands at, in microseconds on the LeapC
+            clock. Defaults to `get_now()` plus the latency offset.
+        :param copy: Whether to return an event which owns a copy of the frame. Defaults to
+            True. If False, the event views the buffer, which saves copying the hands, but
+            they are overwritten by the next call.
+        """
+        if timestamp is None:
+            offset = self._latency_offset
+            if offset is None:
+                offset = round(self._estimated_latency or 0)
+            timestamp = get_now() + offset
+
+        queried_size = None
+        size = self._frame_sizes.get(self._num_hands)
+        if size is None:
+            size = queried_size = self._query_frame_size(timestamp)
+        self._reserve(size)
+        try:
+            interpolate_frame(self._connection, timestamp, self._frame_ptr, self._capacity)
+        except LeapInsufficientBufferError:
+            # The number of hands changed since the last frame, so the cached size is too small
+            size = queried_size = self._query_frame_size(timestamp)
+            self._reserve(size)
+            interpolate_frame(self._connection, timestamp, self._frame_ptr, self._capacity)
+
+        frame = self._frame_ptr
+        self._num_hands = frame.nHands
+        if queried_size is not None:
+            self._frame_sizes[self._num_hands] = queried_size
+        if copy:
+            # The event copies the hands, and its struct is pointed at that copy rather than
+            # at the hands in the buffer
+            data = ffi.new("LEAP_TRACKING_EVENT*", frame[0])
+            event = TrackingEvent(data)
+            data.pHands = event._hands
+            return event
+        return TrackingEvent(frame, hands=self._hands_view(frame))
+
+    def _query_frame_size(self, timestamp: int) -> int:
+        self._frame_time[0] = timestamp
+        get_frame_size(self._connection, self._frame_time, self._frame_size)
+        return self._frame_size[0]
+
+    def _hands_view(self, frame):
+        """Get the hands LeapC wrote into the buffer, as a pointer which keeps it alive"""
+        if frame.nHands == 0:
+            return ffi.from_buffer("LEAP_HAND[]", self._view[:0])
+        offset = int(ffi.cast("uintptr_t", frame.pHands)) - int(ffi.cast("uintptr_t", frame))
+        size = ffi.sizeof("LEAP_HAND") * frame.nHands
+        return ffi.from_buffer("LEAP_HAND[]", self._view[offset : offset + size])
+
+    def _reserve(self, size: int):
+        """Grow the frame buffer to at least 'size' bytes
+
+        Events which view the previous buffer keep it alive, so it is not freed here.
+        """
+        if size <= self._capacity:
+            return
+        capacity = max(size, 2 * self._capacity)
+        self._buffer = ffi.new("char[]", capacity)
+        self._view = memoryview(ffi.buffer(self._buffer))
+        # Created from the view, so that the frame and events using it keep the buffer alive
+        self._frame_ptr = ffi.from_buffer("LEAP_TRACKING_EVENT*", self._view)
+        self._capacity = capacity
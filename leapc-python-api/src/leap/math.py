@@ -0,0 +1,157 @@
+"""Vectorised vector and quaternion maths for hand data
+
+Every function takes either wrappers from `datatypes` (a Vector, Quaternion or Bone, or a
+list of them) or NumPy arrays, such as the views returned by `leap.arrays`. The last axis
+holds the components, and any leading axes are broadcast, so a whole frame can be
+processed in a single call. Eg. the distance from each thumb tip to each index tip is
+`distance(tips[:, 0], tips[:, 1])` where `tips = fingertip_positions(event.as_numpy())`.
+
+Quaternions use the LeapC component order (x, y, z, w).
+
+NumPy is an optional dependency, only required by this module.
+"""
+
+from typing import Union
+
+import numpy as np
+
+from .datatypes import Bone, Quaternion, Vector
+
+ArrayLike = Union[np.ndarray, Vector, Quaternion, Bone, list, tuple]
+
+_EPSILON = 1e-9
+
+
+def as_array(value: ArrayLike) -> np.ndarray:
+    """Convert wrappers, or lists of wrappers, to a floating point array
+
+    A Vector becomes shape (3,), a Quaternion (4,) and a Bone (2, 3) holding its previous
+    and next joints. Arrays are returned without copying where possible.
+    """
+    if isinstance(value, (Vector, Quaternion)):
+        return np.array(list(value._data.v), dtype=np.float32)
+    if isinstance(value, Bone):
+        return np.array(
+            (list(value._data.prev_joint.v), list(value._data.next_joint.v)), dtype=np.float32
+        )
+    if isinstance(value, (list, tuple)) and value and not np.isscalar(value[0]):
+        return np.stack([as_array(item) for item in value])
+    array = np.asarray(value)
+    if not np.issubdtype(array.dtype, np.floating):
+        array = array.astype(np.float64)
+    return array
+
+
+def dot(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """Get the dot products of the vectors along the last axis"""
+    return np.einsum("...i,...i->...", as_array(a), as_array(b))
+
+
+def norm(v: ArrayLike) -> np.ndarray:
+    """Get the lengths of the vectors"""
+    return np.linalg.norm(as_array(v), axis=-1)
+
+
+def distance(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """Get the Euclidean distances between points, in the units of the inputs (mm)"""
+    return np.linalg.norm(as_array(a) - as_array(b), axis=-1)
+
+
+def normalize(v: ArrayLike) -> np.ndarray:
+    """Get unit vectors in the directions of the vectors
+
+    Zero length vectors are returned unchanged.
+    """
+    v = as_array(v)
+    length = np.linalg.norm(v, axis=-1, keepdims=True)
+    return v / np.maximum(length, _EPSILON)
+
+
+def angle_between(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """Get the angles between the vectors, in radians"""
+    a, b = as_array(a), as_array(b)
+    # atan2 of the cross and dot products is accurate for small and near-opposite angles
+    cross = np.linalg.norm(np.cross(a, b), axis=-1)
+    return np.arctan2(cross, np.einsum("...i,...i->...", a, b))
+
+
+def bone_directions(bones: ArrayLike) -> np.ndarray:
+    """Get the unit direction of each bone, from its previous joint to its next joint
+
+    :param bones: Bones, or an array of shape (..., 2, 3) of previous and next joints.
+    """
+    bones = as_array(bones)
+    return normalize(bones[..., 1, :] - bones[..., 0, :])
+
+
+def angle_between_bones(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """Get the angles between the directions of the bones, in radians
+
+    :param a: Bones, or an array of shape (..., 2, 3) of previous and next joints.
+    :param b: Bones, or an array of shape (..., 2, 3) of previous and next joints.
+    """
+    return angle_between(bone_directions(a), bone_directions(b))
+
+
+def joint_angles(joints: ArrayLike) -> np.ndarray:
+    """Get the bend at each inner joint of chains of joints, in radians
+
+    For the (hands, 5, 5, 3) array from `leap.arrays.joint_positions` this returns a
+    (hands, 5, 3) array of the bend of each digit at its three inner joints. A straight
+    digit has angles of zero.
+
+    :param joints: An array of shape (..., joints, 3).
+    """
+    joints = as_array(joints)
+    segments = np.diff(joints, axis=-2)
+    return angle_between(segments[..., :-1, :], segments[..., 1:, :])
+
+
+def quaternion_multiply(q: ArrayLike, r: ArrayLike) -> np.ndarray:
+    """Get the Hamilton products q * r of the quaternions"""
+    q, r = as_array(q), as_array(r)
+    qx, qy, qz, qw = np.moveaxis(q, -1, 0)
+    rx, ry, rz, rw = np.moveaxis(r, -1, 0)
+    return np.stack(
+        (
+            qw * rx + qx * rw + qy * rz - qz * ry,
+            qw * ry - qx * rz + qy * rw + qz * rx,
+            qw * rz + qx * ry - qy * rx + qz * rw,
+            qw * rw - qx * rx - qy * ry - qz * rz,
+        ),
+        axis=-1,
+    )
+
+
+def rotate(q: ArrayLike, v: ArrayLike) -> np.ndarray:
+    """Rotate the vectors by the unit quaternions"""
+    q, v = as_array(q), as_array(v)
+    u, w = q[..., :3], q[..., 3:]
+    # v' = v + 2w(u x v) + 2u x (u x v)
+    t = 2.0 * np.cross(u, v)
+    return v + w * t + np.cross(u, t)
+
+
+def slerp(q0: ArrayLike, q1: ArrayLike, t: Union[float, np.ndarray]) -> np.ndarray:
+    """Spherically interpolate between unit quaternions
+
+    Takes the shortest path, and falls back to a normalised linear interpolation when the
+    quaternions are nearly equal.
+
+    :param t: The interpolation parameter, where 0 gives q0 and 1 gives q1. Broadcast
+        against the leading axes of the quaternions.
+    """
+    q0, q1 = as_array(q0), as_array(q1)
+    t = np.asarray(t, dtype=q0.dtype)[..., np.newaxis]
+    cos_theta = np.einsum("...i,...i->...", q0, q1)[..., np.newaxis]
+    # q and -q are the same rotation, so interpolate towards the nearer one
+    q1 = np.where(cos_theta < 0, -q1, q1)
+    cos_theta = np.abs(cos_theta)
+
+    theta = np.arccos(np.clip(cos_theta, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+    nearly_equal = sin_theta < 1e-6
+    safe_sin = np.where(nearly_equal, 1.0, sin_theta)
+    w0 = np.where(nearly_equal, 1.0 - t, np.sin((1.0 - t) * theta) / safe_sin)
+    w1 = np.where(nearly_equal, t, np.sin(t * theta) / safe_sin)
+    return normalize(w0 * q0 + w1 * q1)
@@ -0,0 +1,75 @@
+"""Preallocated buffers for the hands of TrackingEvents"""
+
+from collections import deque
+
+from leapc_cffi import ffi
+
+
+class HandBuffer:
+    """A LEAP_HAND[2] buffer borrowed from a HandBufferPool
+
+    `hands` is returned to the pool once nothing references it. It is referenced by this
+    object until `release` is called, and by every Hand wrapper and NumPy array created
+    from it, so a buffer is never reused while its hands can still be read. Buffers which
+    were allocated because the pool was exhausted are never returned to the pool.
+    """
+
+    __slots__ = ("hands",)
+
+    def __init__(self, hands):
+        self.hands = hands
+
+    def release(self):
+        """Stop referencing the buffer, so that it can return to the pool once nothing else
+        references it. Calling this more than once has no effect."""
+        self.hands = None
+
+
+class HandBufferPool:
+    """A fixed-size ring of preallocated LEAP_HAND[2] buffers
+
+    TrackingEvents created with a pool borrow a buffer to copy their hands into, instead
+    of allocating a new one for every frame. If every buffer is borrowed, a new buffer
+    is allocated and counted in `fallback_allocations`.
+
+    A buffer is only returned to the pool once its event, and every Hand and NumPy array
+    created from the event, are gone. Holding on to them keeps the buffer borrowed.
+
+    :param size: The number of buffers to preallocate.
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("A HandBufferPool must have a size of at least 1")
+        self._slots = [ffi.new("LEAP_HAND[2]") for _ in range(size)]
+        # deque.append and deque.popleft are atomic, so buffers can be released
+        # from any thread while the poll thread acquires them.
+        self._free = deque(range(size))
+        self._fallback_allocations = 0
+
+    def acquire(self) -> HandBuffer:
+        """Borrow a buffer from the pool"""
+        try:
+            index = self._free.popleft()
+        except IndexError:
+            self._fallback_allocations += 1
+            return HandBuffer(ffi.new("LEAP_HAND[2]"))
+        # The pointer returns its slot to the pool when it is garbage collected. Anything
+        # created from it must keep a reference to it, eg. through ffi.buffer.
+        free = self._free
+        hands = ffi.gc(ffi.cast("LEAP_HAND*", self._slots[index]), lambda _: free.append(index))
+        return HandBuffer(hands)
+
+    @property
+    def size(self) -> int:
+        return len(self._slots)
+
+    @property
+    def available(self) -> int:
+        """The number of buffers which are not currently borrowed"""
+        return len(self._free)
+
+    @property
+    def fallback_allocations(self) -> int:
+        """The number of buffers allocated because the pool was exhausted"""
+        return self._fallback_allocations
@@ -1,40 +1,282 @@
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
 from leapc_cffi import libleapc, ffi
 
+from .dispatch import OverflowPolicy
 from .enums import RecordingFlags
 from .event_listener import Listener
-from .events import TrackingEvent
-from .exceptions import success_or_raise, LeapUnknownError
+from .events import TrackingEvent, _tracking_event_data
+from .exceptions import success_or_raise, LeapError, LeapUnknownError
+
+
+class RecordingOrdinalIndex:
+    """Maps the frame ids and timestamps of a recording to frame ordinals
+
+    The ordinal of a frame is its position in the recording, counting from 0. LeapC
+    recordings can only be read sequentially, so the index cannot locate a frame in the
+    file. It finds how many frames to read to reach it, which `Recording.skip_to` and the
+    methods built on it then read through.
+
+    Lookups use a binary search, so they assume that frame ids and timestamps increase
+    through the recording, as they do for recorded tracking data.
+
+    The index is stored in a sidecar file next to the recording, '<recording>.idx', along
+    with the size and modification time of the recording so that a stale index is ignored.
+    """
+
+    _HEADER = struct.Struct("<8sQqQ")
+    _MAGIC = b"LEAPIDX1"
+
+    def __init__(self, frame_ids: Optional[array] = None, timestamps: Optional[array] = None):
+        self._frame_ids = frame_ids if frame_ids is not None else array("q")
+        self._timestamps = timestamps if timestamps is not None else array("q")
+
+    def __len__(self):
+        return len(self._frame_ids)
+
+    def append(self, frame_id: int, timestamp: int):
+        self._frame_ids.append(frame_id)
+        self._timestamps.append(timestamp)
+
+    @property
+    def frame_ids(self) -> array:
+        return self._frame_ids
+
+    @property
+    def timestamps(self) -> array:
+        return self._timestamps
+
+    def ordinal_of_timestamp(self, timestamp: int) -> int:
+        """Get the ordinal of the first frame at or after the timestamp
+
+        Returns the number of frames if every frame is before the timestamp.
+        """
+        return bisect_left(self._timestamps, timestamp)
+
+    def ordinal_of_frame_id(self, frame_id: int) -> int:
+        """Get the ordinal of the frame with this id
+
+        Raises a KeyError if there is no frame with this id.
+        """
+        ordinal = bisect_left(self._frame_ids, frame_id)
+        if ordinal == len(self._frame_ids) or self._frame_ids[ordinal] != frame_id:
+            raise KeyError(frame_id)
+        return ordinal
+
+    @staticmethod
+    def sidecar_path(recording_path: str) -> str:
+        return recording_path + ".idx"
+
+    def save(self, recording_path: str):
+        """Save the index next to the recording, which must already be written"""
+        stat = os.stat(recording_path)
+        with open(self.sidecar_path(recording_path), "wb") as fp:
+            fp.write(self._HEADER.pack(self._MAGIC, stat.st_size, stat.st_mtime_ns, len(self)))
+            for values in (self._frame_ids, self._timestamps):
+                if sys.byteorder == "big":
+                    values = array("q", values)
+                    values.byteswap()
+                values.tofile(fp)
+
+    @classmethod
+    def load(cls, recording_path: str) -> Optional["RecordingOrdinalIndex"]:
+        """Load the index for the recording
+
+        Returns None if there is no index, or it does not match the recording.
+        """
+        try:
+            stat = os.stat(recording_path)
+            with open(cls.sidecar_path(recording_path), "rb") as fp:
+                header = fp.read(cls._HEADER.size)
+                if len(header) < cls._HEADER.size:
+                    return None
+                magic, size, mtime_ns, count = cls._HEADER.unpack(header)
+                if (magic, size, mtime_ns) != (cls._MAGIC, stat.st_size, stat.st_mtime_ns):
+                    return None
+                frame_ids, timestamps = array("q"), array("q")
+                frame_ids.fromfile(fp, count)
+                timestamps.fromfile(fp, count)
+        except (OSError, EOFError):
+            return None
+        if sys.byteorder == "big":
+            frame_ids.byteswap()
+            timestamps.byteswap()
+        return cls(frame_ids, timestamps)
 
 
 class Recording:
     def __init__(self, fpath, mode="r"):
+        self._path = fpath
         self._fpath = ffi.new("char[]", fpath.encode("utf-8"))
         self._recording_ptr = ffi.new("LEAP_RECORDING*")
         self._recording_params_ptr = ffi.new("LEAP_RECORDING_PARAMETERS*")
         self._recording_params_ptr.mode = self._parse_mode(mode)
         self._read_buffer = ffi.new("uint8_t*", 0)
+        self._writing = "w" in mode
+
+        # The ordinal of the next frame to be read
+        self._position = 0
+        # Built while writing, or loaded or built the first time it is needed when reading
+        self._index = RecordingOrdinalIndex() if self._writing else None
+        # Background writers of Recorders, which are stopped before the recording is closed
+        self._writers: List["_BackgroundWriter"] = []
 
     def __enter__(self):
+        self._open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Write any frames still queued, and stop writing, before the recording is closed
+        for writer in list(self._writers):
+            writer.stop()
+        success_or_raise(libleapc.LeapRecordingClose, self._recording_ptr)
+        if self._writing:
+            try:
+                self._index.save(self._path)
+            except OSError:
+                # The index is only an optimisation, and is rebuilt when it is needed
+                pass
+
+    def _open(self):
         success_or_raise(
             libleapc.LeapRecordingOpen,
             self._recording_ptr,
             self._fpath,
             self._recording_params_ptr[0],
         )
-        return self
+        self._position = 0
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        success_or_raise(libleapc.LeapRecordingClose, self._recording_ptr)
+    def write(self, frame) -> int:
+        """Write a frame of tracking data to the recording
+
+        Returns the number of bytes written.
+        """
+        return self._write_data(_tracking_event_data(frame))
 
-    def write(self, frame):
-        """Write a frame of tracking data to the recording"""
+    def _write_data(self, data) -> int:
+        # Write a LEAP_TRACKING_EVENT
         bytes_written = ffi.new("uint64_t*")
         success_or_raise(
             libleapc.LeapRecordingWrite,
             self._recording_ptr[0],
-            frame._data,
+            data,
             bytes_written,
         )
+        self._index.append(data.info.frame_id, data.info.timestamp)
+        return bytes_written[0]
+
+    @property
+    def index(self) -> RecordingOrdinalIndex:
+        """The ordinals of the frame ids and timestamps in the recording
+
+        When reading, this is loaded from the sidecar file written with the recording. If
+        there is no valid sidecar file, it is built by reading through the recording once
+        and then saved.
+
+        So the first access may write the sidecar file, '<recording>.idx', next to the
+        recording, as may `skip_to`, `read_frame_id` and `read_between`, which use the
+        index. If the sidecar file cannot be written, the index is only kept in memory.
+        """
+        if self._index is None:
+            self._index = RecordingOrdinalIndex.load(self._path)
+            if self._index is None:
+                self._index = self._build_index()
+                try:
+                    self._index.save(self._path)
+                except OSError:
+                    pass
+        return self._index
+
+    def _build_index(self) -> RecordingOrdinalIndex:
+        # Read the frame headers through a separate handle, so that this recording keeps
+        # its position.
+        index = RecordingOrdinalIndex()
+        with Recording(self._path, "r") as recording:
+            for frame in recording._iter_raw_frames(None):
+                index.append(frame.info.frame_id, frame.info.timestamp)
+        return index
+
+    def skip_to(self, timestamp: int):
+        """Skip to the first frame at or after the timestamp, so it is the next frame read
+
+        This is not random access. LeapC recordings can only be read forwards, so every
+        frame in between is read, though without creating TrackingEvents for them, and
+        skipping backwards reopens the recording and reads from the start. The cost is
+        linear in the number of frames skipped.
+        """
+        self._skip_to_ordinal(self.index.ordinal_of_timestamp(timestamp))
+
+    def read_frame_id(self, frame_id: int) -> TrackingEvent:
+        """Skip to the frame with this frame id and read it
+
+        Raises a KeyError if the recording has no frame with this id. See `skip_to` for
+        the cost of skipping.
+        """
+        self._skip_to_ordinal(self.index.ordinal_of_frame_id(frame_id))
+        return self.read_frame()
+
+    def read_between(self, start_timestamp: int, end_timestamp: int) -> List[TrackingEvent]:
+        """Skip to 'start_timestamp' and read the frames up to 'end_timestamp'
+
+        See `skip_to` for the cost of skipping.
+
+        :param start_timestamp: The first timestamp to include.
+        :param end_timestamp: The timestamp to stop at, which is not included.
+        """
+        index = self.index
+        start = index.ordinal_of_timestamp(start_timestamp)
+        end = max(start, index.ordinal_of_timestamp(end_timestamp))
+        self._skip_to_ordinal(start)
+        frames = []
+        for _ in range(end - start):
+            try:
+                frames.append(self.read_frame())
+            except StopIteration:
+                # The recording has fewer frames than its index
+                break
+        return frames
+
+    def _skip_to_ordinal(self, ordinal: int):
+        if self._writing:
+            raise RuntimeError("Cannot skip in a recording which is being written")
+        if ordinal < self._position:
+            success_or_raise(libleapc.LeapRecordingClose, self._recording_ptr)
+            self._open()
+        for _ in self._iter_raw_frames(ordinal - self._position):
+            pass
+
+    def _iter_raw_frames(self, count: Optional[int]):
+        """Read frames into a scratch buffer, yielding the LEAP_TRACKING_EVENT* of each
+
+        The yielded frame is only valid until the next one is read.
+
+        :param count: The number of frames to read, or None to read to the end.
+        """
+        scratch_size = 0
+        frame_size = ffi.new("uint64_t*")
+        recording = self._recording_ptr[0]
+        while count is None or count > 0:
+            try:
+                success_or_raise(libleapc.LeapRecordingReadSize, recording, frame_size)
+            except LeapUnknownError:
+                return
+            if frame_size[0] > scratch_size:
+                scratch_size = max(frame_size[0], 2 * scratch_size)
+                scratch = ffi.new("char[]", scratch_size)
+                frame = ffi.cast("LEAP_TRACKING_EVENT*", scratch)
+            success_or_raise(libleapc.LeapRecordingRead, recording, frame, frame_size[0])
+            self._position += 1
+            if count is not None:
+                count -= 1
+            yield frame
 
     def __iter__(self):
         return self
@@ -66,8 +308,84 @@ class Recording:
             frame_data.buffer_ptr(),
             frame_size[0],
         )
+        self._position += 1
         return TrackingEvent(frame_data)
 
+    def iter_columns(self, chunk_size: int = 65536):
+        """Read the rest of the recording in chunks of columnar NumPy arrays
+
+        Yields dicts of arrays with one row per frame, as described in
+        `leap.arrays.tracking_columns`. The final chunk may be shorter than 'chunk_size'.
+
+        Frames are read into a single scratch buffer, which grows to fit the largest frame,
+        and copied into scratch arrays, so no Python objects are created per frame. The
+        arrays grow as frames are read, up to 'chunk_size' rows, so a short recording does
+        not allocate a full chunk.
+
+        Requires NumPy.
+
+        :param chunk_size: The maximum number of frames in each chunk. Defaults to 65536.
+        """
+        import numpy as np
+
+        from .arrays import HAND_DTYPE, TRACKING_EVENT_DTYPE, tracking_columns
+
+        capacity = 64
+        if self._index is not None:
+            # The number of frames left is known, so allocate for exactly those
+            capacity = max(len(self._index) - self._position, 1)
+        events = np.zeros(0, dtype=TRACKING_EVENT_DTYPE)
+        hands = np.zeros((0, 2), dtype=HAND_DTYPE)
+        event_size = ffi.sizeof("LEAP_TRACKING_EVENT")
+        hand_size = ffi.sizeof("LEAP_HAND")
+        no_hands = ffi.new("LEAP_HAND[2]")
+
+        row = 0
+        for frame in self._iter_raw_frames(None):
+            if row == len(events):
+                # Grow the scratch arrays towards 'chunk_size', keeping the rows already read
+                capacity = min(chunk_size, max(capacity, 2 * row))
+                grown_events = np.zeros(capacity, dtype=TRACKING_EVENT_DTYPE)
+                grown_hands = np.zeros((capacity, 2), dtype=HAND_DTYPE)
+                grown_events[:row] = events[:row]
+                grown_hands[:row] = hands[:row]
+                events, hands = grown_events, grown_hands
+                events_ptr = ffi.cast("LEAP_TRACKING_EVENT*", ffi.from_buffer(events))
+                hands_ptr = ffi.cast("LEAP_HAND*", ffi.from_buffer(hands))
+
+            num_hands = min(frame.nHands, 2)
+            ffi.memmove(events_ptr + row, frame, event_size)
+            ffi.memmove(hands_ptr + 2 * row, frame.pHands, hand_size * num_hands)
+            if num_hands < 2:
+                # Clear any hands left in this row by the previous chunk
+                ffi.memmove(hands_ptr + 2 * row + num_hands, no_hands, hand_size * (2 - num_hands))
+
+            row += 1
+            if row == chunk_size:
+                yield tracking_columns(events, hands)
+                row = 0
+
+        if row > 0:
+            yield tracking_columns(events[:row], hands[:row])
+
+    def read_columns(self, chunk_size: int = 65536):
+        """Read the rest of the recording into columnar NumPy arrays
+
+        Returns a dict of arrays with one row per frame, as described in
+        `leap.arrays.tracking_columns`. See `iter_columns` to process long recordings in
+        chunks instead.
+
+        Requires NumPy.
+        """
+        import numpy as np
+
+        chunks = list(self.iter_columns(chunk_size))
+        if not chunks:
+            return _empty_columns()
+        if len(chunks) == 1:
+            return chunks[0]
+        return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
     def status(self):
         """Get the current recording status
 
@@ -138,17 +456,354 @@ class Recording:
             return self._frame_ptr
 
 
+class _BackgroundWriter:
+    """Writes frames to a Recording from a bounded queue, on its own thread
+
+    The writer thread wakes every flush interval, or when the queue is half full, and
+    writes every queued frame.
+    """
+
+    def __init__(
+        self,
+        recording: Recording,
+        *,
+        max_size: int,
+        flush_interval: float,
+        overflow_policy: OverflowPolicy,
+    ):
+        if max_size < 1:
+            raise ValueError("The write queue must have a size of at least 1")
+        if overflow_policy == OverflowPolicy.CoalesceTracking:
+            raise ValueError("A Recorder cannot coalesce tracking frames")
+
+        self._recording = recording
+        self._max_size = max_size
+        self._flush_interval = flush_interval
+        self._overflow_policy = overflow_policy
+
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        # The number of frames taken from the queue which are still being written
+        self._writing = 0
+        self._flush_requested = False
+        self._running = True
+
+        self.bytes_written = 0
+        self.frames_written = 0
+        self.dropped = 0
+        self.max_queue_depth = 0
+
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+        recording._writers.append(self)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def put(self, frame):
+        """Queue a frame to be written, applying the overflow policy if the queue is full
+
+        Raises a RuntimeError if the writer has been stopped, including while blocked
+        waiting for space.
+        """
+        with self._lock:
+            if not self._running:
+                raise RuntimeError("Cannot queue frames once the writer has stopped")
+            if len(self._queue) >= self._max_size:
+                if self._overflow_policy == OverflowPolicy.DropNewest:
+                    self.dropped += 1
+                    return
+                if self._overflow_policy == OverflowPolicy.DropOldest:
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    while self._running and len(self._queue) >= self._max_size:
+                        self._changed.wait()
+                    if not self._running:
+                        raise RuntimeError("Cannot queue frames once the writer has stopped")
+            self._queue.append(frame)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+            if len(self._queue) * 2 >= self._max_size:
+                self._changed.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued frame has been written
+
+        Returns False if the timeout expired first.
+        """
+        with self._lock:
+            self._flush_requested = True
+            self._changed.notify_all()
+            return self._changed.wait_for(lambda: not self._queue and not self._writing, timeout)
+
+    def stop(self):
+        """Stop the writer thread once every queued frame has been written"""
+        with self._lock:
+            self._running = False
+            self._changed.notify_all()
+        self._thread.join()
+        if self in self._recording._writers:
+            self._recording._writers.remove(self)
+
+    def _write_loop(self):
+        while True:
+            with self._lock:
+                self._changed.wait_for(
+                    lambda: not self._running
+                    or self._flush_requested
+                    or len(self._queue) * 2 >= self._max_size,
+                    self._flush_interval,
+                )
+                if not self._queue and not self._running:
+                    return
+                batch = self._queue
+                self._queue = deque()
+                self._writing = len(batch)
+                self._flush_requested = False
+                # Wake anything blocked on a full queue
+                self._changed.notify_all()
+
+            for data, _ in batch:
+                try:
+                    self.bytes_written += self._recording._write_data(data)
+                    self.frames_written += 1
+                except LeapError as exc:
+                    print(f"Failed to write frame to recording: {exc}", file=sys.stderr)
+
+            with self._lock:
+                self._writing = 0
+                self._changed.notify_all()
+
+
 class Recorder(Listener):
-    def __init__(self, recording, *, auto_start=True):
+    """Writes every tracking event it receives to a Recording
+
+    By default frames are written on the thread which delivers the events, which is
+    usually the poll thread, so a slow write delays polling. With 'background' set, frames
+    are queued and written in batches on a writer thread instead. Call `close` to write the
+    remaining frames and stop the writer thread. Closing the Recording also does this, so
+    no frames are lost if the Recorder is not closed first.
+
+    :param recording: The open Recording to write to.
+    :param auto_start: Whether to start recording immediately. Defaults to True.
+    :param background: Whether to write frames on a background writer thread.
+        Defaults to False.
+    :param queue_size: The maximum number of frames waiting to be written, when writing in
+        the background. Defaults to 1024.
+    :param flush_interval: The longest time in seconds a frame waits in the queue before
+        being written, when writing in the background. Defaults to 0.1.
+    :param overflow_policy: What to do with new frames when the queue is full. Only
+        DropNewest, DropOldest and Block are supported. Defaults to
+        OverflowPolicy.DropNewest.
+    """
+
+    def __init__(
+        self,
+        recording,
+        *,
+        auto_start=True,
+        background=False,
+        queue_size=1024,
+        flush_interval=0.1,
+        overflow_policy=OverflowPolicy.DropNewest,
+    ):
         self._recording = recording
         self._running = auto_start
+        self._bytes_written = 0
+        self._frames_written = 0
+        self._writer = None
+        if background:
+            self._writer = _BackgroundWriter(
+                recording,
+                max_size=queue_size,
+                flush_interval=flush_interval,
+                overflow_policy=overflow_policy,
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def on_tracking_event(self, event):
-        if self._running:
-            self._recording.write(event)
+        if not self._running:
+            return
+        if self._writer is None:
+            self._bytes_written += self._recording.write(event)
+            self._frames_written += 1
+            return
+
+        # The event is queued alongside its data to keep the hands the data points to alive
+        self._writer.put((_tracking_event_data(event), event))
 
     def start(self):
         self._running = True
 
     def stop(self):
         self._running = False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued frame has been written
+
+        Returns False if the timeout expired first. Does nothing unless writing in the
+        background.
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
+    def close(self):
+        """Stop recording, and stop the background writer once it has written every frame"""
+        self._running = False
+        if self._writer is not None:
+            self._writer.stop()
+
+    @property
+    def bytes_written(self) -> int:
+        """The number of bytes written to the recording"""
+        if self._writer is None:
+            return self._bytes_written
+        return self._writer.bytes_written
+
+    @property
+    def frames_written(self) -> int:
+        """The number of frames written to the recording"""
+        if self._writer is None:
+            return self._frames_written
+        return self._writer.frames_written
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of frames waiting to be written"""
+        return self._writer.queue_depth if self._writer is not None else 0
+
+    @property
+    def max_queue_depth(self) -> int:
+        """The largest number of frames which have been waiting to be written at once"""
+        return self._writer.max_queue_depth if self._writer is not None else 0
+
+    @property
+    def dropped_frames(self) -> int:
+        """The number of frames which were discarded because the queue was full"""
+        return self._writer.dropped if self._writer is not None else 0
+
+
+def _empty_columns() -> dict:
+    """Get the columns of a recording with no frames, with the same dtypes as any other"""
+    import numpy as np
+
+    from .arrays import HAND_DTYPE, TRACKING_EVENT_DTYPE, tracking_columns
+
+    return tracking_columns(
+        np.zeros(0, dtype=TRACKING_EVENT_DTYPE), np.zeros((0, 2), dtype=HAND_DTYPE)
+    )
+
+
+# The results queue and stop flag of a worker process of `process_recordings`. They are
+# given to each worker when it starts, as multiprocessing queues cannot be sent with a task.
+_worker_results = None
+_worker_stop = None
+
+
+def _init_worker(results, stop):
+    global _worker_results, _worker_stop
+    _worker_results, _worker_stop = results, stop
+
+
+def _process_recording(fpath: str, extract, chunk_size: int):
+    # Runs in a worker process. Each chunk is put on the results queue as soon as it is
+    # read, followed by None once the recording is finished, even if reading it failed.
+    try:
+        with Recording(fpath) as recording:
+            empty = True
+            for columns in recording.iter_columns(chunk_size):
+                if _worker_stop.is_set():
+                    return
+                _worker_results.put((fpath, columns if extract is None else extract(columns)))
+                empty = False
+        if empty:
+            columns = _empty_columns()
+            _worker_results.put((fpath, columns if extract is None else extract(columns)))
+    finally:
+        _worker_results.put((fpath, None))
+
+
+def process_recordings(
+    fpaths: Iterable[str],
+    extract: Optional[Callable[[dict], Dict[str, object]]] = None,
+    *,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 65536,
+) -> Iterator[Tuple[str, dict]]:
+    """Read many recordings in parallel, over a pool of worker processes
+
+    Each worker opens its own Recording and reads it in columnar chunks with
+    `Recording.iter_columns`. If 'extract' is given it is applied to every chunk, and must
+    return a dict of NumPy arrays with one row per frame, or per whatever the extractor
+    produces. Each chunk is sent back as soon as it is extracted, so neither the workers
+    nor this process hold a whole recording at once.
+
+    Yields a (path, columns) tuple for every chunk, as the chunks are read. The chunks of
+    a recording are yielded in order, but may be interleaved with those of other
+    recordings. A recording with no frames yields a single chunk of empty columns, with
+    the same dtypes as `Recording.read_columns`, passed through 'extract'.
+
+    Requires NumPy.
+
+    :param fpaths: The paths of the recordings.
+    :param extract: A picklable function, eg. defined at module level, which computes the
+        columns to return from a chunk. Defaults to None, which returns every column.
+    :param max_workers: The number of worker processes. Defaults to None, which uses
+        one per CPU.
+    :param chunk_size: The maximum number of frames in each chunk. Defaults to 65536.
+    """
+    import multiprocessing
+    import queue
+
+    workers = max_workers or os.cpu_count() or 1
+    context = multiprocessing.get_context()
+    # A bounded queue, so that workers wait for slow consumers rather than filling this
+    # process's memory. Chunks are pickled once, by the worker putting them.
+    results = context.Queue(2 * workers)
+    stop = context.Event()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(results, stop),
+    ) as executor:
+        futures = [
+            executor.submit(_process_recording, fpath, extract, chunk_size) for fpath in fpaths
+        ]
+        try:
+            remaining = len(futures)
+            while remaining:
+                try:
+                    fpath, columns = results.get(timeout=0.1)
+                except queue.Empty:
+                    # A worker which died, eg. from a crash in LeapC, never sends its final
+                    # None, so check for failed tasks rather than waiting forever
+                    for future in futures:
+                        if future.done() and future.exception() is not None:
+                            raise future.exception()
+                    continue
+                if columns is None:
+                    remaining -= 1
+                else:
+                    yield fpath, columns
+            for future in futures:
+                # Raise any exception from reading a recording
+                future.result()
+        finally:
+            stop.set()
+            for future in futures:
+                future.cancel()
+            # Workers may be waiting for space in the queue, so drain it until they finish
+            while not all(future.done() for future in futures):
+                try:
+                    results.get(timeout=0.1)
+                except queue.Empty:
+                    pass
@@ -0,0 +1,1038 @@
+"""A pure-Python stand-in for the leapc_cffi module
+
+This allows the leap package to be used without an Ultraleap install, eg. for testing and
+benchmarking on CI machines. It is selected by setting the LEAPSDK_SIMULATOR environment
+variable to 1 before importing leap, in which case it is used in place of leapc_cffi.
+
+The `ffi` object is built in cffi's ABI mode from a subset of LeapC.h, so no compiler or
+shared library is needed. The `libleapc` object implements the LeapC functions used by
+the leap package in Python:
+
+- A connection emits a Connection event, then a Device event for a single simulated
+  device, then Tracking events at `libleapc.framerate` frames per second.
+- Requests such as LeapSetPolicyFlags are answered with the matching response event.
+- Hands follow smooth, deterministic motion which repeats every 10 seconds, so runs are
+  reproducible. The second hand leaves the field of view for part of every cycle.
+- Recordings are stored in a simple format which only the simulator can read.
+
+The defaults can be set with the LEAPSDK_SIMULATOR_FRAMERATE (0 means as fast as frames are
+polled) and LEAPSDK_SIMULATOR_HANDS environment variables, or by setting
+`libleapc.framerate` and `libleapc.num_hands`.
+"""
+
+from collections import deque
+import math
+import os
+import struct
+import threading
+import time
+
+from cffi import FFI
+
+_CDEF = """
+typedef enum _eLeapRS {
+  eLeapRS_Success = 0x00000000,
+  eLeapRS_UnknownError = 0xE2010000,
+  eLeapRS_InvalidArgument = 0xE2010001,
+  eLeapRS_InsufficientResources = 0xE2010002,
+  eLeapRS_InsufficientBuffer = 0xE2010003,
+  eLeapRS_Timeout = 0xE2010004,
+  eLeapRS_NotConnected = 0xE2010005,
+  eLeapRS_HandshakeIncomplete = 0xE2010006,
+  eLeapRS_BufferSizeOverflow = 0xE2010007,
+  eLeapRS_ProtocolError = 0xE2010008,
+  eLeapRS_InvalidClientID = 0xE2010009,
+  eLeapRS_UnexpectedClosed = 0xE201000A,
+  eLeapRS_UnknownImageFrameRequest = 0xE201000B,
+  eLeapRS_RoutineIsNotSeer = 0xE201000D,
+  eLeapRS_TimestampTooEarly = 0xE201000E,
+  eLeapRS_ConcurrentPoll = 0xE201000F,
+  eLeapRS_NotAvailable = 0xE7010002,
+  eLeapRS_NotStreaming = 0xE7010004,
+  eLeapRS_CannotOpenDevice = 0xE7010005
+} eLeapRS;
+
+typedef enum _eLeapTrackingMode {
+  eLeapTrackingMode_Desktop = 0,
+  eLeapTrackingMode_HMD = 1,
+  eLeapTrackingMode_ScreenTop = 2,
+  eLeapTrackingMode_Unknown = 3
+} eLeapTrackingMode;
+
+typedef enum _eLeapConnectionConfig {
+  eLeapConnectionConfig_MultiDeviceAware = 0x00000001
+} eLeapConnectionConfig;
+
+typedef enum _eLeapAllocatorType {
+  eLeapAllocatorType_Int8 = 0,
+  eLeapAllocatorType_Uint8 = 1,
+  eLeapAllocatorType_Int16 = 2,
+  eLeapAllocatorType_UInt16 = 3,
+  eLeapAllocatorType_Int32 = 4,
+  eLeapAllocatorType_UInt32 = 5,
+  eLeapAllocatorType_Float = 6,
+  eLeapAllocatorType_Int64 = 8,
+  eLeapAllocatorType_UInt64 = 9,
+  eLeapAllocatorType_Double = 10
+} eLeapAllocatorType;
+
+typedef enum _eLeapServiceDisposition {
+  eLeapServiceDisposition_LowFpsDetected = 0x00000001,
+  eLeapServiceDisposition_PoorPerformancePause = 0x00000002,
+  eLeapServiceDisposition_TrackingErrorUnknown = 0x00000004,
+  eLeapServiceDisposition_ALL = 0x00000007
+} eLeapServiceDisposition;
+
+typedef enum _eLeapConnectionStatus {
+  eLeapConnectionStatus_NotConnected = 0,
+  eLeapConnectionStatus_Connected = 1,
+  eLeapConnectionStatus_HandshakeIncomplete = 0xE000004C,
+  eLeapConnectionStatus_NotRunning = 0xE7030004
+} eLeapConnectionStatus;
+
+typedef enum _eLeapPolicyFlag {
+  eLeapPolicyFlag_BackgroundFrames = 0x00000001,
+  eLeapPolicyFlag_Images = 0x00000002,
+  eLeapPolicyFlag_OptimizeHMD = 0x00000004,
+  eLeapPolicyFlag_AllowPauseResume = 0x00000008,
+  eLeapPolicyFlag_MapPoints = 0x00000080,
+  eLeapPolicyFlag_OptimizeScreenTop = 0x00000100
+} eLeapPolicyFlag;
+
+typedef enum _eLeapValueType {
+  eLeapValueType_Unknown = 0,
+  eLeapValueType_Boolean = 1,
+  eLeapValueType_Int32 = 2,
+  eLeapValueType_Float = 3,
+  eLeapValueType_String = 4
+} eLeapValueType;
+
+typedef enum _eLeapDevicePID {
+  eLeapDevicePID_Unknown = 0x0000,
+  eLeapDevicePID_Peripheral = 0x0003,
+  eLeapDevicePID_Dragonfly = 0x1102,
+  eLeapDevicePID_Nightcrawler = 0x1201,
+  eLeapDevicePID_Rigel = 0x1202,
+  eLeapDevicePID_SIR170 = 0x1203,
+  eLeapDevicePID_3Di = 0x1204,
+  eLeapDevicePID_LMC2 = 0x1206,
+  eLeapDevicePID_Invalid = 0xFFFFFFFF
+} eLeapDevicePID;
+
+typedef enum _eLeapDeviceStatus {
+  eLeapDeviceStatus_Streaming = 0x00000001,
+  eLeapDeviceStatus_Paused = 0x00000002,
+  eLeapDeviceStatus_Robust = 0x00000004,
+  eLeapDeviceStatus_Smudged = 0x00000008,
+  eLeapDeviceStatus_LowResource = 0x00000010,
+  eLeapDeviceStatus_UnknownFailure = 0xE8010000,
+  eLeapDeviceStatus_BadCalibration = 0xE8010001,
+  eLeapDeviceStatus_BadFirmware = 0xE8010002,
+  eLeapDeviceStatus_BadTransport = 0xE8010003,
+  eLeapDeviceStatus_BadControl = 0xE8010004
+} eLeapDeviceStatus;
+
+typedef enum _eLeapImageType {
+  eLeapImageType_Unknown = 0,
+  eLeapImageType_Default = 1,
+  eLeapImageType_Raw = 2
+} eLeapImageType;
+
+typedef enum _eLeapImageFormat {
+  eLeapImageFormat_UNKNOWN = 0,
+  eLeapImageFormat_IR = 0x317249,
+  eLeapImageFormat_RGBIr_Bayer = 0x49425247
+} eLeapImageFormat;
+
+typedef enum _eLeapPerspectiveType {
+  eLeapPerspectiveType_Invalid = 0,
+  eLeapPerspectiveType_Stereo_Left = 1,
+  eLeapPerspectiveType_Stereo_Right = 2,
+  eLeapPerspectiveType_Mono = 3
+} eLeapPerspectiveType;
+
+typedef enum _eLeapCameraCalibrationType {
+  eLeapCameraCalibrationType_infraredPhysical = 0,
+  eLeapCameraCalibrationType_visual = 1
+} eLeapCameraCalibrationType;
+
+typedef enum _eLeapHandType {
+  eLeapHandType_Left = 0,
+  eLeapHandType_Right = 1
+} eLeapHandType;
+
+typedef enum _eLeapLogSeverity {
+  eLeapLogSeverity_Unknown = 0,
+  eLeapLogSeverity_Critical = 1,
+  eLeapLogSeverity_Warning = 2,
+  eLeapLogSeverity_Information = 3
+} eLeapLogSeverity;
+
+typedef enum _eLeapDroppedFrameType {
+  eLeapDroppedFrameType_PreprocessingQueue = 0,
+  eLeapDroppedFrameType_TrackingQueue = 1,
+  eLeapDroppedFrameType_Other = 2
+} eLeapDroppedFrameType;
+
+typedef enum _eLeapIMUFlag {
+  eLeapIMUFlag_HasAccelerometer = 0x00000001,
+  eLeapIMUFlag_HasGyroscope = 0x00000002,
+  eLeapIMUFlag_HasTemperature = 0x00000004
+} eLeapIMUFlag;
+
+typedef enum _eLeapEventType {
+  eLeapEventType_None = 0,
+  eLeapEventType_Connection = 1,
+  eLeapEventType_ConnectionLost = 2,
+  eLeapEventType_Device = 3,
+  eLeapEventType_DeviceFailure = 4,
+  eLeapEventType_Policy = 5,
+  eLeapEventType_Tracking = 0x100,
+  eLeapEventType_ImageRequestError = 0x101,
+  eLeapEventType_ImageComplete = 0x102,
+  eLeapEventType_LogEvent = 0x103,
+  eLeapEventType_DeviceLost = 0x104,
+  eLeapEventType_ConfigResponse = 0x105,
+  eLeapEventType_ConfigChange = 0x106,
+  eLeapEventType_DeviceStatusChange = 0x107,
+  eLeapEventType_DroppedFrame = 0x108,
+  eLeapEventType_Image = 0x109,
+  eLeapEventType_PointMappingChange = 0x10A,
+  eLeapEventType_TrackingMode = 0x10B,
+  eLeapEventType_LogEvents = 0x10C,
+  eLeapEventType_HeadPose = 0x10D,
+  eLeapEventType_Eyes = 0x10E,
+  eLeapEventType_IMU = 0x10F
+} eLeapEventType;
+
+typedef enum _eLeapRecordingFlags {
+  eLeapRecordingFlags_Error = 0x00000000,
+  eLeapRecordingFlags_Reading = 0x00000001,
+  eLeapRecordingFlags_Writing = 0x00000002,
+  eLeapRecordingFlags_Flushing = 0x00000004,
+  eLeapRecordingFlags_Compressed = 0x00000008
+} eLeapRecordingFlags;
+
+typedef enum _eLeapVersionPart {
+  eLeapVersionPart_ClientLibrary = 0,
+  eLeapVersionPart_ClientProtocol = 1,
+  eLeapVersionPart_ServerLibrary = 2,
+  eLeapVersionPart_ServerProtocol = 3
+} eLeapVersionPart;
+
+typedef struct _LEAP_CONNECTION *LEAP_CONNECTION;
+typedef struct _LEAP_DEVICE *LEAP_DEVICE;
+typedef struct _LEAP_RECORDING *LEAP_RECORDING;
+
+typedef struct _LEAP_CONNECTION_CONFIG {
+  uint32_t size;
+  uint32_t flags;
+  const char* server_namespace;
+} LEAP_CONNECTION_CONFIG;
+
+typedef struct _LEAP_CONNECTION_INFO {
+  uint32_t size;
+  eLeapConnectionStatus status;
+} LEAP_CONNECTION_INFO;
+
+typedef struct _LEAP_DEVICE_REF {
+  void* handle;
+  uint32_t id;
+} LEAP_DEVICE_REF;
+
+typedef struct _LEAP_DEVICE_INFO {
+  uint32_t size;
+  uint32_t status;
+  uint32_t caps;
+  eLeapDevicePID pid;
+  uint32_t baseline;
+  uint32_t serial_length;
+  char* serial;
+  float h_fov;
+  float v_fov;
+  uint32_t range;
+} LEAP_DEVICE_INFO;
+
+typedef struct _LEAP_SERVER_STATUS_DEVICE {
+  const char* serial;
+  const char* type;
+} LEAP_SERVER_STATUS_DEVICE;
+
+typedef struct _LEAP_SERVER_STATUS {
+  const char* version;
+  uint32_t device_count;
+  const LEAP_SERVER_STATUS_DEVICE* devices;
+} LEAP_SERVER_STATUS;
+
+typedef struct _LEAP_VECTOR {
+  union {
+    float v[3];
+    struct {
+      float x;
+      float y;
+      float z;
+    };
+  };
+} LEAP_VECTOR;
+
+typedef struct _LEAP_QUATERNION {
+  union {
+    float v[4];
+    struct {
+      float x;
+      float y;
+      float z;
+      float w;
+    };
+  };
+} LEAP_QUATERNION;
+
+typedef struct _LEAP_BONE {
+  LEAP_VECTOR prev_joint;
+  LEAP_VECTOR next_joint;
+  float width;
+  LEAP_QUATERNION rotation;
+} LEAP_BONE;
+
+typedef struct _LEAP_DIGIT {
+  int32_t finger_id;
+  union {
+    LEAP_BONE bones[4];
+    struct {
+      LEAP_BONE metacarpal;
+      LEAP_BONE proximal;
+      LEAP_BONE intermediate;
+      LEAP_BONE distal;
+    };
+  };
+  uint32_t is_extended;
+} LEAP_DIGIT;
+
+typedef struct _LEAP_PALM {
+  LEAP_VECTOR position;
+  LEAP_VECTOR stabilized_position;
+  LEAP_VECTOR velocity;
+  LEAP_VECTOR normal;
+  float width;
+  LEAP_VECTOR direction;
+  LEAP_QUATERNION orientation;
+} LEAP_PALM;
+
+typedef struct _LEAP_HAND {
+  uint32_t id;
+  uint32_t flags;
+  eLeapHandType type;
+  float confidence;
+  uint64_t visible_time;
+  float pinch_distance;
+  float grab_angle;
+  float pinch_strength;
+  float grab_strength;
+  LEAP_PALM palm;
+  union {
+    struct {
+      LEAP_DIGIT thumb;
+      LEAP_DIGIT index;
+      LEAP_DIGIT middle;
+      LEAP_DIGIT ring;
+      LEAP_DIGIT pinky;
+    };
+    LEAP_DIGIT digits[5];
+  };
+  LEAP_BONE arm;
+} LEAP_HAND;
+
+typedef struct _LEAP_FRAME_HEADER {
+  void* reserved;
+  int64_t frame_id;
+  int64_t timestamp;
+} LEAP_FRAME_HEADER;
+
+typedef struct _LEAP_TRACKING_EVENT {
+  LEAP_FRAME_HEADER info;
+  int64_t tracking_frame_id;
+  uint32_t nHands;
+  LEAP_HAND* pHands;
+  float framerate;
+} LEAP_TRACKING_EVENT;
+
+typedef struct _LEAP_CONNECTION_EVENT {
+  uint32_t flags;
+} LEAP_CONNECTION_EVENT;
+
+typedef struct _LEAP_CONNECTION_LOST_EVENT {
+  uint32_t flags;
+} LEAP_CONNECTION_LOST_EVENT;
+
+typedef struct _LEAP_DEVICE_EVENT {
+  uint32_t flags;
+  LEAP_DEVICE_REF device;
+  uint32_t status;
+} LEAP_DEVICE_EVENT;
+
+typedef struct _LEAP_DEVICE_FAILURE_EVENT {
+  eLeapDeviceStatus status;
+  LEAP_DEVICE hDevice;
+} LEAP_DEVICE_FAILURE_EVENT;
+
+typedef struct _LEAP_DEVICE_STATUS_CHANGE_EVENT {
+  LEAP_DEVICE_REF device;
+  uint32_t last_status;
+  uint32_t status;
+} LEAP_DEVICE_STATUS_CHANGE_EVENT;
+
+typedef struct _LEAP_POLICY_EVENT {
+  uint32_t reserved;
+  uint32_t current_policy;
+} LEAP_POLICY_EVENT;
+
+typedef struct _LEAP_TRACKING_MODE_EVENT {
+  uint32_t reserved;
+  eLeapTrackingMode current_tracking_mode;
+} LEAP_TRACKING_MODE_EVENT;
+
+typedef struct _LEAP_LOG_EVENT {
+  eLeapLogSeverity severity;
+  int64_t timestamp;
+  const char* message;
+} LEAP_LOG_EVENT;
+
+typedef struct _LEAP_LOG_EVENTS {
+  uint32_t nEvents;
+  LEAP_LOG_EVENT* events;
+} LEAP_LOG_EVENTS;
+
+typedef struct _LEAP_CONFIG_RESPONSE_EVENT {
+  uint32_t requestID;
+} LEAP_CONFIG_RESPONSE_EVENT;
+
+typedef struct _LEAP_CONFIG_CHANGE_EVENT {
+  uint32_t requestID;
+  bool status;
+} LEAP_CONFIG_CHANGE_EVENT;
+
+typedef struct _LEAP_DROPPED_FRAME_EVENT {
+  int64_t frame_id;
+  eLeapDroppedFrameType type;
+} LEAP_DROPPED_FRAME_EVENT;
+
+typedef struct _LEAP_IMAGE {
+  uint64_t matrix_version;
+} LEAP_IMAGE;
+
+typedef struct _LEAP_IMAGE_EVENT {
+  LEAP_FRAME_HEADER info;
+  LEAP_IMAGE image[2];
+} LEAP_IMAGE_EVENT;
+
+typedef struct _LEAP_POINT_MAPPING_CHANGE_EVENT {
+  LEAP_FRAME_HEADER info;
+  int64_t timestamp;
+  uint32_t nPoints;
+} LEAP_POINT_MAPPING_CHANGE_EVENT;
+
+typedef struct _LEAP_HEAD_POSE_EVENT {
+  int64_t timestamp;
+  LEAP_VECTOR head_position;
+  LEAP_QUATERNION head_orientation;
+} LEAP_HEAD_POSE_EVENT;
+
+typedef struct _LEAP_EYE_EVENT {
+  int64_t frame_id;
+  int64_t timestamp;
+  LEAP_VECTOR left_eye_position;
+  LEAP_VECTOR right_eye_position;
+} LEAP_EYE_EVENT;
+
+typedef struct _LEAP_IMU_EVENT {
+  int64_t timestamp;
+  int64_t timestamp_hw;
+  eLeapIMUFlag flags;
+  LEAP_VECTOR accelerometer;
+  LEAP_VECTOR gyroscope;
+  float temperature;
+} LEAP_IMU_EVENT;
+
+typedef struct _LEAP_CONNECTION_MESSAGE {
+  uint32_t size;
+  eLeapEventType type;
+  union {
+    const void* pointer;
+    const LEAP_CONNECTION_EVENT* connection_event;
+    const LEAP_CONNECTION_LOST_EVENT* connection_lost_event;
+    const LEAP_DEVICE_EVENT* device_event;
+    const LEAP_DEVICE_STATUS_CHANGE_EVENT* device_status_change_event;
+    const LEAP_POLICY_EVENT* policy_event;
+    const LEAP_DEVICE_FAILURE_EVENT* device_failure_event;
+    const LEAP_TRACKING_EVENT* tracking_event;
+    const LEAP_TRACKING_MODE_EVENT* tracking_mode_event;
+    const LEAP_LOG_EVENT* log_event;
+    const LEAP_LOG_EVENTS* log_events;
+    const LEAP_CONFIG_RESPONSE_EVENT* config_response_event;
+    const LEAP_CONFIG_CHANGE_EVENT* config_change_event;
+    const LEAP_DROPPED_FRAME_EVENT* dropped_frame_event;
+    const LEAP_IMAGE_EVENT* image_event;
+    const LEAP_POINT_MAPPING_CHANGE_EVENT* point_mapping_change_event;
+    const LEAP_HEAD_POSE_EVENT* head_pose_event;
+    const LEAP_EYE_EVENT* eye_event;
+    const LEAP_IMU_EVENT* imu_event;
+  };
+  uint32_t device_id;
+} LEAP_CONNECTION_MESSAGE;
+
+typedef struct _LEAP_RECORDING_PARAMETERS {
+  uint32_t mode;
+} LEAP_RECORDING_PARAMETERS;
+
+typedef struct _LEAP_RECORDING_STATUS {
+  uint32_t mode;
+} LEAP_RECORDING_STATUS;
+"""
+
+ffi = FFI()
+ffi.cdef(_CDEF, packed=True)
+
+_RS_SUCCESS = 0x00000000
+_RS_UNKNOWN_ERROR = 0xE2010000
+_RS_INVALID_ARGUMENT = 0xE2010001
+_RS_TIMEOUT = 0xE2010004
+_RS_NOT_CONNECTED = 0xE2010005
+
+_EVENT_CONNECTION = 1
+_EVENT_DEVICE = 3
+_EVENT_POLICY = 5
+_EVENT_TRACKING = 0x100
+_EVENT_TRACKING_MODE = 0x10B
+
+_RECORDING_READING = 0x1
+_RECORDING_WRITING = 0x2
+_RECORDING_COMPRESSED = 0x8
+
+_DEVICE_ID = 1
+_DEVICE_SERIAL = b"SIM00000001"
+_DEVICE_STATUS_STREAMING = 0x1
+
+# Every motion in the hand model has a period which divides this, so a cycle of frames
+# can be cached and repeated seamlessly.
+_MOTION_CYCLE = 10.0
+# The rate at which the motion advances when frames are produced as fast as possible
+_NOMINAL_FRAMERATE = 120
+
+_DIGIT_NAMES = ("thumb", "index", "middle", "ring", "pinky")
+# Offsets of each digit's base from the palm, for a right hand, in mm
+_DIGIT_BASES = (
+    (-25.0, -5.0, 10.0),
+    (-20.0, 0.0, -5.0),
+    (0.0, 0.0, -8.0),
+    (18.0, 0.0, -5.0),
+    (34.0, -2.0, 0.0),
+)
+# Lengths of the metacarpal, proximal, intermediate and distal bones, in mm
+_BONE_LENGTHS = (
+    (0.0, 40.0, 30.0, 22.0),
+    (65.0, 40.0, 24.0, 18.0),
+    (62.0, 45.0, 28.0, 19.0),
+    (58.0, 42.0, 27.0, 19.0),
+    (54.0, 33.0, 19.0, 17.0),
+)
+
+
+def _hand_pose(hand_index: int, t: float) -> dict:
+    """The pose of a simulated hand at time t seconds, as plain Python values"""
+    side = 1.0 if hand_index == 1 else -1.0
+    phase = hand_index * math.pi / 2
+    w1, w2, w3 = 2 * math.pi / 2.5, 2 * math.pi / 5.0, 2 * math.pi / 10.0
+
+    palm = (
+        side * 90.0 + 70.0 * math.sin(w2 * t + phase),
+        220.0 + 50.0 * math.sin(w1 * t + phase),
+        30.0 * math.sin(w3 * t + phase),
+    )
+    velocity = (
+        70.0 * w2 * math.cos(w2 * t + phase),
+        50.0 * w1 * math.cos(w1 * t + phase),
+        30.0 * w3 * math.cos(w3 * t + phase),
+    )
+    grab = 0.5 - 0.5 * math.cos(w3 * t + phase)
+    pinch = max(0.0, math.sin(w2 * t + phase)) ** 2 * (1.0 - grab)
+
+    digits = []
+    for d, (base, lengths) in enumerate(zip(_DIGIT_BASES, _BONE_LENGTHS)):
+        joint = (palm[0] + side * base[0], palm[1] + base[1], palm[2] + base[2] + 40.0)
+        joints = [joint]
+        for b, length in enumerate(lengths):
+            # Each bone curls further towards the palm as the hand grabs
+            angle = grab * b * 0.55
+            spread = side * (-0.6 if d == 0 else 0.08 * (d - 2))
+            direction = (
+                math.sin(spread) * math.cos(angle),
+                -math.sin(angle),
+                -math.cos(spread) * math.cos(angle),
+            )
+            joint = tuple(joint[i] + length * direction[i] for i in range(3))
+            joints.append(joint)
+        digits.append(joints)
+
+    # Bring the thumb tip towards the index tip when pinching
+    index_tip = digits[1][4]
+    thumb_tip = digits[0][4]
+    digits[0][4] = tuple(
+        thumb_tip[i] + pinch * (index_tip[i] - thumb_tip[i]) * 0.9 for i in range(3)
+    )
+    pinch_distance = math.dist(digits[0][4], index_tip)
+
+    return {
+        "palm": palm,
+        "velocity": velocity,
+        "grab": grab,
+        "pinch": pinch,
+        "pinch_distance": pinch_distance,
+        "digits": digits,
+    }
+
+
+def _hand_visible(hand_index: int, t: float) -> bool:
+    # The second hand leaves the field of view for the last 1.5s of each cycle
+    return hand_index == 0 or (t % _MOTION_CYCLE) < _MOTION_CYCLE - 1.5
+
+
+def _set_vector(vector, values):
+    vector.x, vector.y, vector.z = values
+
+
+def _fill_hand(hand, hand_index: int, t: float):
+    pose = _hand_pose(hand_index, t)
+    cycle_time = t % _MOTION_CYCLE
+
+    hand.id = hand_index + 1
+    hand.flags = 0
+    hand.type = hand_index % 2
+    hand.confidence = 1.0
+    hand.visible_time = int(cycle_time * 1e6)
+    hand.pinch_distance = pose["pinch_distance"]
+    hand.grab_angle = pose["grab"] * math.pi
+    hand.pinch_strength = pose["pinch"]
+    hand.grab_strength = pose["grab"]
+
+    palm = hand.palm
+    _set_vector(palm.position, pose["palm"])
+    _set_vector(palm.stabilized_position, pose["palm"])
+    _set_vector(palm.velocity, pose["velocity"])
+    _set_vector(palm.normal, (0.0, -1.0, 0.0))
+    _set_vector(palm.direction, (0.0, 0.0, -1.0))
+    palm.width = 85.0
+    palm.orientation.w = 1.0
+
+    for d, joints in enumerate(pose["digits"]):
+        digit = hand.digits[d]
+        digit.finger_id = hand.id * 10 + d
+        digit.is_extended = pose["grab"] < 0.5
+        for b in range(4):
+            bone = digit.bones[b]
+            _set_vector(bone.prev_joint, joints[b])
+            _set_vector(bone.next_joint, joints[b + 1])
+            bone.width = 16.0 - d
+            bone.rotation.w = 1.0
+
+    wrist = (pose["palm"][0], pose["palm"][1], pose["palm"][2] + 60.0)
+    _set_vector(hand.arm.prev_joint, (wrist[0], wrist[1] - 40.0, wrist[2] + 250.0))
+    _set_vector(hand.arm.next_joint, wrist)
+    hand.arm.width = 60.0
+    hand.arm.rotation.w = 1.0
+
+
+def fill_hands(hands, num_hands: int, t: float) -> int:
+    """Fill the LEAP_HAND array with the simulated hands visible at time t
+
+    This only sets attributes on the hands, so it also works with LEAP_HAND CData from
+    the real leapc_cffi module. Returns the number of hands filled.
+    """
+    count = 0
+    for hand_index in range(num_hands):
+        if _hand_visible(hand_index, t):
+            _fill_hand(hands[count], hand_index, t)
+            count += 1
+    return count
+
+
+def _handle_key(handle) -> int:
+    return int(ffi.cast("uintptr_t", handle))
+
+
+class _SimulatedConnection:
+    """The state of a single simulated connection"""
+
+    def __init__(self, lib):
+        self._lib = lib
+        self._condition = threading.Condition()
+        self._responses = deque()
+        self.is_open = False
+
+        self.policy_flags = 0
+        self.tracking_mode = 0
+
+        # The C data for the most recent message, which stays valid until the next poll
+        self._message_data = None
+        self._tracking_event = ffi.new("LEAP_TRACKING_EVENT*")
+        self._frame_cache = {}
+
+    def open(self):
+        self.is_open = True
+        self._start_time = time.perf_counter()
+        self._frame_index = 0
+        self._sent_connection = False
+        self._sent_device = False
+
+    def queue_response(self, event_type: int, attribute: str, data):
+        with self._condition:
+            self._responses.append((event_type, attribute, data))
+            self._condition.notify()
+
+    def next_message(self, timeout: float):
+        """Get the next (event_type, attribute, data) message, or None on timeout"""
+        deadline = time.perf_counter() + timeout
+        with self._condition:
+            while True:
+                if self._responses:
+                    return self._keep(*self._responses.popleft())
+                if not self._sent_connection:
+                    self._sent_connection = True
+                    return self._keep(
+                        _EVENT_CONNECTION, "connection_event", ffi.new("LEAP_CONNECTION_EVENT*")
+                    )
+                if not self._sent_device:
+                    self._sent_device = True
+                    return self._keep(_EVENT_DEVICE, "device_event", self._device_event())
+
+                framerate = self._lib.framerate
+                now = time.perf_counter()
+                if framerate > 0:
+                    frame_time = self._start_time + self._frame_index / framerate
+                else:
+                    frame_time = now
+                if frame_time <= now:
+                    return self._keep(_EVENT_TRACKING, "tracking_event", self._next_frame())
+                if deadline <= now:
+                    return None
+                self._condition.wait(min(frame_time, deadline) - now)
+
+    def _keep(self, event_type, attribute, data):
+        self._message_data = data
+        return event_type, attribute, data
+
+    def _device_event(self):
+        event = ffi.new("LEAP_DEVICE_EVENT*")
+        event.device.handle = ffi.cast("void*", _DEVICE_ID)
+        event.device.id = _DEVICE_ID
+        event.status = _DEVICE_STATUS_STREAMING
+        return event
+
+    def _next_frame(self):
+        framerate = self._lib.framerate or _NOMINAL_FRAMERATE
+        cycle_frames = int(_MOTION_CYCLE * framerate)
+        cycle_index = self._frame_index % cycle_frames
+        key = (cycle_index, framerate, self._lib.num_hands)
+
+        cached = self._frame_cache.get(key)
+        if cached is None:
+            hands = ffi.new("LEAP_HAND[2]")
+            count = fill_hands(hands, self._lib.num_hands, cycle_index / framerate)
+            cached = self._frame_cache[key] = (hands, count)
+        hands, count = cached
+
+        event = self._tracking_event
+        event.info.frame_id = self._frame_index
+        event.info.timestamp = self._lib.LeapGetNow()
+        event.tracking_frame_id = self._frame_index
+        event.nHands = count
+        event.pHands = hands
+        event.framerate = framerate
+        self._frame_index += 1
+        return event
+
+
+class _SimulatedRecording:
+    """A recording stored as length-prefixed LEAP_TRACKING_EVENT structs followed by hands"""
+
+    _HEADER = struct.Struct("<Q")
+
+    def __init__(self, path: str, mode: int):
+        self.mode = mode
+        self._file = open(path, "rb" if mode & _RECORDING_READING else "wb")
+        self._next_size = None
+
+    def close(self):
+        self._file.close()
+
+    def write(self, frame) -> int:
+        event = ffi.new("LEAP_TRACKING_EVENT*", frame[0])
+        event.pHands = ffi.NULL
+        payload = (
+            ffi.buffer(event)[:]
+            + ffi.buffer(frame.pHands, ffi.sizeof("LEAP_HAND") * frame.nHands)[:]
+        )
+        self._file.write(self._HEADER.pack(len(payload)) + payload)
+        return self._HEADER.size + len(payload)
+
+    def read_size(self):
+        if self._next_size is None:
+            header = self._file.read(self._HEADER.size)
+            if len(header) < self._HEADER.size:
+                return None
+            (self._next_size,) = self._HEADER.unpack(header)
+        return self._next_size
+
+    def read(self, event, size: int) -> bool:
+        if self.read_size() is None or size < self._next_size:
+            return False
+        payload = self._file.read(self._next_size)
+        self._next_size = None
+        ffi.memmove(event, payload, len(payload))
+        event.pHands = ffi.cast(
+            "LEAP_HAND*", ffi.cast("char*", event) + ffi.sizeof("LEAP_TRACKING_EVENT")
+        )
+        return True
+
+
+class SimulatedLeapC:
+    """Python implementations of the LeapC functions used by the leap package
+
+    All the LeapC enum values are available as attributes, as they are on the compiled
+    library.
+    """
+
+    def __init__(self):
+        typedefs, _, _ = ffi.list_types()
+        for name in typedefs:
+            if name.startswith("eLeap"):
+                for value, entry in ffi.typeof(name).elements.items():
+                    setattr(self, entry, value)
+
+        self.framerate = float(os.getenv("LEAPSDK_SIMULATOR_FRAMERATE", 120))
+        self.num_hands = int(os.getenv("LEAPSDK_SIMULATOR_HANDS", 2))
+
+        self._connections = {}
+        self._recordings = {}
+        self._server_statuses = {}
+        self._next_handle = 1
+        self._handle_lock = threading.Lock()
+
+    def _new_handle(self, ctype: str):
+        with self._handle_lock:
+            handle = self._next_handle
+            self._next_handle += 1
+        return ffi.cast(ctype, handle)
+
+    def _connection(self, hConnection):
+        return self._connections.get(_handle_key(hConnection))
+
+    def LeapGetNow(self):
+        return time.perf_counter_ns() // 1000
+
+    def LeapCreateConnection(self, pConfig, phConnection):
+        handle = self._new_handle("LEAP_CONNECTION")
+        self._connections[_handle_key(handle)] = _SimulatedConnection(self)
+        phConnection[0] = handle
+        return _RS_SUCCESS
+
+    def LeapDestroyConnection(self, hConnection):
+        self._connections.pop(_handle_key(hConnection), None)
+
+    def LeapOpenConnection(self, hConnection):
+        connection = self._connection(hConnection)
+        if connection is None:
+            return _RS_INVALID_ARGUMENT
+        connection.open()
+        return _RS_SUCCESS
+
+    def LeapCloseConnection(self, hConnection):
+        connection = self._connection(hConnection)
+        if connection is not None:
+            connection.is_open = False
+
+    def LeapGetConnectionInfo(self, hConnection, pInfo):
+        connection = self._connection(hConnection)
+        pInfo.status = self.eLeapConnectionStatus_Connected
+        if connection is None or not connection.is_open:
+            pInfo.status = self.eLeapConnectionStatus_NotConnected
+        return _RS_SUCCESS
+
+    def LeapPollConnection(self, hConnection, timeout, evt):
+        connection = self._connection(hConnection)
+        if connection is None or not connection.is_open:
+            return _RS_NOT_CONNECTED
+        message = connection.next_message(timeout / 1000)
+        if message is None:
+            return _RS_TIMEOUT
+        event_type, attribute, data = message
+        evt.size = ffi.sizeof("LEAP_CONNECTION_MESSAGE")
+        evt.type = event_type
+        evt.device_id = _DEVICE_ID
+        setattr(evt, attribute, data)
+        return _RS_SUCCESS
+
+    def LeapSetTrackingMode(self, hConnection, mode):
+        connection = self._connection(hConnection)
+        if connection is None:
+            return _RS_INVALID_ARGUMENT
+        connection.tracking_mode = mode
+        return self._queue_tracking_mode(connection)
+
+    def LeapGetTrackingMode(self, hConnection):
+        connection = self._connection(hConnection)
+        if connection is None:
+            return _RS_INVALID_ARGUMENT
+        return self._queue_tracking_mode(connection)
+
+    def _queue_tracking_mode(self, connection):
+        event = ffi.new("LEAP_TRACKING_MODE_EVENT*")
+        event.current_tracking_mode = connection.tracking_mode
+        connection.queue_response(_EVENT_TRACKING_MODE, "tracking_mode_event", event)
+        return _RS_SUCCESS
+
+    def LeapSetPolicyFlags(self, hConnection, set_flags, clear_flags):
+        connection = self._connection(hConnection)
+        if connection is None:
+            return _RS_INVALID_ARGUMENT
+        connection.policy_flags = (connection.policy_flags | set_flags) & ~clear_flags
+        event = ffi.new("LEAP_POLICY_EVENT*")
+        event.current_policy = connection.policy_flags
+        connection.queue_response(_EVENT_POLICY, "policy_event", event)
+        return _RS_SUCCESS
+
+    def LeapGetDeviceList(self, hConnection, pArray, pnArray):
+        if pArray != ffi.NULL and pnArray[0] >= 1:
+            pArray[0].handle = ffi.cast("void*", _DEVICE_ID)
+            pArray[0].id = _DEVICE_ID
+        pnArray[0] = 1
+        return _RS_SUCCESS
+
+    def LeapOpenDevice(self, rDevice, phDevice):
+        phDevice[0] = ffi.cast("LEAP_DEVICE", _DEVICE_ID)
+        return _RS_SUCCESS
+
+    def LeapCloseDevice(self, hDevice):
+        pass
+
+    def LeapGetDeviceInfo(self, hDevice, info):
+        info.status = _DEVICE_STATUS_STREAMING
+        info.caps = 0
+        info.pid = self.eLeapDevicePID_LMC2
+        info.baseline = 40000
+        info.h_fov = math.radians(160)
+        info.v_fov = math.radians(160)
+        info.range = 800000
+        if info.serial != ffi.NULL:
+            ffi.memmove(info.serial, _DEVICE_SERIAL, min(info.serial_length, len(_DEVICE_SERIAL)))
+        info.serial_length = len(_DEVICE_SERIAL) + 1
+        return _RS_SUCCESS
+
+    def LeapGetDeviceCameraCount(self, hDevice, pCameraCount):
+        pCameraCount[0] = 2
+        return _RS_SUCCESS
+
+    def LeapSetPrimaryDevice(self, hConnection, hDevice, unsubscribeOthers):
+        return _RS_SUCCESS
+
+    def LeapSubscribeEvents(self, hConnection, hDevice):
+        return _RS_SUCCESS
+
+    def LeapUnsubscribeEvents(self, hConnection, hDevice):
+        return _RS_SUCCESS
+
+    def LeapGetServerStatus(self, timeout, status):
+        strings = [ffi.new("char[]", b"simulated"), ffi.new("char[]", _DEVICE_SERIAL)]
+        strings.append(ffi.new("char[]", b"Simulated Device"))
+        devices = ffi.new("LEAP_SERVER_STATUS_DEVICE[1]")
+        devices[0].serial = strings[1]
+        devices[0].type = strings[2]
+        server_status = ffi.new("LEAP_SERVER_STATUS*")
+        server_status.version = strings[0]
+        server_status.device_count = 1
+        server_status.devices = devices
+        self._server_statuses[_handle_key(server_status)] = (server_status, devices, strings)
+        status[0] = server_status
+        return _RS_SUCCESS
+
+    def LeapReleaseServerStatus(self, status):
+        self._server_statuses.pop(_handle_key(status), None)
+
+    def _frame_time(self, hConnection, timestamp: int) -> float:
+        connection = self._connection(hConnection)
+        start = getattr(connection, "_start_time", 0.0)
+        return timestamp / 1e6 - start
+
+    def LeapGetFrameSize(self, hConnection, timestamp, pncbEvent):
+        hands = ffi.new("LEAP_HAND[2]")
+        count = fill_hands(hands, self.num_hands, self._frame_time(hConnection, timestamp))
+        pncbEvent[0] = ffi.sizeof("LEAP_TRACKING_EVENT") + count * ffi.sizeof("LEAP_HAND")
+        return _RS_SUCCESS
+
+    def LeapInterpolateFrame(self, hConnection, timestamp, pEvent, ncbEvent):
+        hands = ffi.new("LEAP_HAND[2]")
+        count = fill_hands(hands, self.num_hands, self._frame_time(hConnection, timestamp))
+        size = ffi.sizeof("LEAP_TRACKING_EVENT") + count * ffi.sizeof("LEAP_HAND")
+        if ncbEvent < size:
+            return self.eLeapRS_InsufficientBuffer
+        pEvent.info.timestamp = timestamp
+        pEvent.nHands = count
+        pEvent.framerate = self.framerate
+        pEvent.pHands = ffi.cast(
+            "LEAP_HAND*", ffi.cast("char*", pEvent) + ffi.sizeof("LEAP_TRACKING_EVENT")
+        )
+        ffi.memmove(pEvent.pHands, hands, count * ffi.sizeof("LEAP_HAND"))
+        return _RS_SUCCESS
+
+    def LeapExtrinsicCameraMatrix(self, hConnection, camera, extrinsicMatrix):
+        for i in range(16):
+            extrinsicMatrix[i] = 1.0 if i % 5 == 0 else 0.0
+        return _RS_SUCCESS
+
+    def LeapRecordingOpen(self, ppRecording, filePath, params):
+        try:
+            recording = _SimulatedRecording(ffi.string(filePath).decode("utf-8"), params.mode)
+        except OSError:
+            return _RS_UNKNOWN_ERROR
+        handle = self._new_handle("LEAP_RECORDING")
+        self._recordings[_handle_key(handle)] = recording
+        ppRecording[0] = handle
+        return _RS_SUCCESS
+
+    def LeapRecordingClose(self, ppRecording):
+        recording = self._recordings.pop(_handle_key(ppRecording[0]), None)
+        if recording is None:
+            return _RS_INVALID_ARGUMENT
+        recording.close()
+        return _RS_SUCCESS
+
+    def LeapRecordingGetStatus(self, pRecording, pstatus):
+        recording = self._recordings.get(_handle_key(pRecording))
+        if recording is None:
+            return _RS_INVALID_ARGUMENT
+        pstatus.mode = recording.mode
+        return _RS_SUCCESS
+
+    def LeapRecordingWrite(self, pRecording, pEvent, pnBytesWritten):
+        recording = self._recordings.get(_handle_key(pRecording))
+        if recording is None:
+            return _RS_INVALID_ARGUMENT
+        pnBytesWritten[0] = recording.write(pEvent)
+        return _RS_SUCCESS
+
+    def LeapRecordingReadSize(self, pRecording, pncbEvent):
+        recording = self._recordings.get(_handle_key(pRecording))
+        size = recording.read_size() if recording is not None else None
+        if size is None:
+            # LeapC also returns an unknown error at the end of a recording
+            return _RS_UNKNOWN_ERROR
+        pncbEvent[0] = size
+        return _RS_SUCCESS
+
+    def LeapRecordingRead(self, pRecording, pEvent, ncbEvent):
+        recording = self._recordings.get(_handle_key(pRecording))
+        if recording is None or not recording.read(pEvent, ncbEvent):
+            return _RS_UNKNOWN_ERROR
+        return _RS_SUCCESS
+
+
+libleapc = SimulatedLeapC()
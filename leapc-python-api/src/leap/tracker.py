@@ -0,0 +1,204 @@
+"""Stable identities and recent history for each tracked hand
+
+LeapC orders the hands in a frame arbitrarily, so the first hand is not always the same
+hand. HandTracker follows each hand by its id and type across frames, and keeps its recent
+palm and fingertip states in a `leap.history.History`, a fixed-size ring buffer which is
+allocated once when the hand appears.
+
+A hand is new when its (id, type) has not been seen in the previous frame, or when its
+`visible_time` has gone backwards, which means the tracking service lost the hand and
+reused its id. A hand is lost when it is missing from a frame.
+
+Example:
+```
+tracker = HandTracker(capacity=32)
+connection.add_listener(tracker)
+...
+right = tracker.hand_of_type(HandType.Right)
+if right is not None:
+    recent_heights = right.palm_positions()[:, 1]
+```
+
+NumPy is an optional dependency, only required by this module.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .arrays import fingertip_positions, palm_positions, palm_velocities
+from .enums import HandType
+from .event_listener import Listener
+from .events import TrackingEvent
+from .history import History
+
+
+class TrackedHand:
+    """A hand followed across frames, with its state in the most recent frames
+
+    The states are held in `history`, which has the fields 'palm_position',
+    'palm_velocity' and 'fingertips', and provides windowed statistics of them. The
+    history methods here return copies in chronological order, oldest first. Each takes
+    an optional 'count' to get only the most recent frames.
+
+    :param hand_id: The id of the hand.
+    :param hand_type: The type of the hand.
+    :param capacity: The number of frames of history to keep.
+    """
+
+    def __init__(self, hand_id: int, hand_type: HandType, capacity: int):
+        self.id = hand_id
+        self.type = hand_type
+        # The timestamp at which the hand became visible, in microseconds
+        self.appeared_at = 0
+        self.visible_time = 0
+        self.history = History(
+            capacity, {"palm_position": (3,), "palm_velocity": (3,), "fingertips": (5, 3)}
+        )
+
+    def __len__(self):
+        """The number of frames of history held"""
+        return len(self.history)
+
+    def __repr__(self):
+        return f"TrackedHand(id={self.id}, type={self.type.name}, frames={len(self.history)})"
+
+    @property
+    def capacity(self) -> int:
+        return self.history.capacity
+
+    def push(self, timestamp: int, palm_position, palm_velocity, fingertips):
+        """Add the state of the hand in a new frame, replacing the oldest if full"""
+        self.history.push(timestamp, palm_position, palm_velocity, fingertips)
+
+    @property
+    def timestamp(self) -> int:
+        """The timestamp of the most recent frame, in microseconds"""
+        return self.history.timestamp
+
+    @property
+    def palm_position(self) -> np.ndarray:
+        """A view of the palm position in the most recent frame"""
+        return self.history.latest("palm_position")
+
+    @property
+    def palm_velocity(self) -> np.ndarray:
+        """A view of the palm velocity in the most recent frame"""
+        return self.history.latest("palm_velocity")
+
+    @property
+    def fingertip_positions(self) -> np.ndarray:
+        """A (5, 3) view of the fingertips in the most recent frame"""
+        return self.history.latest("fingertips")
+
+    def timestamps(self, count: Optional[int] = None) -> np.ndarray:
+        """Get the (frames,) timestamps of the recent frames, in microseconds"""
+        return self.history.timestamps(count)
+
+    def palm_positions(self, count: Optional[int] = None) -> np.ndarray:
+        """Get the (frames, 3) palm positions in the recent frames"""
+        return self.history.values("palm_position", count)
+
+    def palm_velocities(self, count: Optional[int] = None) -> np.ndarray:
+        """Get the (frames, 3) palm velocities in the recent frames"""
+        return self.history.values("palm_velocity", count)
+
+    def fingertips(self, count: Optional[int] = None) -> np.ndarray:
+        """Get the (frames, 5, 3) fingertip positions in the recent frames"""
+        return self.history.values("fingertips", count)
+
+
+class HandTrackerListener:
+    """Base class for listeners to a HandTracker
+
+    The methods are called on the thread which delivers tracking events to the tracker.
+    """
+
+    def on_hand_appeared(self, hand: TrackedHand):
+        pass
+
+    def on_hand_lost(self, hand: TrackedHand):
+        pass
+
+
+class HandTracker(Listener):
+    """Follows each hand by its id and type, and keeps its recent history
+
+    It can be added to a Connection as a listener, or given frames with `update`.
+
+    :param capacity: The number of frames of history to keep for each hand. Defaults to 64.
+    """
+
+    def __init__(self, capacity: int = 64):
+        if capacity < 1:
+            raise ValueError("The history must hold at least one frame")
+        self._capacity = capacity
+        self._hands: Dict[Tuple[int, int], TrackedHand] = {}
+        self._listeners: List[HandTrackerListener] = []
+
+    def add_listener(self, listener: HandTrackerListener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: HandTrackerListener):
+        self._listeners.remove(listener)
+
+    @property
+    def hands(self) -> List[TrackedHand]:
+        """The hands in the most recent frame"""
+        return list(self._hands.values())
+
+    def get(self, hand_id: int) -> Optional[TrackedHand]:
+        """Get the hand with this id, if it was in the most recent frame"""
+        for (tracked_id, _), hand in self._hands.items():
+            if tracked_id == hand_id:
+                return hand
+        return None
+
+    def hand_of_type(self, hand_type: HandType) -> Optional[TrackedHand]:
+        """Get the hand of this type in the most recent frame. If there are several, the one
+        which has been visible for longest is returned."""
+        hands = [hand for hand in self._hands.values() if hand.type == hand_type]
+        return min(hands, key=lambda hand: hand.appeared_at, default=None)
+
+    def on_tracking_event(self, event):
+        self.update(event)
+
+    def update(self, event: TrackingEvent):
+        """Update the hands with a new frame"""
+        hands = event.as_numpy()
+        timestamp = event.timestamp
+        ids = hands["id"].tolist()
+        types = hands["type"].tolist()
+        visible_times = hands["visible_time"].tolist()
+        positions = palm_positions(hands)
+        velocities = palm_velocities(hands)
+        tips = fingertip_positions(hands)
+
+        previous = self._hands
+        self._hands = {}
+        for row, key in enumerate(zip(ids, types)):
+            hand = previous.pop(key, None)
+            if hand is not None and visible_times[row] < hand.visible_time:
+                # The hand was lost and its id reused between frames
+                self._notify_lost(hand)
+                hand = None
+            if hand is None:
+                hand = TrackedHand(key[0], HandType(key[1]), self._capacity)
+                hand.appeared_at = timestamp - visible_times[row]
+                appeared = True
+            else:
+                appeared = False
+
+            hand.visible_time = visible_times[row]
+            hand.push(timestamp, positions[row], velocities[row], tips[row])
+            self._hands[key] = hand
+            if appeared:
+                for listener in self._listeners:
+                    listener.on_hand_appeared(hand)
+
+        for hand in previous.values():
+            self._notify_lost(hand)
+
+    def _notify_lost(self, hand: TrackedHand):
+        for listener in self._listeners:
+            listener.on_hand_lost(hand)
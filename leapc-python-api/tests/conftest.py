@@ -0,0 +1,38 @@
+"""The tests run against the LeapC simulator, so no Ultraleap install or device is needed"""
+
+import os
+import sys
+
+os.environ["LEAPSDK_SIMULATOR"] = "1"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+import pytest
+
+from leap.events import TrackingEvent
+from leapc_cffi import ffi, libleapc
+
+
+@pytest.fixture
+def simulator():
+    """The simulated LeapC library, with its settings restored after the test"""
+    framerate, num_hands = libleapc.framerate, libleapc.num_hands
+    yield libleapc
+    libleapc.framerate, libleapc.num_hands = framerate, num_hands
+
+
+@pytest.fixture
+def tracking_event():
+    """Make a TrackingEvent which owns its hands, at a time in the simulated motion"""
+    from leap.simulator import fill_hands
+
+    def make(t: float = 0.0, num_hands: int = 2, frame_id: int = 0, timestamp: int = 0, **kwargs):
+        data = ffi.new("LEAP_TRACKING_EVENT*")
+        hands = ffi.new("LEAP_HAND[2]")
+        data.nHands = fill_hands(hands, num_hands, t)
+        data.pHands = hands
+        data.info.frame_id = data.tracking_frame_id = frame_id
+        data.info.timestamp = timestamp
+        data.framerate = 120
+        return TrackingEvent(data, **kwargs)
+
+    return make
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from leap.arrays import (
+    HAND_DTYPE,
+    TRACKING_EVENT_DTYPE,
+    arm_joints,
+    fingertip_positions,
+    joint_positions,
+    palm_positions,
+    tracking_columns,
+)
+from leapc_cffi import ffi
+
+
+def test_dtypes_match_the_structs():
+    assert HAND_DTYPE.itemsize == ffi.sizeof("LEAP_HAND")
+    assert TRACKING_EVENT_DTYPE.itemsize == ffi.sizeof("LEAP_TRACKING_EVENT")
+    assert HAND_DTYPE.fields["palm"][1] == ffi.offsetof("LEAP_HAND", "palm")
+
+
+def test_hands_are_a_view_of_the_event(tracking_event):
+    event = tracking_event(1.0)
+    hands = event.as_numpy()
+    assert hands.shape == (2,)
+    hand = event.hands[1]
+    assert hands["id"][1] == hand.id
+    assert palm_positions(hands)[1] == pytest.approx(np.array(list(hand.palm.position)))
+    # Writing to the array writes to the event's hands
+    palm_positions(hands)[1, 0] = 12.5
+    assert hand.palm.position.x == 12.5
+
+
+def test_joint_helpers(tracking_event):
+    hand = tracking_event(1.0).hands[0]
+    hands = tracking_event(1.0).as_numpy()
+    joints = joint_positions(hands)
+    assert joints.shape == (2, 5, 5, 3)
+    assert joints[0, 1, 0] == pytest.approx(np.array(list(hand.index.metacarpal.prev_joint)))
+    assert joints[0, 1, 4] == pytest.approx(np.array(list(hand.index.distal.next_joint)))
+    assert fingertip_positions(hands)[0] == pytest.approx(joints[0, :, 4])
+    assert arm_joints(hands)[0, 1] == pytest.approx(np.array(list(hand.arm.next_joint)))
+
+
+def test_event_without_hands(tracking_event):
+    assert tracking_event(num_hands=0).as_numpy().shape == (0,)
+
+
+def test_tracking_columns(tracking_event):
+    events = np.zeros(2, dtype=TRACKING_EVENT_DTYPE)
+    hands = np.zeros((2, 2), dtype=HAND_DTYPE)
+    for row, num_hands in enumerate((2, 1)):
+        event = tracking_event(1.0, num_hands, frame_id=row, timestamp=row * 10)
+        events[row]["info"]["frame_id"] = row
+        events[row]["info"]["timestamp"] = row * 10
+        events[row]["nHands"] = num_hands
+        hands[row, :num_hands] = event.as_numpy()
+
+    columns = tracking_columns(events, hands)
+    assert columns["timestamp"].tolist() == [0, 10]
+    assert columns["num_hands"].tolist() == [2, 1]
+    assert columns["palm_position"].shape == (2, 2, 3)
+    assert columns["joints"].shape == (2, 2, 5, 5, 3)
+    assert columns["hand_id"][0].tolist() == hands["id"][0].tolist()
+    assert not columns["palm_position"][1, 1].any()
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+import leap
+import leap.connection
+from leap.async_connection import AsyncConnection
+from leap.enums import EventType, PolicyFlag
+from leap.exceptions import LeapTimeoutError
+
+
+def test_events_keep_the_polled_frame(simulator, monkeypatch):
+    """Events passed to the event loop must not change when LeapC reuses its message"""
+    polled = {}
+
+    def create_event(message, **kwargs):
+        event = leap.events.create_event(message, **kwargs)
+        if message.type == EventType.Tracking.value:
+            info = message.tracking_event.info
+            polled[id(event)] = (info.frame_id, info.timestamp, event)
+        return event
+
+    monkeypatch.setattr(leap.connection, "create_event", create_event)
+    simulator.framerate = 500
+
+    async def receive():
+        received = []
+        async with AsyncConnection() as connection:
+            async for event in connection.events(EventType.Tracking, max_size=4):
+                # A slow consumer, which the poll thread gets ahead of
+                await asyncio.sleep(0.01)
+                received.append(event)
+                if len(received) == 10:
+                    break
+        return received
+
+    received = asyncio.run(receive())
+    for event in received:
+        frame_id, timestamp, _ = polled[id(event)]
+        assert event.tracking_frame_id == frame_id
+        assert event.timestamp == timestamp
+
+
+def test_set_policy_flags_returns_the_response(simulator):
+    async def set_flags():
+        async with AsyncConnection() as connection:
+            await connection.set_policy_flags([PolicyFlag.Images])
+            return await connection.get_policy_flags()
+
+    assert PolicyFlag.Images in asyncio.run(set_flags())
+
+
+def test_wait_for_times_out(simulator):
+    async def wait():
+        async with AsyncConnection() as connection:
+            await connection.wait_for(EventType.ConfigChange, timeout=0.05)
+
+    with pytest.raises(LeapTimeoutError):
+        asyncio.run(wait())
+
+
+def _routed_types(connection: AsyncConnection):
+    return {
+        event_type
+        for event_type, handlers in connection.connection._routes.items()
+        if connection._listener.on_event in handlers
+    }
+
+
+def test_only_consumed_event_types_are_routed(simulator, monkeypatch):
+    created = set()
+
+    def create_event(message, **kwargs):
+        event = leap.events.create_event(message, **kwargs)
+        created.add(event.type)
+        return event
+
+    monkeypatch.setattr(leap.connection, "create_event", create_event)
+
+    async def consume():
+        async with AsyncConnection() as connection:
+            # Nothing is waiting once connected
+            assert _routed_types(connection) == set()
+            events = connection.events(EventType.Tracking)
+            await events.__anext__()
+            assert _routed_types(connection) == {EventType.Tracking}
+            created.clear()
+            for _ in range(3):
+                await events.__anext__()
+            # Events which nothing consumes are not created
+            assert created == {EventType.Tracking}
+            await events.aclose()
+            assert _routed_types(connection) == set()
+
+            every = connection.events()
+            await every.__anext__()
+            assert _routed_types(connection) == set(EventType)
+            await every.aclose()
+
+            waiter = asyncio.ensure_future(connection.wait_for(EventType.Device, timeout=0.05))
+            await asyncio.sleep(0)
+            assert _routed_types(connection) == {EventType.Device}
+            with pytest.raises(LeapTimeoutError):
+                await waiter
+            assert _routed_types(connection) == set()
+
+    asyncio.run(consume())
+
+
+def test_start_polling_requires_an_open_connection(simulator):
+    connection = leap.Connection()
+    with pytest.raises(leap.exceptions.LeapNotConnectedError):
+        connection.start_polling()
+
+
+def test_update_listener_requires_an_added_listener(simulator):
+    with pytest.raises(ValueError):
+        leap.Connection().update_listener(leap.Listener())
@@ -0,0 +1,127 @@
+import threading
+import time
+
+import pytest
+
+import leap
+import leap.connection
+from leap.enums import EventType, PolicyFlag, TrackingMode
+from leap.exceptions import LeapTimeoutError
+
+
+class _DuckListener:
+    """A listener which does not subclass Listener"""
+
+    def __init__(self):
+        self.types = set()
+
+    def on_event(self, event):
+        self.types.add(event.type)
+
+
+class _TrackingListener(leap.Listener):
+    def __init__(self):
+        self.types = set()
+
+    def on_tracking_event(self, event):
+        self.types.add(event.type)
+
+
+def test_duck_typed_listener_receives_every_event(simulator):
+    listener = _DuckListener()
+    connection = leap.Connection(listeners=[listener])
+    with connection.open():
+        time.sleep(0.1)
+    assert {EventType.Connection, EventType.Device, EventType.Tracking} <= listener.types
+
+
+def test_events_are_routed_by_type(simulator):
+    listener = _TrackingListener()
+    connection = leap.Connection(listeners=[listener])
+    assert set(connection._routes) == {EventType.Tracking}
+    with connection.open():
+        time.sleep(0.1)
+    assert listener.types == {EventType.Tracking}
+
+
+def test_unconsumed_events_are_not_created(simulator, monkeypatch):
+    created = []
+
+    def create_event(message, **kwargs):
+        created.append(EventType(message.type))
+        return leap.events.create_event(message, **kwargs)
+
+    monkeypatch.setattr(leap.connection, "create_event", create_event)
+    connection = leap.Connection()
+    with connection.open():
+        time.sleep(0.1)
+    assert EventType.Tracking not in created
+
+
+def test_concurrent_listener_changes_leave_consistent_routes(simulator):
+    connection = leap.Connection()
+    kept = [_TrackingListener() for _ in range(4)]
+
+    def churn(listener):
+        for _ in range(200):
+            connection.add_listener(listener)
+            connection.remove_listener(listener)
+        connection.add_listener(listener)
+
+    threads = [threading.Thread(target=churn, args=(listener,)) for listener in kept]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    handlers = connection._routes[EventType.Tracking]
+    assert sorted(id(handler.__self__) for handler in handlers) == sorted(map(id, kept))
+    assert EventType.Tracking.value in connection._subscribed_types
+
+
+def _assert_nothing_waits(connection):
+    assert connection._waiters == {}
+    assert EventType.TrackingMode.value not in connection._subscribed_types
+    assert EventType.Policy.value not in connection._subscribed_types
+
+
+def test_get_tracking_mode_returns_the_response(simulator):
+    connection = leap.Connection()
+    with connection.open():
+        connection.set_tracking_mode(TrackingMode.HMD)
+        assert connection.get_tracking_mode() == TrackingMode.HMD
+        _assert_nothing_waits(connection)
+
+
+def test_set_policy_flags_returns_the_response(simulator):
+    connection = leap.Connection()
+    with connection.open():
+        assert PolicyFlag.Images in connection.set_policy_flags([PolicyFlag.Images])
+        _assert_nothing_waits(connection)
+        flags = connection.set_policy_flags(flags_to_clear=[PolicyFlag.Images])
+        assert PolicyFlag.Images not in flags
+        _assert_nothing_waits(connection)
+
+
+def test_wait_for_times_out(simulator):
+    connection = leap.Connection()
+    with connection.open():
+        with pytest.raises(LeapTimeoutError):
+            connection.wait_for(EventType.ConfigChange, timeout=0.05)
+        assert connection._waiters == {}
+
+
+def test_waiter_is_removed_when_the_call_fails(simulator):
+    def fail():
+        raise RuntimeError
+
+    connection = leap.Connection()
+    with connection.open():
+        with pytest.raises(RuntimeError):
+            connection._call_and_wait_for_event(EventType.Policy, fail)
+        _assert_nothing_waits(connection)
+
+
+def test_wait_for_requires_an_open_connection(simulator):
+    with pytest.raises(leap.exceptions.LeapNotConnectedError):
+        leap.Connection().wait_for(EventType.Tracking, timeout=0.05)
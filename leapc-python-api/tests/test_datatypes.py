@@ -0,0 +1,58 @@
+import gc
+
+from leap.datatypes import Bone, Digit, Hand
+from leap.pool import HandBufferPool
+
+
+def test_collections_are_lists(tracking_event):
+    event = tracking_event()
+    hands = event.hands
+    assert isinstance(hands, list) and len(hands) == 2
+    assert isinstance(hands[0].digits, list) and len(hands[0].digits) == 5
+    assert isinstance(hands[0].thumb.bones, list) and len(hands[0].thumb.bones) == 4
+
+
+def test_returned_lists_can_be_modified(tracking_event):
+    event = tracking_event()
+    event.hands.clear()
+    event.hands[0].digits.pop()
+    event.hands[0].thumb.bones.pop()
+    assert len(event.hands) == 2
+    assert len(event.hands[0].digits) == 5
+    assert len(event.hands[0].thumb.bones) == 4
+
+
+def test_wrappers_are_reused(tracking_event):
+    event = tracking_event()
+    hand = event.hands[0]
+    assert hand is event.hands[0]
+    assert hand.palm is hand.palm
+    assert hand.palm.position is hand.palm.position
+    assert hand.digits[1] is hand.index
+    assert hand.index.bones[3] is hand.index.distal
+    assert hand.index.distal.next_joint is hand.index.distal.next_joint
+
+
+def test_children_keep_the_hand_data_alive(tracking_event):
+    event = tracking_event(1.0)
+    expected = event.hands[0].index.distal.next_joint.x
+    joint = event.hands[0].index.distal.next_joint
+    del event
+    gc.collect()
+    assert joint.x == expected
+
+
+def test_released_event_has_no_hands(tracking_event):
+    event = tracking_event(hand_pool=HandBufferPool(1))
+    event.hands
+    event.release()
+    assert event.hands == []
+
+
+def test_wrappers_have_no_instance_dict(tracking_event):
+    hand = tracking_event().hands[0]
+    for wrapper in (hand, hand.palm, hand.thumb, hand.thumb.distal, hand.palm.position):
+        assert not hasattr(wrapper, "__dict__")
+    assert all(isinstance(d, Digit) for d in hand.digits)
+    assert all(isinstance(b, Bone) for b in hand.thumb.bones)
+    assert isinstance(hand, Hand)
@@ -0,0 +1,142 @@
+import threading
+import time
+
+import pytest
+
+import leap
+import leap.connection
+from leap.dispatch import EventDispatcher, OverflowPolicy
+from leap.enums import EventType
+
+
+class _SlowListener(leap.Listener):
+    def __init__(self, delay):
+        self.delay = delay
+        self.received = []
+
+    def on_tracking_event(self, event):
+        time.sleep(self.delay)
+        self.received.append(event)
+
+
+def test_dispatched_events_keep_the_polled_frame(simulator, monkeypatch):
+    """Events queued for a slow listener must not change when LeapC reuses its message"""
+    polled = {}
+
+    def create_event(message, **kwargs):
+        event = leap.events.create_event(message, **kwargs)
+        if message.type == EventType.Tracking.value:
+            info = message.tracking_event.info
+            polled[id(event)] = (info.frame_id, info.timestamp, event)
+        return event
+
+    monkeypatch.setattr(leap.connection, "create_event", create_event)
+    simulator.framerate = 500
+    listener = _SlowListener(0.02)
+    connection = leap.Connection(
+        listeners=[listener],
+        dispatch_queue_size=8,
+        dispatch_overflow_policy=OverflowPolicy.DropOldest,
+    )
+    with connection.open():
+        time.sleep(0.3)
+
+    assert len(listener.received) > 5
+    for event in listener.received:
+        frame_id, timestamp, _ = polled[id(event)]
+        assert event.info.frame_id == frame_id
+        assert event.tracking_frame_id == frame_id
+        assert event.timestamp == timestamp
+        assert event.metadata.event_type == EventType.Tracking
+
+
+def _connection_event():
+    from leapc_cffi import ffi
+
+    return leap.events.ConnectionEvent(ffi.new("LEAP_CONNECTION_EVENT*"))
+
+
+def _frame_ids(dispatcher):
+    return [event.tracking_frame_id for event in dispatcher._queue]
+
+
+def test_drop_newest_discards_the_new_event(tracking_event):
+    dispatcher = EventDispatcher(
+        lambda event: None, max_size=2, overflow_policy=OverflowPolicy.DropNewest
+    )
+    for frame_id in range(4):
+        dispatcher.put(tracking_event(frame_id=frame_id))
+    assert _frame_ids(dispatcher) == [0, 1]
+    assert dispatcher.dropped == 2
+
+
+def test_drop_oldest_discards_the_oldest_event(tracking_event):
+    dispatcher = EventDispatcher(
+        lambda event: None, max_size=2, overflow_policy=OverflowPolicy.DropOldest
+    )
+    for frame_id in range(4):
+        dispatcher.put(tracking_event(frame_id=frame_id))
+    assert _frame_ids(dispatcher) == [2, 3]
+    assert dispatcher.dropped == 2
+    assert dispatcher.max_queue_depth == 2
+
+
+def test_coalesce_tracking_replaces_the_oldest_tracking_event(tracking_event):
+    dispatcher = EventDispatcher(
+        lambda event: None, max_size=2, overflow_policy=OverflowPolicy.CoalesceTracking
+    )
+    connection_event = _connection_event()
+    dispatcher.put(connection_event)
+    dispatcher.put(tracking_event(frame_id=0))
+    dispatcher.put(tracking_event(frame_id=1))
+    assert list(dispatcher._queue)[0] is connection_event
+    assert dispatcher._queue[1].tracking_frame_id == 1
+    assert dispatcher.dropped == 1
+
+
+def test_block_waits_for_space(tracking_event):
+    release = threading.Event()
+    delivered = []
+
+    def deliver(event):
+        release.wait(5)
+        delivered.append(event.tracking_frame_id)
+
+    dispatcher = EventDispatcher(deliver, max_size=1, overflow_policy=OverflowPolicy.Block)
+    dispatcher.start()
+    try:
+        dispatcher.put(tracking_event(frame_id=0))
+        while dispatcher.queue_depth:
+            time.sleep(0.001)
+        dispatcher.put(tracking_event(frame_id=1))
+        putter = threading.Thread(target=dispatcher.put, args=(tracking_event(frame_id=2),))
+        putter.start()
+        putter.join(0.1)
+        assert putter.is_alive()
+        release.set()
+        putter.join(5)
+        assert not putter.is_alive()
+    finally:
+        dispatcher.stop()
+    assert delivered == [0, 1, 2]
+    assert dispatcher.dropped == 0
+
+
+def test_stop_delivers_queued_events(tracking_event):
+    delivered = []
+    dispatcher = EventDispatcher(
+        lambda event: delivered.append(event.tracking_frame_id), max_size=8
+    )
+    dispatcher.start()
+    for frame_id in range(5):
+        dispatcher.put(tracking_event(frame_id=frame_id))
+    dispatcher.stop()
+    assert delivered == [0, 1, 2, 3, 4]
+    assert dispatcher.queue_depth == 0
+
+
+def test_invalid_sizes_are_rejected():
+    with pytest.raises(ValueError):
+        EventDispatcher(lambda event: None, max_size=0)
+    with pytest.raises(ValueError):
+        EventDispatcher(lambda event: None, num_threads=0)
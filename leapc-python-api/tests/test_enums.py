@@ -0,0 +1,67 @@
+from leap import enums
+from leap.enums import EventType, HandType, PolicyFlag, _generate_enum_entries, get_enum_entries
+from leap.events import PolicyEvent
+from leapc_cffi import ffi, libleapc
+
+_FLAGS = PolicyFlag.Images.value | PolicyFlag.MapPoints.value
+
+
+def test_flags_are_decoded():
+    assert get_enum_entries(PolicyFlag, _FLAGS) == [PolicyFlag.Images, PolicyFlag.MapPoints]
+    assert get_enum_entries(PolicyFlag, 0) == []
+
+
+def test_returned_lists_can_be_modified():
+    entries = get_enum_entries(PolicyFlag, _FLAGS)
+    entries.append(PolicyFlag.BackgroundFrames)
+    assert get_enum_entries(PolicyFlag, _FLAGS) == [PolicyFlag.Images, PolicyFlag.MapPoints]
+    assert get_enum_entries(PolicyFlag, _FLAGS) is not get_enum_entries(PolicyFlag, _FLAGS)
+
+
+def test_policy_flags_are_a_list():
+    data = ffi.new("LEAP_POLICY_EVENT*")
+    data.current_policy = _FLAGS
+    flags = PolicyEvent(data).current_policy_flags
+    assert isinstance(flags, list)
+    assert flags == [PolicyFlag.Images, PolicyFlag.MapPoints]
+
+
+class _Container:
+    eLeapFoo_One = 1
+    eLeapFoo_Two = 2
+    eLeapBar_Three = 3
+    eLeapFoo_None = 4
+    eLeapNoSeparator = 5
+    other = 6
+
+
+def test_enum_entries_are_generated_by_name():
+    assert list(_generate_enum_entries(_Container, "Foo")) == [
+        ("FooNone", 4),
+        ("One", 1),
+        ("Two", 2),
+    ]
+    assert list(_generate_enum_entries(_Container, "Bar")) == [("Three", 3)]
+    assert list(_generate_enum_entries(_Container, "Missing")) == []
+
+
+def test_libleapc_is_scanned_once(monkeypatch):
+    def fail(container):
+        raise AssertionError("libleapc was scanned again")
+
+    monkeypatch.setattr(enums, "_build_enum_tables", fail)
+    assert list(_generate_enum_entries(libleapc, "HandType")) == [("Left", 0), ("Right", 1)]
+
+
+def test_short_lived_containers_get_their_own_entries():
+    # Containers which are garbage collected may have their id reused by the next one
+    for value in range(200):
+        container = type("Container", (), {"eLeapFoo_One": value})
+        assert list(_generate_enum_entries(container, "Foo")) == [("One", value)]
+
+
+def test_leapc_enums_match_a_per_enum_scan():
+    for enum_type in (PolicyFlag, HandType, EventType):
+        prefix = f"eLeap{enum_type.__name__}_"
+        expected = {getattr(libleapc, attr) for attr in dir(libleapc) if attr.startswith(prefix)}
+        assert {entry.value for entry in enum_type} == expected
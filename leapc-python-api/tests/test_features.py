@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from leap.arrays import tracking_columns
+from leap.features import FEATURE_INDEX, FEATURE_NAMES, NUM_FEATURES, FeatureExtractor
+from leap.framelog import FrameLog, FrameLogWriter
+
+
+def _tip(digit):
+    return np.array(list(digit.distal.next_joint))
+
+
+def test_feature_names_are_unique():
+    assert len(set(FEATURE_NAMES)) == NUM_FEATURES
+    assert [FEATURE_NAMES[i] for i in FEATURE_INDEX.values()] == list(FEATURE_NAMES)
+
+
+def test_features_of_an_event(tracking_event):
+    event = tracking_event(1.0)
+    features = FeatureExtractor().from_event(event)
+    assert features.shape == (2, NUM_FEATURES)
+    assert features.dtype == np.float32
+
+    hand = event.hands[0]
+    row = dict(zip(FEATURE_NAMES, features[0]))
+    assert row["grab_strength"] == pytest.approx(hand.grab_strength)
+    assert row["pinch_strength"] == pytest.approx(hand.pinch_strength)
+    assert row["thumb_index_distance"] == pytest.approx(
+        np.linalg.norm(_tip(hand.index) - _tip(hand.thumb)), rel=1e-5
+    )
+    assert row["ring_pinky_distance"] == pytest.approx(
+        np.linalg.norm(_tip(hand.pinky) - _tip(hand.ring)), rel=1e-5
+    )
+    extended = [digit.is_extended for digit in hand.digits]
+    assert [row[f"{d}_extended"] for d in ("thumb", "index", "middle", "ring", "pinky")] == [
+        float(e) for e in extended
+    ]
+    assert row["extended_count"] == sum(extended)
+    velocity = np.array(list(hand.palm.velocity))
+    assert row["palm_speed"] == pytest.approx(np.linalg.norm(velocity), rel=1e-5)
+
+
+def test_interaction_box(tracking_event):
+    extractor = FeatureExtractor(box_center=(0, 0, 0), box_size=(2, 2, 2))
+    hands = tracking_event(1.0).as_numpy()
+    hands["palm"]["position"]["v"][0] = (0.5, -1.0, 0.25)
+    row = dict(zip(FEATURE_NAMES, extractor.from_hands(hands)[0]))
+    assert (row["box_x"], row["box_y"], row["box_z"]) == pytest.approx((0.5, -1.0, 0.25))
+    assert row["box_distance"] == pytest.approx(1.0)
+
+
+def test_features_written_to_out(tracking_event):
+    hands = tracking_event(1.0).as_numpy()
+    out = np.full((2, NUM_FEATURES), np.nan, dtype=np.float32)
+    assert FeatureExtractor().from_hands(hands, out) is out
+    assert not np.isnan(out).any()
+
+
+def test_listener_keeps_the_features_of_each_event(tracking_event):
+    extractor = FeatureExtractor()
+    first = tracking_event(1.0)
+    extractor.on_tracking_event(first)
+    features, hand_ids = extractor.features, extractor.hand_ids
+    extractor.on_tracking_event(tracking_event(num_hands=1))
+
+    assert extractor.features.shape == (1, NUM_FEATURES)
+    assert features.shape == (2, NUM_FEATURES)
+    assert hand_ids.tolist() == [hand.id for hand in first.hands]
+    assert extractor.hand_types.shape == (1,)
+
+
+def test_recorded_features_match_live_features(tmp_path, tracking_event):
+    path = str(tmp_path / "frames.lfl")
+    events = [tracking_event(i / 10, i % 3, frame_id=i, timestamp=i) for i in range(6)]
+    with FrameLogWriter(path) as writer:
+        for event in events:
+            writer.write(event)
+
+    extractor = FeatureExtractor()
+    with FrameLog(path) as log:
+        features = extractor.from_columns(tracking_columns(*log.as_numpy()))
+    assert features.shape == (6, 2, NUM_FEATURES)
+    for event, frame_features in zip(events, features):
+        num_hands = len(event.hands)
+        assert frame_features[:num_hands] == pytest.approx(extractor.from_event(event))
+        # Unused hand slots are zero
+        assert not frame_features[num_hands:].any()
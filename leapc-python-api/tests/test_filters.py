@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+
+import leap
+from leap.enums import EventType
+from leap.events import Event
+from leap.filters import FilteredListener, LatencyBudget, OneEuroFilter
+
+
+class _Collector(leap.Listener):
+    def __init__(self):
+        self.events = []
+
+    def on_event(self, event):
+        self.events.append(event)
+
+
+class _RecordingFilter:
+    """Passes points through unchanged, recording each call and reset"""
+
+    def __init__(self):
+        self.calls = []
+        self.resets = []
+
+    def __call__(self, keys, timestamp, points):
+        self.calls.append((list(keys), timestamp))
+        return points
+
+    def reset(self, key=None):
+        self.resets.append(key)
+
+
+def test_one_euro_filter_reduces_jitter():
+    rng = np.random.default_rng(0)
+    point_filter = OneEuroFilter(min_cutoff=1.0, beta=0.0)
+    raw = 100 + rng.normal(0, 1, (200, 1, 3)).astype(np.float32)
+    filtered = np.array([point_filter([1], i * 8333, raw[i]) for i in range(len(raw))])
+    assert filtered[0] == pytest.approx(raw[0])
+    assert filtered[50:].std() < raw[50:].std() / 2
+
+
+def test_one_euro_filter_follows_fast_motion():
+    point_filter = OneEuroFilter(min_cutoff=1.0, beta=1.0)
+    for i in range(100):
+        position = np.full((1, 1, 3), i * 10.0, dtype=np.float32)
+        filtered = point_filter([1], i * 8333, position)
+    assert filtered[0, 0, 0] == pytest.approx(990, abs=20)
+
+
+def test_one_euro_filter_resets_a_key():
+    point_filter = OneEuroFilter()
+    point_filter([1], 0, np.zeros((1, 1, 3)))
+    point_filter.reset(1)
+    new = point_filter([1], 8333, np.full((1, 1, 3), 50.0))
+    assert new[0, 0, 0] == 50.0
+
+
+@pytest.mark.parametrize("kwargs", [{"min_cutoff": 0}, {"d_cutoff": -1.0}])
+def test_one_euro_filter_rejects_invalid_cutoffs(kwargs):
+    with pytest.raises(ValueError):
+        OneEuroFilter(**kwargs)
+
+
+def test_filtered_event_is_built_from_the_event(tracking_event):
+    listener = FilteredListener(_Collector(), _RecordingFilter())
+    event = tracking_event(1.0, frame_id=7, timestamp=8333)
+    palm_x = event.hands[0].palm.position.x
+
+    # The struct an event was created from may be reused by LeapC before a dispatched
+    # listener filters it, so the filtered event must not be built from it
+    event._data.info.frame_id = 8
+    event._data.info.timestamp = 0
+    event._data.nHands = 0
+    filtered = listener.filter_event(event)
+    assert filtered.info.frame_id == 7
+    assert filtered.timestamp == 8333
+    assert filtered.tracking_frame_id == 7
+    assert filtered.framerate == 120
+    assert len(filtered.hands) == 2
+    assert filtered.hands[0].palm.position.x == pytest.approx(palm_x)
+    assert filtered._hands != event._hands
+
+
+def test_filter_uses_the_event_timestamp(tracking_event):
+    point_filter = _RecordingFilter()
+    listener = FilteredListener(_Collector(), point_filter)
+    event = tracking_event(timestamp=8333)
+    listener.filter_event(event)
+    assert point_filter.calls == [([hand.id for hand in event.hands], 8333)]
+    assert listener.latency.count == 1
+
+
+def test_filtered_positions_are_written_back(tracking_event):
+    def offset(keys, timestamp, points):
+        return points + 1
+
+    listener = FilteredListener(_Collector(), offset)
+    event = tracking_event(1.0)
+    filtered = listener.filter_event(event)
+    source, result = event.hands[0], filtered.hands[0]
+    assert result.palm.position.x == pytest.approx(source.palm.position.x + 1)
+    assert result.index.distal.next_joint.y == pytest.approx(source.index.distal.next_joint.y + 1)
+    assert result.arm.prev_joint.z == pytest.approx(source.arm.prev_joint.z + 1)
+
+
+def test_lost_hands_are_reset(tracking_event):
+    point_filter = _RecordingFilter()
+    listener = FilteredListener(_Collector(), point_filter)
+    both = tracking_event(num_hands=2)
+    ids = [hand.id for hand in both.hands]
+    listener.filter_event(both)
+    listener.filter_event(tracking_event(num_hands=1, timestamp=8333))
+    assert point_filter.resets == ids[1:]
+
+
+def test_other_events_are_passed_on(tracking_event):
+    collector = _Collector()
+    listener = FilteredListener(collector, _RecordingFilter())
+    other = Event(None)
+    listener.on_event(other)
+    listener.on_event(tracking_event())
+    assert collector.events[0] is other
+    assert collector.events[1].type == EventType.Tracking
+    assert listener.latency.count == 1
+
+
+class _DuckCollector:
+    """A listener which does not subclass Listener"""
+
+    def __init__(self):
+        self.events = []
+
+    def on_event(self, event):
+        self.events.append(event)
+
+
+def test_duck_typed_listener_receives_every_event(tracking_event):
+    collector = _DuckCollector()
+    listener = FilteredListener(collector, _RecordingFilter())
+    handlers = listener.event_handlers()
+    assert set(handlers) == set(EventType)
+    other = Event(None)
+    handlers[EventType.Device](other)
+    event = tracking_event()
+    handlers[EventType.Tracking](event)
+    assert collector.events[0] is other
+    assert collector.events[1] is not event
+    assert collector.events[1].type == EventType.Tracking
+    assert listener.latency.count == 1
+
+
+def test_latency_budget_statistics():
+    budget = LatencyBudget(0.001, capacity=4)
+    assert budget.mean() == 0.0 and budget.max() == 0 and budget.percentile(50) == 0.0
+    for i, latency in enumerate([500_000, 2_000_000, 1_000_000, 3_000_000, 100_000]):
+        budget.record(i, latency)
+    assert budget.count == 5
+    assert budget.over_budget == 2
+    # Only the most recent latencies are kept
+    assert budget.max() == 3_000_000
+    assert budget.mean() == pytest.approx(1_525_000)
+    assert budget.percentile(100) == 3_000_000
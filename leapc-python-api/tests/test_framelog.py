@@ -0,0 +1,128 @@
+import gc
+import struct
+
+import numpy as np
+import pytest
+
+from leap.framelog import FrameLog, FrameLogWriter, _HEADER
+
+
+@pytest.fixture
+def log_path(tmp_path, tracking_event):
+    path = str(tmp_path / "frames.lfl")
+    with FrameLogWriter(path) as writer:
+        for frame_id in range(10):
+            writer.write(
+                tracking_event(frame_id / 10, frame_id % 3, frame_id=frame_id, timestamp=frame_id)
+            )
+    return path
+
+
+def test_frames_read_back_in_any_order(log_path, tracking_event):
+    with FrameLog(log_path) as log:
+        assert len(log) == 10
+        event = log[7]
+        expected = tracking_event(0.7, 1)
+        assert event.tracking_frame_id == 7
+        assert event.timestamp == 7
+        assert len(event.hands) == 1
+        assert event.hands[0].palm.position.x == expected.hands[0].palm.position.x
+        assert log[-1].tracking_frame_id == 9
+        assert [event.tracking_frame_id for event in log] == list(range(10))
+        with pytest.raises(IndexError):
+            log[10]
+
+
+def test_events_stay_valid_after_close(log_path):
+    log = FrameLog(log_path)
+    event = log[4]
+    hand = event.hands[0]
+    x = hand.palm.position.x
+    hands = event.as_numpy()
+    events, _ = log.as_numpy()
+    log.close()
+    del log
+    gc.collect()
+
+    assert event.tracking_frame_id == 4
+    assert hand.palm.position.x == x
+    assert hands["palm"]["position"]["v"][0, 0] == x
+    assert events["tracking_frame_id"].tolist() == list(range(10))
+
+
+def test_closed_log_cannot_be_read(log_path):
+    log = FrameLog(log_path)
+    log.close()
+    with pytest.raises(ValueError):
+        log[0]
+    with pytest.raises(ValueError):
+        log.as_numpy()
+
+
+def test_hand_outlives_its_event(log_path):
+    with FrameLog(log_path) as log:
+        hand = log[1].hands[0]
+    gc.collect()
+    assert hand.id == hand.c_data.id
+
+
+def test_as_numpy_views_every_record(log_path):
+    with FrameLog(log_path) as log:
+        events, hands = log.as_numpy()
+        assert events["nHands"].tolist() == [frame_id % 3 for frame_id in range(10)]
+        # Unused hands are zeroed
+        assert np.all(hands["id"][events["nHands"] == 0] == 0)
+
+
+def test_empty_log(tmp_path):
+    path = str(tmp_path / "empty.lfl")
+    FrameLogWriter(path).close()
+    with FrameLog(path) as log:
+        assert len(log) == 0
+        events, hands = log.as_numpy()
+        assert len(events) == len(hands) == 0
+
+
+def test_different_layout_is_rejected(log_path):
+    with open(log_path, "r+b") as fp:
+        header = bytearray(fp.read(_HEADER.size))
+        fields = list(_HEADER.unpack(header))
+        fields[-1] ^= 1
+        fp.seek(0)
+        fp.write(_HEADER.pack(*fields))
+    with pytest.raises(ValueError, match="layout"):
+        FrameLog(log_path)
+
+
+def test_not_a_frame_log(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(struct.pack("<Q", 0) * 16)
+    with pytest.raises(ValueError):
+        FrameLog(str(path))
+
+
+def test_writing_to_events_does_not_change_the_file(log_path):
+    with open(log_path, "rb") as fp:
+        contents = fp.read()
+    with FrameLog(log_path) as log:
+        event = log[1]
+        event.as_numpy()["palm"]["position"]["v"][0] = 1.0
+        events, hands = log.as_numpy()
+        hands["id"][:] = 7
+        assert event.hands[0].palm.position.x == 1.0
+    with open(log_path, "rb") as fp:
+        assert fp.read() == contents
+
+
+def test_frames_are_written_from_the_event(tmp_path, tracking_event):
+    path = str(tmp_path / "frames.lfl")
+    event = tracking_event(1.0, frame_id=3, timestamp=30)
+    # The struct an event was created from may have been reused by LeapC
+    event._data.info.frame_id = 4
+    event._data.nHands = 0
+    with FrameLogWriter(path) as writer:
+        writer.write(event)
+    with FrameLog(path) as log:
+        assert log[0].info.frame_id == 3
+        assert log[0].timestamp == 30
+        assert len(log[0].hands) == 2
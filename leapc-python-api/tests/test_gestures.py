@@ -0,0 +1,207 @@
+import math
+
+import numpy as np
+import pytest
+
+from leap.enums import HandType
+from leap.features import FEATURE_INDEX, NUM_FEATURES
+from leap.gestures import (
+    Condition,
+    Gesture,
+    GestureEngine,
+    GestureListener,
+    GesturePhase,
+    above,
+    below,
+)
+
+_LEFT = HandType.Left.value
+_RIGHT = HandType.Right.value
+_MS = 1000
+
+
+class _Collector(GestureListener):
+    def __init__(self):
+        self.events = []
+
+    def on_gesture_start(self, event):
+        self.events.append(event)
+
+    def on_gesture_end(self, event):
+        self.events.append(event)
+
+    def phases(self):
+        return [(event.gesture, event.phase, event.timestamp) for event in self.events]
+
+
+def _features(**values):
+    features = np.zeros((1, NUM_FEATURES), dtype=np.float32)
+    for name, value in values.items():
+        features[0, FEATURE_INDEX[name]] = value
+    return features
+
+
+def _engine(*gestures):
+    engine = GestureEngine(gestures)
+    collector = _Collector()
+    engine.add_listener(collector)
+    return engine, collector
+
+
+def test_gesture_starts_after_min_duration():
+    engine, collector = _engine(
+        Gesture("pinch", [above("pinch_strength", 0.8)], min_duration=0.05)
+    )
+    engine.update(_features(pinch_strength=0.9), [1], [_LEFT], 0)
+    engine.update(_features(pinch_strength=0.9), [1], [_LEFT], 40 * _MS)
+    assert collector.events == []
+    engine.update(_features(pinch_strength=0.9), [1], [_LEFT], 50 * _MS)
+    assert collector.phases() == [("pinch", GesturePhase.Start, 50 * _MS)]
+    assert engine.active(1) == ["pinch"]
+
+    event = collector.events[0]
+    assert event.hand_id == 1 and event.hand_type == HandType.Left
+    assert event.features[FEATURE_INDEX["pinch_strength"]] == pytest.approx(0.9)
+
+    engine.update(_features(pinch_strength=0.1), [1], [_LEFT], 60 * _MS)
+    assert collector.phases()[1] == ("pinch", GesturePhase.End, 60 * _MS)
+    assert engine.active(1) == []
+
+
+def test_interrupted_gesture_does_not_start():
+    engine, collector = _engine(
+        Gesture("pinch", [above("pinch_strength", 0.8)], min_duration=0.05)
+    )
+    engine.update(_features(pinch_strength=0.9), [1], [_LEFT], 0)
+    engine.update(_features(pinch_strength=0.1), [1], [_LEFT], 30 * _MS)
+    engine.update(_features(pinch_strength=0.9), [1], [_LEFT], 60 * _MS)
+    assert collector.events == []
+    engine.update(_features(pinch_strength=0.9), [1], [_LEFT], 110 * _MS)
+    assert collector.phases() == [("pinch", GesturePhase.Start, 110 * _MS)]
+
+
+def test_hysteresis_keeps_an_active_gesture():
+    engine, collector = _engine(
+        Gesture("pinch", [below("thumb_index_distance", 30, hysteresis=10)])
+    )
+    engine.update(_features(thumb_index_distance=20), [1], [_LEFT], 0)
+    engine.update(_features(thumb_index_distance=35), [1], [_LEFT], 10 * _MS)
+    assert engine.active(1) == ["pinch"]
+    engine.update(_features(thumb_index_distance=41), [1], [_LEFT], 20 * _MS)
+    assert engine.active(1) == []
+    # The widened range only applies while active
+    engine.update(_features(thumb_index_distance=35), [1], [_LEFT], 30 * _MS)
+    assert engine.active(1) == []
+
+
+def test_cooldown_delays_the_next_start():
+    engine, collector = _engine(Gesture("fist", [below("extended_count", 0.5)], cooldown=0.5))
+    fist, open_hand = _features(extended_count=0), _features(extended_count=5)
+    engine.update(fist, [1], [_LEFT], 0)
+    engine.update(open_hand, [1], [_LEFT], 100 * _MS)
+    engine.update(fist, [1], [_LEFT], 200 * _MS)
+    assert engine.active(1) == []
+    engine.update(fist, [1], [_LEFT], 600 * _MS)
+    assert engine.active(1) == ["fist"]
+    assert [phase for _, phase, _ in collector.phases()] == [
+        GesturePhase.Start,
+        GesturePhase.End,
+        GesturePhase.Start,
+    ]
+
+
+def test_lost_hand_ends_its_gestures():
+    engine, collector = _engine(Gesture("fist", [below("extended_count", 0.5)]))
+    engine.update(_features(extended_count=0), [1], [_LEFT], 0)
+    engine.update(np.zeros((0, NUM_FEATURES), dtype=np.float32), [], [], 10 * _MS)
+    end = collector.events[-1]
+    assert (end.phase, end.hand_id, end.features) == (GesturePhase.End, 1, None)
+    assert engine.active(1) == []
+
+
+def test_hands_have_separate_state_and_hand_types_are_filtered():
+    engine, collector = _engine(
+        Gesture("right fist", [below("extended_count", 0.5)], hand_type=HandType.Right)
+    )
+    features = np.concatenate([_features(extended_count=0)] * 2)
+    engine.update(features, [1, 2], [_LEFT, _RIGHT], 0)
+    assert engine.active(1) == []
+    assert engine.active(2) == ["right fist"]
+    assert [event.hand_id for event in collector.events] == [2]
+
+
+def test_reused_hand_id_resets_its_gestures():
+    engine, collector = _engine(
+        Gesture("fist", [below("extended_count", 0.5)], min_duration=0.05, cooldown=1.0)
+    )
+    fist = _features(extended_count=0)
+    engine.update(fist, [1], [_LEFT], 0, [0])
+    engine.update(fist, [1], [_LEFT], 50 * _MS, [50 * _MS])
+    assert engine.active(1) == ["fist"]
+
+    # The visible time went backwards, so this is a new hand with the same id
+    engine.update(fist, [1], [_LEFT], 60 * _MS, [5 * _MS])
+    end = collector.events[-1]
+    assert (end.phase, end.hand_id, end.features) == (GesturePhase.End, 1, None)
+    assert engine.active(1) == []
+    # The new hand has its own state, without the old hand's cooldown
+    engine.update(fist, [1], [_LEFT], 110 * _MS, [55 * _MS])
+    assert engine.active(1) == ["fist"]
+    assert collector.phases()[-1] == ("fist", GesturePhase.Start, 110 * _MS)
+
+
+def test_hand_changing_type_resets_its_gestures():
+    engine, collector = _engine(Gesture("fist", [below("extended_count", 0.5)]))
+    engine.update(_features(extended_count=0), [1], [_LEFT], 0)
+    engine.update(_features(extended_count=0), [1], [_RIGHT], 10 * _MS)
+    # As for a lost hand, the gesture on the left hand ends after the right hand's update
+    assert [(event.phase, event.hand_type) for event in collector.events] == [
+        (GesturePhase.Start, HandType.Left),
+        (GesturePhase.Start, HandType.Right),
+        (GesturePhase.End, HandType.Left),
+    ]
+    assert engine.active(1) == ["fist"]
+
+
+def test_many_gestures_are_evaluated_together():
+    engine, collector = _engine(
+        Gesture("grab", [above("grab_strength", 0.5)]),
+        Gesture("pinch", [above("pinch_strength", 0.5)]),
+        Gesture("both", [above("grab_strength", 0.5), above("pinch_strength", 0.5)]),
+    )
+    engine.update(_features(grab_strength=1.0), [1], [_LEFT], 0)
+    assert engine.active(1) == ["grab"]
+    engine.update(_features(grab_strength=1.0, pinch_strength=1.0), [1], [_LEFT], 10 * _MS)
+    assert engine.active(1) == ["grab", "pinch", "both"]
+
+
+def test_adding_and_removing_gestures():
+    engine, collector = _engine(Gesture("grab", [above("grab_strength", 0.5)]))
+    engine.update(_features(grab_strength=1.0), [1], [_LEFT], 0)
+    engine.add_gesture(Gesture("pinch", [above("pinch_strength", 0.5)]))
+    # Gestures in progress are reset
+    assert engine.active(1) == []
+    with pytest.raises(ValueError):
+        engine.add_gesture(Gesture("pinch", [above("pinch_strength", 0.1)]))
+    engine.remove_gesture("grab")
+    assert [gesture.name for gesture in engine.gestures] == ["pinch"]
+    engine.remove_gesture("pinch")
+    engine.update(_features(grab_strength=1.0), [1], [_LEFT], 10 * _MS)
+    assert len(collector.events) == 1
+
+
+def test_tracking_events_update_the_gestures(tracking_event):
+    engine, collector = _engine(Gesture("any", [above("grab_strength", -math.inf)]))
+    event = tracking_event(num_hands=2, timestamp=5)
+    engine.on_tracking_event(event)
+    assert sorted(e.hand_id for e in collector.events) == sorted(h.id for h in event.hands)
+    assert {e.timestamp for e in collector.events} == {5}
+
+
+def test_invalid_conditions_and_gestures():
+    with pytest.raises(ValueError):
+        Condition("not_a_feature")
+    with pytest.raises(ValueError):
+        below("pinch_strength", 0.5, hysteresis=-1)
+    with pytest.raises(ValueError):
+        Gesture("empty", [])
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from leap.history import History
+
+
+def _history(samples, capacity=4):
+    history = History(capacity, {"position": (3,), "speed": ()})
+    for timestamp, value in samples:
+        history.push(timestamp, [value, 2 * value, 0], value)
+    return history
+
+
+def test_empty_history():
+    history = _history([])
+    assert len(history) == 0
+    assert history.fields == ("position", "speed")
+    assert history.timestamps().tolist() == []
+    assert history.values("speed").shape == (0,)
+    for statistic in (
+        lambda: history.latest("speed"),
+        lambda: history.timestamp,
+        lambda: history.ema("speed", 0.5),
+        lambda: history.mean("speed"),
+        lambda: history.min("position"),
+        lambda: history.max("position", 2),
+    ):
+        with pytest.raises(ValueError, match="empty"):
+            statistic()
+    assert history.velocity("position").tolist() == [0, 0, 0]
+
+
+def test_windows_hold_at_least_one_sample():
+    history = _history([(0, 1.0), (1, 2.0), (2, 3.0)])
+    for count in (0, -1):
+        assert history.mean("speed", count) == 3.0
+        assert history.min("speed", count) == 3.0
+        assert history.max("speed", count) == 3.0
+        assert history.ema("speed", 0.5, count) == 3.0
+
+
+def test_samples_are_ordered_oldest_first():
+    history = _history([(i * 1000, i) for i in range(6)])
+    assert len(history) == history.capacity == 4
+    assert history.timestamps().tolist() == [2000, 3000, 4000, 5000]
+    assert history.values("speed").tolist() == [2, 3, 4, 5]
+    assert history.values("speed", 2).tolist() == [4, 5]
+    assert history.values("position", 1).tolist() == [[5, 10, 0]]
+    assert history.timestamp == 5000
+    assert history.latest("speed") == 5
+
+
+def test_windowed_statistics():
+    history = _history([(i * 1000, i) for i in range(6)])
+    assert history.mean("speed") == pytest.approx(3.5)
+    assert history.mean("speed", 2) == pytest.approx(4.5)
+    assert history.min("speed", 3) == 3
+    assert history.max("position").tolist() == [5, 10, 0]
+    assert history.mean("position", 100) == pytest.approx(np.array([3.5, 7, 0]))
+
+
+def test_ema_weights_recent_samples():
+    history = _history([(i, i) for i in range(4)])
+    weights = np.array([0.125, 0.25, 0.5, 1.0])
+    expected = (weights * np.arange(4)).sum() / weights.sum()
+    assert history.ema("speed", 0.5) == pytest.approx(expected)
+    assert history.ema("speed", 0.5, 1) == pytest.approx(3)
+    assert history.ema("speed", 1.0) == pytest.approx(3)
+
+
+def test_velocity_and_acceleration():
+    # speed = t ** 2, sampled every 0.1s
+    history = _history([(t * 100_000, (t / 10) ** 2) for t in range(5)])
+    assert history.velocity("speed") == pytest.approx((0.16 - 0.09) / 0.1)
+    assert history.acceleration("speed") == pytest.approx(2.0)
+    assert _history([(0, 1), (1, 2)]).acceleration("speed") == 0
+
+
+def test_clear_keeps_the_buffers():
+    history = _history([(i, i) for i in range(3)])
+    history.clear()
+    assert len(history) == 0
+    history.push(10, [1, 1, 1], 7)
+    assert history.values("speed").tolist() == [7]
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        History(0, {"speed": ()})
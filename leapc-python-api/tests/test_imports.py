@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import leap
+
+_SRC = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+
+
+def _run(code):
+    env = dict(os.environ, LEAPSDK_SIMULATOR="1", PYTHONPATH=_SRC)
+    return subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+def test_import_leap_does_not_import_submodules():
+    loaded = _run(
+        "import sys, leap; "
+        "print(*sorted(m for m in sys.modules if m.startswith('leap.') and m != 'leap.simulator'))"
+    )
+    assert loaded == []
+
+
+def test_names_import_their_submodule_on_first_use():
+    loaded = _run(
+        "import sys, leap; leap.Connection; leap.math; "
+        "print('leap.connection' in sys.modules, 'leap.math' in sys.modules, "
+        "'leap.gestures' in sys.modules)"
+    )
+    assert loaded == ["True", "True", "False"]
+
+
+def test_lazy_names():
+    from leap.connection import Connection
+
+    assert leap.Connection is Connection
+    assert "Connection" in dir(leap)
+    with pytest.raises(AttributeError):
+        leap.not_a_name
+
+
+def test_star_import_exports_the_public_names():
+    exported = _run(
+        "from leap import *; print(*sorted(k for k in dir() if not k.startswith('_')))"
+    )
+    # The names `import *` gave before the package's imports were made lazy
+    assert set(exported) >= {
+        "Connection",
+        "EventType",
+        "HandType",
+        "LeapError",
+        "Listener",
+        "Recorder",
+        "Recording",
+        "TrackingMode",
+        "ffi",
+        "get_extrinsic_matrix",
+        "get_frame_size",
+        "get_now",
+        "get_server_status",
+        "interpolate_frame",
+        "libleapc",
+    }
+    assert set(exported) == set(leap.__all__)
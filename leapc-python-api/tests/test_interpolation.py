@@ -0,0 +1,109 @@
+import gc
+import threading
+import weakref
+
+import pytest
+
+import leap
+
+# Times at which the simulator, which has not been opened, shows both hands in different
+# positions
+_T = 1_000_000
+_LATER = 1_400_000
+
+
+def _palm_x(event):
+    return event.hands[0].palm.position.x
+
+
+def test_predict_returns_the_simulated_hands(simulator):
+    simulator.num_hands = 2
+    interpolator = leap.Connection().interpolator()
+    event = interpolator.predict(_T)
+    assert len(event.hands) == 2
+    assert event.framerate == simulator.framerate
+
+
+def test_predicted_copies_are_independent(simulator):
+    interpolator = leap.Connection().interpolator()
+    first = interpolator.predict(_T)
+    x = _palm_x(first)
+    second = interpolator.predict(_LATER)
+    assert _palm_x(second) != pytest.approx(x)
+    assert _palm_x(first) == pytest.approx(x)
+    assert first.timestamp == _T
+    # The copied struct points at the event's own hands, not into the interpolator's buffer
+    assert first._data.pHands == first._hands
+
+
+def test_views_are_overwritten_by_the_next_prediction(simulator):
+    interpolator = leap.Connection().interpolator()
+    view = interpolator.predict(_T, copy=False)
+    x = _palm_x(view)
+    interpolator.predict(_LATER, copy=False)
+    assert _palm_x(view) != pytest.approx(x)
+
+
+def test_views_keep_the_buffer_alive_when_it_grows(simulator):
+    simulator.num_hands = 1
+    interpolator = leap.Connection().interpolator()
+    view = interpolator.predict(_T, copy=False)
+    hand = view.hands[0]
+    x, buffer = hand.palm.position.x, weakref.ref(interpolator._buffer)
+
+    simulator.num_hands = 2
+    grown = interpolator.predict(_T, copy=False)
+    assert interpolator._buffer is not buffer()
+    assert len(grown.hands) == 2
+
+    del view
+    gc.collect()
+    assert buffer() is not None
+    assert hand.palm.position.x == x
+    del hand
+    gc.collect()
+    assert buffer() is None
+
+
+def test_predict_without_hands(simulator):
+    simulator.num_hands = 0
+    interpolator = leap.Connection().interpolator()
+    assert interpolator.predict(_T, copy=False).hands == []
+    assert interpolator.predict(_T).hands == []
+
+
+def test_latency_is_measured_from_the_poll_time(tracking_event):
+    interpolator = leap.interpolation.Interpolator(leap.Connection())
+    event = tracking_event(timestamp=1_000)
+    event._poll_time = 6_000
+    interpolator.on_tracking_event(event)
+    assert interpolator.estimated_latency == pytest.approx(0.005)
+    assert interpolator.latency_offset == pytest.approx(0.005)
+
+
+def test_latency_offset_overrides_the_estimate(tracking_event):
+    interpolator = leap.interpolation.Interpolator(leap.Connection(), latency_offset=0.02)
+    assert interpolator.estimated_latency is None
+    assert interpolator.latency_offset == pytest.approx(0.02)
+
+
+class _PollTimeListener(leap.Listener):
+    def __init__(self):
+        self.poll_times = []
+        self.received = threading.Event()
+
+    def on_tracking_event(self, event):
+        self.poll_times.append(event._poll_time)
+        self.received.set()
+
+
+@pytest.mark.parametrize("dispatch_queue_size", [None, 4])
+def test_dispatched_tracking_events_are_stamped(simulator, dispatch_queue_size):
+    listener = _PollTimeListener()
+    connection = leap.Connection(listeners=[listener], dispatch_queue_size=dispatch_queue_size)
+    with connection.open():
+        assert listener.received.wait(5)
+    if dispatch_queue_size is None:
+        assert set(listener.poll_times) == {None}
+    else:
+        assert None not in listener.poll_times
@@ -0,0 +1,82 @@
+import math
+
+import numpy as np
+import pytest
+
+from leap import math as leap_math
+from leap.arrays import joint_positions
+
+
+def _quaternion(axis, angle):
+    axis = np.asarray(axis, dtype=np.float64) / np.linalg.norm(axis)
+    return np.append(axis * math.sin(angle / 2), math.cos(angle / 2))
+
+
+def test_wrappers_are_converted(tracking_event):
+    hand = tracking_event(1.0).hands[0]
+    position = leap_math.as_array(hand.palm.position)
+    assert position.shape == (3,)
+    assert position[0] == pytest.approx(hand.palm.position.x)
+    assert leap_math.as_array(hand.palm.orientation).shape == (4,)
+    assert leap_math.as_array(hand.index.distal).shape == (2, 3)
+    assert leap_math.as_array(hand.index.bones).shape == (4, 2, 3)
+    assert leap_math.as_array([1, 2, 3]).dtype == np.float64
+
+
+def test_vector_functions_broadcast():
+    a = np.array([[3.0, 0.0, 0.0], [0.0, 4.0, 0.0]])
+    b = np.array([0.0, 0.0, 0.0])
+    assert leap_math.norm(a) == pytest.approx([3, 4])
+    assert leap_math.distance(a, b) == pytest.approx([3, 4])
+    assert leap_math.dot(a, [1, 1, 0]) == pytest.approx([3, 4])
+    assert leap_math.normalize(a) == pytest.approx(np.eye(3)[:2])
+    assert leap_math.normalize(b) == pytest.approx(b)
+
+
+def test_angle_between_is_accurate_at_the_extremes():
+    x = np.array([1.0, 0.0, 0.0])
+    assert leap_math.angle_between(x, x) == pytest.approx(0)
+    assert leap_math.angle_between(x, -x) == pytest.approx(math.pi)
+    assert leap_math.angle_between(x, [0, 1, 0]) == pytest.approx(math.pi / 2)
+    assert leap_math.angle_between(x, [1, 1e-8, 0]) == pytest.approx(1e-8, rel=1e-3)
+
+
+def test_joint_angles_of_a_straight_and_bent_chain():
+    straight = np.array([[0, 0, 0], [1, 0, 0], [2, 0, 0], [3, 0, 0]], dtype=np.float64)
+    assert leap_math.joint_angles(straight) == pytest.approx([0, 0])
+    bent = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0]], dtype=np.float64)
+    assert leap_math.joint_angles(bent) == pytest.approx([math.pi / 2])
+
+
+def test_joint_angles_of_a_frame(tracking_event):
+    angles = leap_math.joint_angles(joint_positions(tracking_event().as_numpy()))
+    assert angles.shape == (2, 5, 3)
+    assert np.all((angles >= 0) & (angles <= math.pi))
+
+
+def test_bone_directions_are_unit_vectors(tracking_event):
+    directions = leap_math.bone_directions(tracking_event(1.0).hands[0].index.bones)
+    assert leap_math.norm(directions) == pytest.approx(np.ones(4), abs=1e-6)
+    bones = np.array([[[0, 0, 0], [0, 0, 2]], [[0, 0, 0], [0, 3, 0]]], dtype=np.float64)
+    assert leap_math.angle_between_bones(bones[0], bones[1]) == pytest.approx(math.pi / 2)
+
+
+def test_rotate_matches_quaternion_multiplication():
+    q = _quaternion([0, 0, 1], math.pi / 2)
+    assert leap_math.rotate(q, [1, 0, 0]) == pytest.approx([0, 1, 0], abs=1e-12)
+    # Rotating twice by 90 degrees is the same as rotating once by 180 degrees
+    twice = leap_math.quaternion_multiply(q, q)
+    assert twice == pytest.approx(_quaternion([0, 0, 1], math.pi), abs=1e-12)
+    assert leap_math.rotate(twice, [1, 0, 0]) == pytest.approx([-1, 0, 0], abs=1e-12)
+
+
+def test_slerp():
+    q0 = _quaternion([0, 0, 1], 0)
+    q1 = _quaternion([0, 0, 1], math.pi / 2)
+    assert leap_math.slerp(q0, q1, 0) == pytest.approx(q0)
+    assert leap_math.slerp(q0, q1, 1) == pytest.approx(q1)
+    assert leap_math.slerp(q0, q1, 0.5) == pytest.approx(_quaternion([0, 0, 1], math.pi / 4))
+    # The shortest path is taken when the quaternions are in opposite hemispheres
+    assert leap_math.slerp(q0, -q1, 0.5) == pytest.approx(_quaternion([0, 0, 1], math.pi / 4))
+    # Nearly equal quaternions, and an array of parameters
+    assert leap_math.slerp(q0, q0, [0.25, 0.75]) == pytest.approx(np.stack([q0, q0]))
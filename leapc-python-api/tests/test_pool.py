@@ -0,0 +1,92 @@
+import gc
+
+import pytest
+
+from leap.pool import HandBufferPool
+
+
+def _palm_x(event):
+    return event.hands[0].palm.position.x
+
+
+def test_buffers_are_reused(tracking_event):
+    pool = HandBufferPool(2)
+    for t in range(5):
+        event = tracking_event(t, hand_pool=pool)
+        del event
+    assert pool.available == 2
+    assert pool.fallback_allocations == 0
+
+
+def test_exhausted_pool_allocates(tracking_event):
+    pool = HandBufferPool(1)
+    events = [tracking_event(hand_pool=pool) for _ in range(3)]
+    assert pool.available == 0
+    assert pool.fallback_allocations == 2
+    del events
+    assert pool.available == 1
+
+
+def test_hand_keeps_buffer_after_event_is_collected(tracking_event):
+    pool = HandBufferPool(1)
+    event = tracking_event(0.0, hand_pool=pool)
+    hand = event.hands[0]
+    position = hand.palm.position
+    expected = position.x
+    del event
+    gc.collect()
+    assert pool.available == 0
+
+    later = tracking_event(1.0, hand_pool=pool)
+    assert pool.fallback_allocations == 1
+    assert _palm_x(later) != expected
+    assert hand.palm.position.x == expected
+    assert position.x == expected
+
+    del hand, position
+    assert pool.available == 1
+
+
+def test_array_keeps_buffer_after_event_is_collected(tracking_event):
+    pool = HandBufferPool(1)
+    event = tracking_event(0.0, hand_pool=pool)
+    hands = event.as_numpy()
+    expected = hands["palm"]["position"]["v"].copy()
+    del event
+    gc.collect()
+
+    tracking_event(1.0, hand_pool=pool)
+    assert (hands["palm"]["position"]["v"] == expected).all()
+    del hands
+    assert pool.available == 1
+
+
+def test_release_keeps_handed_out_hands_valid(tracking_event):
+    pool = HandBufferPool(1)
+    event = tracking_event(0.0, hand_pool=pool)
+    hand = event.hands[0]
+    expected = hand.palm.position.x
+
+    event.release()
+    assert len(event.hands) == 0
+    assert len(event.as_numpy()) == 0
+    assert pool.available == 0
+
+    later = tracking_event(1.0, hand_pool=pool)
+    assert pool.fallback_allocations == 1
+    assert hand.palm.position.x == expected
+    del later, hand
+    assert pool.available == 1
+
+
+def test_release_returns_an_unused_buffer_immediately(tracking_event):
+    pool = HandBufferPool(1)
+    event = tracking_event(hand_pool=pool)
+    event.release()
+    event.release()
+    assert pool.available == 1
+
+
+def test_invalid_size_is_rejected():
+    with pytest.raises(ValueError):
+        HandBufferPool(0)
@@ -0,0 +1,74 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from leap.exceptions import LeapError
+from leap.recording import Recording, process_recordings
+
+
+def _timestamps(columns):
+    # Module level, so that it can be pickled for the worker processes
+    return {"timestamp": columns["timestamp"]}
+
+
+def _write(path, tracking_event, count):
+    with Recording(path, "w") as recording:
+        for frame_id in range(count):
+            recording.write(tracking_event(frame_id=frame_id, timestamp=1000 * frame_id))
+    return path
+
+
+@pytest.fixture
+def recordings(tmp_path, tracking_event):
+    return {
+        "long": _write(str(tmp_path / "long.lct"), tracking_event, 25),
+        "short": _write(str(tmp_path / "short.lct"), tracking_event, 3),
+        "empty": _write(str(tmp_path / "empty.lct"), tracking_event, 0),
+    }
+
+
+def test_chunks_are_yielded_in_order_for_each_recording(recordings):
+    chunks = {}
+    for path, columns in process_recordings(
+        recordings.values(), _timestamps, max_workers=2, chunk_size=10
+    ):
+        chunks.setdefault(path, []).append(columns["timestamp"])
+
+    assert [len(chunk) for chunk in chunks[recordings["long"]]] == [10, 10, 5]
+    assert np.concatenate(chunks[recordings["long"]]).tolist() == list(range(0, 25000, 1000))
+    assert np.concatenate(chunks[recordings["short"]]).tolist() == [0, 1000, 2000]
+
+
+def test_empty_recording_yields_typed_empty_columns(recordings):
+    ((path, columns),) = list(process_recordings([recordings["empty"]], max_workers=1))
+    with Recording(recordings["empty"]) as recording:
+        expected = recording.read_columns()
+
+    assert path == recordings["empty"]
+    assert columns.keys() == expected.keys()
+    for name, column in columns.items():
+        assert column.dtype == expected[name].dtype
+        assert column.shape == expected[name].shape == (0,) + expected[name].shape[1:]
+
+
+def test_worker_errors_are_raised(tmp_path, recordings):
+    with pytest.raises(LeapError):
+        list(process_recordings([recordings["short"], str(tmp_path / "missing.lct")]))
+
+
+def test_stopping_early_does_not_hang(recordings):
+    results = process_recordings([recordings["long"]] * 8, max_workers=2, chunk_size=1)
+    next(results)
+    results.close()
+
+
+def _exit(columns):
+    # Kills the worker process, as a crash in LeapC would
+    os._exit(1)
+
+
+def test_dead_worker_is_raised(recordings):
+    with pytest.raises(BrokenProcessPool):
+        list(process_recordings([recordings["short"]], _exit, max_workers=1))
@@ -0,0 +1,227 @@
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from leap.dispatch import OverflowPolicy
+from leap.recording import Recorder, Recording, RecordingOrdinalIndex, _BackgroundWriter
+
+
+@pytest.fixture
+def recording_path(tmp_path, tracking_event):
+    """A recording of 20 frames, whose frame ids are even and timestamps are 1000 * id"""
+    path = str(tmp_path / "frames.lct")
+    with Recording(path, "w") as recording:
+        for frame in range(20):
+            frame_id = 2 * frame
+            recording.write(
+                tracking_event(frame / 120, frame_id=frame_id, timestamp=1000 * frame_id)
+            )
+    return path
+
+
+def test_index_is_saved_with_the_recording(recording_path):
+    index = RecordingOrdinalIndex.load(recording_path)
+    assert list(index.frame_ids) == list(range(0, 40, 2))
+    assert list(index.timestamps) == list(range(0, 40000, 2000))
+    assert index.ordinal_of_frame_id(10) == 5
+    assert index.ordinal_of_timestamp(9000) == 5
+    assert index.ordinal_of_timestamp(10**9) == 20
+    with pytest.raises(KeyError):
+        index.ordinal_of_frame_id(11)
+
+
+def test_stale_index_is_rebuilt(recording_path):
+    os.utime(recording_path, ns=(0, 0))
+    assert RecordingOrdinalIndex.load(recording_path) is None
+    with Recording(recording_path) as recording:
+        assert len(recording.index) == 20
+    assert RecordingOrdinalIndex.load(recording_path) is not None
+
+
+def test_read_frame_id_skips_forwards_and_backwards(recording_path):
+    with Recording(recording_path) as recording:
+        assert recording.read_frame_id(30).tracking_frame_id == 30
+        assert recording.read_frame_id(4).tracking_frame_id == 4
+        assert recording.read_frame().tracking_frame_id == 6
+        with pytest.raises(KeyError):
+            recording.read_frame_id(5)
+
+
+def test_skip_to_and_read_between(recording_path):
+    with Recording(recording_path) as recording:
+        recording.skip_to(7000)
+        assert recording.read_frame().timestamp == 8000
+        frames = recording.read_between(2000, 8000)
+        assert [frame.timestamp for frame in frames] == [2000, 4000, 6000]
+        assert recording.read_between(8000, 2000) == []
+
+
+def test_read_between_stops_at_the_end(recording_path):
+    with Recording(recording_path) as recording:
+        frames = recording.read_between(34000, 10**9)
+        assert [frame.timestamp for frame in frames] == [34000, 36000, 38000]
+
+        # An index which lists more frames than the recording has
+        index = recording.index
+        index.append(40, 40000)
+        frames = recording.read_between(36000, 10**9)
+        assert [frame.timestamp for frame in frames] == [36000, 38000]
+
+
+def test_cannot_skip_while_writing(tmp_path):
+    with Recording(str(tmp_path / "empty.lct"), "w") as recording:
+        with pytest.raises(RuntimeError):
+            recording.skip_to(0)
+
+
+def _read_frame_ids(path):
+    with Recording(path) as recording:
+        return [frame.tracking_frame_id for frame in recording]
+
+
+def _slow_writes(monkeypatch, recording, delay):
+    write_data = recording._write_data
+
+    def slow_write_data(data):
+        time.sleep(delay)
+        return write_data(data)
+
+    monkeypatch.setattr(recording, "_write_data", slow_write_data)
+
+
+def test_background_recorder_writes_every_frame(tmp_path, tracking_event):
+    path = str(tmp_path / "background.lct")
+    with Recording(path, "w") as recording:
+        with Recorder(recording, background=True, flush_interval=0.01) as recorder:
+            for frame_id in range(50):
+                recorder.on_tracking_event(tracking_event(frame_id=frame_id))
+            assert recorder.flush(5)
+        assert recorder.frames_written == 50
+        assert recorder.dropped_frames == 0
+    assert _read_frame_ids(path) == list(range(50))
+
+
+def test_closing_the_recording_stops_its_writers(tmp_path, tracking_event, monkeypatch):
+    path = str(tmp_path / "unclosed.lct")
+    with Recording(path, "w") as recording:
+        _slow_writes(monkeypatch, recording, 0.005)
+        recorder = Recorder(recording, background=True, flush_interval=10)
+        for frame_id in range(10):
+            recorder.on_tracking_event(tracking_event(frame_id=frame_id))
+        thread = recorder._writer._thread
+    # The Recorder was never closed, but no frame is lost and the writer has stopped
+    assert not thread.is_alive()
+    assert recording._writers == []
+    assert _read_frame_ids(path) == list(range(10))
+
+
+def test_background_recorder_copies_the_frame_when_queued(tmp_path, tracking_event):
+    path = str(tmp_path / "copied.lct")
+    with Recording(path, "w") as recording:
+        with Recorder(recording, background=True, flush_interval=10) as recorder:
+            event = tracking_event(frame_id=1, timestamp=1000)
+            recorder.on_tracking_event(event)
+            # Reuse the event's struct, as LeapC reuses its message buffer
+            event.c_data.info.frame_id = event.c_data.tracking_frame_id = 2
+    with Recording(path) as recording:
+        (frame,) = recording.read()
+    assert frame.info.frame_id == 1
+    assert frame.tracking_frame_id == 1
+    assert frame.timestamp == 1000
+    assert len(frame.hands) == 2
+
+
+def test_drop_newest_discards_frames_when_full(tmp_path, tracking_event, monkeypatch):
+    with Recording(str(tmp_path / "dropped.lct"), "w") as recording:
+        _slow_writes(monkeypatch, recording, 0.02)
+        recorder = Recorder(recording, background=True, queue_size=2, flush_interval=10)
+        for frame_id in range(10):
+            recorder.on_tracking_event(tracking_event(frame_id=frame_id))
+        recorder.close()
+    assert recorder.dropped_frames > 0
+    assert recorder.frames_written + recorder.dropped_frames == 10
+    assert recorder.max_queue_depth <= 2
+
+
+def test_block_waits_for_the_writer(tmp_path, tracking_event, monkeypatch):
+    path = str(tmp_path / "blocked.lct")
+    with Recording(path, "w") as recording:
+        _slow_writes(monkeypatch, recording, 0.005)
+        recorder = Recorder(
+            recording,
+            background=True,
+            queue_size=2,
+            flush_interval=10,
+            overflow_policy=OverflowPolicy.Block,
+        )
+        for frame_id in range(10):
+            recorder.on_tracking_event(tracking_event(frame_id=frame_id))
+        recorder.close()
+    assert recorder.dropped_frames == 0
+    assert recorder.max_queue_depth <= 2
+    assert _read_frame_ids(path) == list(range(10))
+
+
+def test_block_put_after_stop_raises(tmp_path, tracking_event):
+    with Recording(str(tmp_path / "stopped.lct"), "w") as recording:
+        writer = _BackgroundWriter(
+            recording, max_size=1, flush_interval=10, overflow_policy=OverflowPolicy.Block
+        )
+        writer.stop()
+        event = tracking_event()
+        with pytest.raises(RuntimeError):
+            writer.put((event.c_data, event))
+        assert writer.queue_depth == 0
+
+
+def test_coalescing_is_rejected(tmp_path):
+    with Recording(str(tmp_path / "coalesce.lct"), "w") as recording:
+        with pytest.raises(ValueError):
+            Recorder(recording, background=True, overflow_policy=OverflowPolicy.CoalesceTracking)
+
+
+def test_columns_are_read_in_chunks(tmp_path, tracking_event):
+    path = str(tmp_path / "chunks.lct")
+    with Recording(path, "w") as recording:
+        for frame_id in range(25):
+            recording.write(tracking_event(frame_id=frame_id, num_hands=frame_id % 3))
+    with Recording(path) as recording:
+        chunks = list(recording.iter_columns(chunk_size=10))
+    assert [len(chunk["frame_id"]) for chunk in chunks] == [10, 10, 5]
+    frame_ids = [frame_id for chunk in chunks for frame_id in chunk["frame_id"]]
+    assert frame_ids == list(range(25))
+    num_hands = [n for chunk in chunks for n in chunk["num_hands"]]
+    assert num_hands == [frame_id % 3 for frame_id in range(25)]
+    # Rows with fewer hands are cleared of the hands read into them by the previous chunk
+    for chunk in chunks:
+        assert (chunk["hand_id"][chunk["num_hands"] == 0] == 0).all()
+
+
+def test_columns_of_an_empty_recording(tmp_path):
+    path = str(tmp_path / "empty.lct")
+    with Recording(path, "w"):
+        pass
+    with Recording(path) as recording:
+        assert list(recording.iter_columns()) == []
+    with Recording(path) as recording:
+        columns = recording.read_columns()
+    assert len(columns["frame_id"]) == 0
+    assert columns["joints"].shape == (0, 2, 5, 5, 3)
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_short_recordings_do_not_allocate_a_full_chunk(recording_path, indexed):
+    with Recording(recording_path) as recording:
+        if indexed:
+            recording.index
+        tracemalloc.start()
+        try:
+            columns = recording.read_columns()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    assert len(columns["frame_id"]) == 20
+    # A full chunk of 65536 frames would need well over 100 MB
+    assert peak < 10_000_000
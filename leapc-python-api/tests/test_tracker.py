@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from leap.enums import HandType
+from leap.tracker import HandTracker, HandTrackerListener
+
+
+class _Collector(HandTrackerListener):
+    def __init__(self):
+        self.appeared = []
+        self.lost = []
+
+    def on_hand_appeared(self, hand):
+        self.appeared.append(hand)
+
+    def on_hand_lost(self, hand):
+        self.lost.append(hand)
+
+
+@pytest.fixture
+def frame(tracking_event):
+    """Make a frame with the given (id, type, visible_time) hands"""
+
+    def make(timestamp, *hands):
+        event = tracking_event(timestamp / 1e6, num_hands=len(hands), timestamp=timestamp)
+        array = event.as_numpy()
+        for row, (hand_id, hand_type, visible_time) in enumerate(hands):
+            array[row]["id"] = hand_id
+            array[row]["type"] = hand_type.value
+            array[row]["visible_time"] = visible_time
+        return event
+
+    return make
+
+
+def _tracker(capacity=4):
+    tracker = HandTracker(capacity)
+    collector = _Collector()
+    tracker.add_listener(collector)
+    return tracker, collector
+
+
+def test_hands_are_followed_across_frames(frame):
+    tracker, collector = _tracker()
+    tracker.update(frame(1000, (1, HandType.Left, 0), (2, HandType.Right, 0)))
+    left = tracker.get(1)
+    # The order of the hands in a frame does not matter
+    tracker.update(frame(2000, (2, HandType.Right, 1000), (1, HandType.Left, 1000)))
+    assert tracker.get(1) is left
+    assert len(left) == 2
+    assert left.timestamps().tolist() == [1000, 2000]
+    assert [hand.id for hand in collector.appeared] == [1, 2]
+    assert collector.lost == []
+
+
+def test_history_matches_the_frames(frame):
+    tracker, _ = _tracker()
+    events = [frame(t * 1000, (1, HandType.Left, t * 1000)) for t in range(3)]
+    for event in events:
+        tracker.update(event)
+    hand = tracker.get(1)
+    expected = [list(event.hands[0].palm.position) for event in events]
+    assert hand.palm_positions() == pytest.approx(np.array(expected))
+    assert hand.palm_positions(1) == pytest.approx(np.array(expected[-1:]))
+    assert hand.palm_position == pytest.approx(np.array(expected[-1]))
+    assert hand.fingertips().shape == (3, 5, 3)
+    assert hand.palm_velocities().shape == (3, 3)
+    assert hand.timestamp == 2000
+
+
+def test_history_keeps_the_most_recent_frames(frame):
+    tracker, _ = _tracker(capacity=2)
+    for t in range(5):
+        tracker.update(frame(t, (1, HandType.Left, t)))
+    hand = tracker.get(1)
+    assert hand.capacity == 2
+    assert hand.timestamps().tolist() == [3, 4]
+
+
+def test_missing_hands_are_lost(frame):
+    tracker, collector = _tracker()
+    tracker.update(frame(1000, (1, HandType.Left, 0), (2, HandType.Right, 0)))
+    tracker.update(frame(2000, (2, HandType.Right, 1000)))
+    assert [hand.id for hand in collector.lost] == [1]
+    assert tracker.get(1) is None
+    assert [hand.id for hand in tracker.hands] == [2]
+
+
+def test_reused_ids_are_new_hands(frame):
+    tracker, collector = _tracker()
+    tracker.update(frame(1000, (1, HandType.Left, 5000)))
+    first = tracker.get(1)
+    # The visible time went backwards, so the service reused the id for a new hand
+    tracker.update(frame(2000, (1, HandType.Left, 100)))
+    assert collector.lost == [first]
+    assert tracker.get(1) is not first
+    assert tracker.get(1).appeared_at == 1900
+    # A different type with the same id is also a different hand
+    tracker.update(frame(3000, (1, HandType.Right, 2000)))
+    assert tracker.get(1).type == HandType.Right
+    assert len(collector.appeared) == 3
+
+
+def test_hand_of_type_prefers_the_longest_visible(frame):
+    tracker, _ = _tracker()
+    tracker.update(frame(10_000, (1, HandType.Left, 100), (2, HandType.Left, 9000)))
+    assert tracker.hand_of_type(HandType.Left).id == 2
+    assert tracker.hand_of_type(HandType.Right) is None
+
+
+def test_tracker_as_a_listener(tracking_event):
+    tracker = HandTracker()
+    tracker.on_tracking_event(tracking_event(num_hands=2))
+    assert len(tracker.hands) == 2
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        HandTracker(0)